@@ -0,0 +1,50 @@
+""" Runs the benchmarks and compares them with a baseline::
+
+    python -m benchmarks --scale medium --output results.json --baseline benchmarks/baseline_medium.json
+
+The exit status is 1 if any benchmark is slower than the baseline by more than the tolerance. """
+import argparse
+import sys
+
+from benchmarks import harness
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='jMetalPy benchmarks')
+    parser.add_argument('--scale', choices=harness.SCALES, default='small', help='size of the inputs')
+    parser.add_argument('--repeat', type=int, default=5, help='timed repetitions of each benchmark')
+    parser.add_argument('--seed', type=int, default=1, help='seed of the random inputs')
+    parser.add_argument('--filter', default=None, help='regular expression selecting the benchmarks by name')
+    parser.add_argument('--output', default=None, help='JSON file where the results are written')
+    parser.add_argument('--baseline', default=None, help='JSON results of a previous run to compare with')
+    parser.add_argument('--save-baseline', action='store_true', help='write the results to the baseline file')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed slowdown with respect to the baseline, as a fraction (default 0.2)')
+    args = parser.parse_args(args)
+
+    benchmarks = harness.select(args.filter)
+    if not benchmarks:
+        parser.error('no benchmark matches ' + args.filter)
+
+    results = harness.run(benchmarks, args.scale, args.repeat, args.seed,
+                          progress=lambda name, result: print('{:<40} {:10.6f} s'.format(name, result['min'])))
+    if args.output:
+        harness.save(results, args.output)
+
+    if args.baseline and args.save_baseline:
+        harness.save(results, args.baseline)
+    elif args.baseline:
+        baseline = harness.load(args.baseline)
+        if baseline['meta']['scale'] != args.scale:
+            parser.error('the baseline was taken at the ' + baseline['meta']['scale'] + ' scale')
+        rows = harness.compare(results, baseline, args.tolerance)
+        print()
+        print(harness.format_comparison(rows))
+        if any(row['status'] == 'regression' for row in rows):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+import random
+from typing import List
+
+from benchmarks.harness import benchmark
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII
+from jmetal.algorithm.multiobjective.smpso import SMPSO
+from jmetal.component.archive import NonDominatedSolutionListArchive, CrowdingDistanceArchive
+from jmetal.component.density_estimator import CrowdingDistance
+from jmetal.core.solution import FloatSolution
+from jmetal.operator.crossover import SBX
+from jmetal.operator.mutation import Polynomial
+from jmetal.operator.selection import BinaryTournamentSelection
+from jmetal.problem.multiobjective.dtlz import DTLZ1
+from jmetal.problem.multiobjective.zdt import ZDT1
+from jmetal.util.observable import DefaultObservable
+from jmetal.util.ranking import FastNonDominatedRanking
+
+GENERATIONS = 5  # Generations timed by the algorithm benchmarks
+
+
+def random_solutions(number_of_solutions: int, number_of_objectives: int = 2,
+                     number_of_variables: int = 30) -> List[FloatSolution]:
+    """ Solutions with uniform random variables and objectives in [0, 1] """
+    solutions = []
+    for _ in range(number_of_solutions):
+        solution = FloatSolution(number_of_variables, number_of_objectives, 0, [0.0] * number_of_variables,
+                                 [1.0] * number_of_variables)
+        solution.variables = [random.random() for _ in range(number_of_variables)]
+        solution.objectives = [random.random() for _ in range(number_of_objectives)]
+        solutions.append(solution)
+
+    return solutions
+
+
+def front_solutions(number_of_solutions: int) -> List[FloatSolution]:
+    """ Random bi-objective solutions, about half of them on a linear non-dominated front """
+    solutions = random_solutions(number_of_solutions)
+    for solution in solutions[::2]:
+        solution.objectives[1] = 1.0 - solution.objectives[0]
+
+    return solutions
+
+
+@benchmark('ranking.fast_non_dominated', small=200, medium=1000, large=4000)
+def fast_non_dominated_ranking(size):
+    solutions = random_solutions(size)
+    return lambda: FastNonDominatedRanking().compute_ranking(solutions)
+
+
+@benchmark('density.crowding_distance', small=1000, medium=10000, large=100000)
+def crowding_distance(size):
+    solutions = random_solutions(size)
+    return lambda: CrowdingDistance().compute_density_estimator(solutions)
+
+
+@benchmark('archive.non_dominated_add', small=500, medium=2000, large=8000)
+def non_dominated_archive_add(size):
+    solutions = front_solutions(size)
+
+    def add():
+        archive = NonDominatedSolutionListArchive()
+        for solution in solutions:
+            archive.add(solution)
+
+    return add
+
+
+@benchmark('operator.sbx', small=1000, medium=10000, large=50000)
+def sbx(size):
+    solutions = random_solutions(2 * size)
+    crossover = SBX(1.0, distribution_index=20)
+
+    def execute():
+        for i in range(0, len(solutions), 2):
+            crossover.execute([solutions[i], solutions[i + 1]])
+
+    return execute
+
+
+@benchmark('operator.polynomial', small=1000, medium=10000, large=50000)
+def polynomial(size):
+    solutions = random_solutions(size)
+    mutation = Polynomial(1.0 / 30, distribution_index=20)
+
+    def execute():
+        for solution in solutions:
+            mutation.execute(solution)
+
+    return execute
+
+
+@benchmark('selection.binary_tournament', small=10000, medium=100000, large=500000)
+def binary_tournament(size):
+    solutions = random_solutions(100)
+    selection = BinaryTournamentSelection()
+
+    def execute():
+        for _ in range(size):
+            selection.execute(solutions)
+
+    return execute
+
+
+def nsgaii_generations(problem, population_size: int):
+    """ Returns the function running GENERATIONS generations of NSGA-II, after creating the initial population """
+    algorithm = NSGAII[FloatSolution, List[FloatSolution]](
+        problem=problem, population_size=population_size, max_evaluations=population_size * (GENERATIONS + 1),
+        mutation=Polynomial(1.0 / problem.number_of_variables, distribution_index=20),
+        crossover=SBX(1.0, distribution_index=20), selection=BinaryTournamentSelection(),
+        observable=DefaultObservable())
+    algorithm.population = algorithm.evaluate_population(algorithm.create_initial_population())
+    algorithm.init_progress()
+
+    return algorithm.iterate
+
+
+@benchmark('nsgaii.zdt1_generations', small=50, medium=200, large=800)
+def nsgaii_zdt1(size):
+    return nsgaii_generations(ZDT1(30), size)
+
+
+@benchmark('nsgaii.dtlz1_generations', small=50, medium=200, large=800)
+def nsgaii_dtlz1(size):
+    return nsgaii_generations(DTLZ1(7, 3), size)
+
+
+@benchmark('smpso.zdt1_generations', small=50, medium=200, large=800)
+def smpso_zdt1(size):
+    problem = ZDT1(30)
+    algorithm = SMPSO(problem=problem, swarm_size=size, max_evaluations=size * (GENERATIONS + 1),
+                      mutation=Polynomial(1.0 / problem.number_of_variables, distribution_index=20),
+                      leaders=CrowdingDistanceArchive[FloatSolution](size), observable=DefaultObservable())
+    algorithm.swarm = algorithm.evaluate_swarm(algorithm.create_initial_swarm())
+    algorithm.initialize_velocity(algorithm.swarm)
+    algorithm.initialize_particle_best(algorithm.swarm)
+    algorithm.initialize_global_best(algorithm.swarm)
+    algorithm.init_progress()
+
+    return algorithm.iterate
@@ -0,0 +1,52 @@
+import random
+from typing import List, Tuple
+
+from benchmarks.harness import benchmark
+from jmetal.algorithm.multiobjective.minmin import MINMIN
+from jmetal.problem.multiobjective.constrained import Schedule
+from jmetal.util.machine import Machine
+from jmetal.util.sched_utils import maxmin_core, bmta, lmita, redTasks
+from jmetal.util.task import Task
+
+OBJECTIVES = [{'name': 'makespan', 'weight': 1.0}]
+
+
+def random_workload(number_of_tasks: int, number_of_machines: int) -> Tuple[List[Machine], List[Task]]:
+    """ Machines with uniform random speeds in [1, 10] and tasks with uniform random lengths in [1, 100] """
+    machines = [Machine(1, i, random.uniform(1.0, 10.0)) for i in range(number_of_machines)]
+    tasks = [Task(1, i, random.uniform(1.0, 100.0)) for i in range(number_of_tasks)]
+
+    return machines, tasks
+
+
+@benchmark('scheduling.maxmin_core', small=(200, 8), medium=(1000, 32), large=(4000, 64))
+def maxmin(size):
+    machines, tasks = random_workload(*size)
+    return lambda: maxmin_core(machines, tasks)
+
+
+@benchmark('scheduling.minmin_run', small=(200, 8), medium=(1000, 32), large=(4000, 64))
+def minmin(size):
+    machines, tasks = random_workload(*size)
+    algorithm = MINMIN(Schedule(OBJECTIVES, machines, tasks))
+    return algorithm.run
+
+
+@benchmark('scheduling.minmin_indexed_run', small=(200, 8), medium=(1000, 32), large=(4000, 64))
+def minmin_indexed(size):
+    machines, tasks = random_workload(*size)
+    algorithm = MINMIN(Schedule(OBJECTIVES, machines, tasks), indexed=True)
+    return algorithm.run
+
+
+@benchmark('scheduling.bmta_lmita', small=(2000, 8), medium=(20000, 32), large=(100000, 64))
+def bmta_lmita(size):
+    machines, tasks = random_workload(*size)
+    return lambda: lmita(machines, bmta(machines, tasks))
+
+
+@benchmark('scheduling.red_tasks', small=(2000, 8), medium=(20000, 32), large=(100000, 64))
+def red_tasks(size):
+    machines, tasks = random_workload(*size)
+    lmita(machines, bmta(machines, tasks))
+    return lambda: redTasks(machines, tasks)
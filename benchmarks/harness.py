@@ -0,0 +1,142 @@
+import gc
+import json
+import platform
+import random
+import re
+import time
+from collections import OrderedDict
+from typing import Callable, List
+
+import numpy
+
+SCALES = ['small', 'medium', 'large']
+
+BENCHMARKS = OrderedDict()
+
+
+class Benchmark:
+    """ A benchmark is a factory which, given the size of the input for a scale, prepares the input (untimed) and
+    returns the function to be timed. The factory is called again before each repetition, so the timed function may
+    modify its input (e.g. assign tasks to machines). """
+
+    def __init__(self, name: str, factory: Callable[[object], Callable[[], None]], sizes: dict):
+        for scale in SCALES:
+            if scale not in sizes:
+                raise Exception("The benchmark " + name + " has no size for the scale " + scale)
+
+        self.name = name
+        self.factory = factory
+        self.sizes = sizes
+
+
+def benchmark(name: str, **sizes):
+    """ Decorator registering a benchmark factory, with the size of its input for each scale """
+
+    def register(factory):
+        if name in BENCHMARKS:
+            raise Exception("Duplicated benchmark: " + name)
+        BENCHMARKS[name] = Benchmark(name, factory, sizes)
+        return factory
+
+    return register
+
+
+def select(pattern: str = None) -> List[Benchmark]:
+    """ Returns the registered benchmarks whose name matches a regular expression (all of them by default) """
+    from benchmarks import bench_core, bench_scheduling  # Register the benchmarks
+
+    return [bench for name, bench in BENCHMARKS.items() if pattern is None or re.search(pattern, name)]
+
+
+def run_benchmark(bench: Benchmark, scale: str, repeat: int = 5, seed: int = 1) -> dict:
+    """ Times `repeat` calls of a benchmark, with the same input in each of them. The garbage collector is disabled
+    while timing, as in :mod:`timeit` """
+    size = bench.sizes[scale]
+    times = []
+    for _ in range(repeat):
+        random.seed(seed)
+        numpy.random.seed(seed)
+        function = bench.factory(size)
+
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    times.sort()
+    return {'size': list(size) if isinstance(size, tuple) else size, 'repeat': repeat, 'min': times[0], 'median': times[len(times) // 2],
+            'mean': sum(times) / len(times), 'max': times[-1]}
+
+
+def run(benchmarks: List[Benchmark], scale: str = 'small', repeat: int = 5, seed: int = 1,
+        progress: Callable[[str, dict], None] = None) -> dict:
+    """ Runs the benchmarks and returns the results, with the environment they were taken in """
+    if scale not in SCALES:
+        raise Exception("Unknown scale: " + str(scale))
+
+    results = OrderedDict()
+    for bench in benchmarks:
+        results[bench.name] = run_benchmark(bench, scale, repeat, seed)
+        if progress:
+            progress(bench.name, results[bench.name])
+
+    return {'meta': {'scale': scale, 'repeat': repeat, 'seed': seed, 'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                     'python': platform.python_version(), 'numpy': numpy.__version__,
+                     'platform': platform.platform(), 'machine': platform.machine()},
+            'results': results}
+
+
+def save(results: dict, path: str) -> None:
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.2, statistic: str = 'min') -> List[dict]:
+    """ Compares the results with a baseline. A benchmark is a regression if its time is more than `tolerance` (a
+    fraction) above the baseline time, and an improvement if it is more than `tolerance` below. Benchmarks missing in
+    the baseline, or run with a different input size, are not compared. The minimum time is compared by default, as
+    it is the least affected by other processes. """
+    rows = []
+    for name, current in results['results'].items():
+        previous = baseline['results'].get(name)
+        row = {'name': name, 'current': current[statistic], 'baseline': None, 'ratio': None}
+        if previous is None:
+            row['status'] = 'new'
+        elif previous['size'] != current['size']:
+            row['status'] = 'skipped'
+        else:
+            row['baseline'] = previous[statistic]
+            row['ratio'] = current[statistic] / previous[statistic] if previous[statistic] > 0 else float('inf')
+            if row['ratio'] > 1.0 + tolerance:
+                row['status'] = 'regression'
+            elif row['ratio'] < 1.0 - tolerance:
+                row['status'] = 'improvement'
+            else:
+                row['status'] = 'ok'
+        rows.append(row)
+
+    return rows
+
+
+def format_comparison(rows: List[dict]) -> str:
+    width = max([len(row['name']) for row in rows] + [9])
+    lines = ['{:<{w}}  {:>10}  {:>10}  {:>7}  {}'.format('benchmark', 'baseline', 'current', 'ratio', 'status',
+                                                          w=width)]
+    for row in rows:
+        baseline = '{:10.6f}'.format(row['baseline']) if row['baseline'] is not None else '{:>10}'.format('-')
+        ratio = '{:7.2f}'.format(row['ratio']) if row['ratio'] is not None else '{:>7}'.format('-')
+        lines.append('{:<{w}}  {}  {:10.6f}  {}  {}'.format(row['name'], baseline, row['current'], ratio,
+                                                            row['status'], w=width))
+
+    return '\n'.join(lines)
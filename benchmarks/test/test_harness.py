@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from benchmarks import harness
+from benchmarks.__main__ import main
+
+
+def results(**times):
+    return {'meta': {'scale': 'small'},
+            'results': {name: {'size': 10, 'min': time, 'median': time} for name, time in times.items()}}
+
+
+class CompareTestCases(unittest.TestCase):
+
+    def test_should_compare_flag_regressions_and_improvements(self):
+        rows = harness.compare(results(a=1.3, b=0.7, c=1.1), results(a=1.0, b=1.0, c=1.0), tolerance=0.2)
+
+        self.assertEqual(['regression', 'improvement', 'ok'], [row['status'] for row in rows])
+        self.assertAlmostEqual(1.3, rows[0]['ratio'])
+
+    def test_should_compare_skip_new_benchmarks_and_other_sizes(self):
+        baseline = results(b=1.0)
+        baseline['results']['b']['size'] = 20
+
+        rows = harness.compare(results(a=1.0, b=1.0), baseline)
+
+        self.assertEqual(['new', 'skipped'], [row['status'] for row in rows])
+
+
+class RunTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_should_every_benchmark_run_at_the_small_scale(self):
+        result = harness.run(harness.select(), 'small', repeat=1)
+
+        self.assertEqual([bench.name for bench in harness.select()], list(result['results']))
+        for name, times in result['results'].items():
+            self.assertGreater(times['min'], 0.0, name)
+
+    def test_should_main_save_a_baseline_and_compare_with_it(self):
+        baseline = os.path.join(self.dir, 'baseline.json')
+        output = os.path.join(self.dir, 'results.json')
+
+        self.assertEqual(0, main(['--filter', 'crowding', '--repeat', '1', '--baseline', baseline,
+                                  '--save-baseline']))
+        self.assertEqual(0, main(['--filter', 'crowding', '--repeat', '1', '--baseline', baseline,
+                                  '--output', output, '--tolerance', '1000']))
+
+        self.assertEqual(['density.crowding_distance'], list(harness.load(output)['results']))
+
+    def test_should_main_fail_on_a_regression(self):
+        baseline = os.path.join(self.dir, 'baseline.json')
+        data = results(**{'density.crowding_distance': 1e-9})
+        data['results']['density.crowding_distance']['size'] = 1000
+        harness.save(data, baseline)
+
+        self.assertEqual(1, main(['--filter', 'crowding', '--repeat', '1', '--baseline', baseline]))
+
+
+if __name__ == '__main__':
+    unittest.main()
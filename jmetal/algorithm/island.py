@@ -0,0 +1,211 @@
+import random
+from collections import deque
+from copy import copy
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection, wait
+from threading import Thread
+from typing import TypeVar, List, Callable, Tuple, Union, Generic
+
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII
+from jmetal.component.archive import Archive, NonDominatedSolutionListArchive
+from jmetal.core.algorithm import EvolutionaryAlgorithm
+from jmetal.util.observable import Observer
+
+S = TypeVar('S')
+
+_STOP = 'stop'  # Message sent by the runner once the results of all the islands have been received
+
+
+def topology_edges(topology: Union[str, List[Tuple[int, int]]], number_of_islands: int) -> List[Tuple[int, int]]:
+    """ Returns the (source, destination) island pairs of a topology, which is 'ring' (each island sends migrants to
+    the next one), 'fully_connected' (each island sends migrants to all the others) or a list of pairs """
+    if topology == 'ring':
+        edges = [(i, (i + 1) % number_of_islands) for i in range(number_of_islands)]
+    elif topology == 'fully_connected':
+        edges = [(i, j) for i in range(number_of_islands) for j in range(number_of_islands) if i != j]
+    elif isinstance(topology, str):
+        raise Exception("Unknown topology: " + topology)
+    else:
+        edges = [(int(source), int(destination)) for source, destination in topology]
+
+    for source, destination in edges:
+        if not (0 <= source < number_of_islands and 0 <= destination < number_of_islands):
+            raise Exception("Invalid edge of the topology: " + str((source, destination)))
+
+    return sorted(set(edge for edge in edges if edge[0] != edge[1]))
+
+
+class MigrationObserver(Observer):
+    """ Observer exchanging migrants between the island it runs on and its neighbours. Every `migration_interval`
+    notifications (generations), the migrants received since the last migration are merged into the population and
+    `number_of_migrants` solutions chosen with the selection operator of the algorithm are sent to each neighbour.
+
+    Each inbox is read continuously by a daemon thread into a local queue, so a neighbour sending a batch larger than
+    the pipe buffer is never blocked until this island reaches its next migration, and islands sending to each other
+    at the same time cannot deadlock. Receiving never waits for the neighbours. """
+
+    def __init__(self, algorithm: EvolutionaryAlgorithm, inbox: List[Connection], outbox: List[Connection],
+                 migration_interval: int, number_of_migrants: int):
+        self.algorithm = algorithm
+        self.inbox = inbox
+        self.outbox = outbox
+        self.migration_interval = migration_interval
+        self.number_of_migrants = number_of_migrants
+        self.generations = 0
+        self.received = 0
+
+        self.queue = deque()
+        self.readers = [Thread(target=self.__read, args=(connection,), daemon=True) for connection in inbox]
+        for reader in self.readers:
+            reader.start()
+
+    def __read(self, connection: Connection) -> None:
+        while True:
+            try:
+                self.queue.append(connection.recv())
+            except (EOFError, OSError):
+                return
+
+    def update(self, *args, **kwargs):
+        self.generations += 1
+        if self.generations % self.migration_interval != 0:
+            return
+
+        immigrants = self.receive()
+        if immigrants:
+            self.algorithm.population = self.integrate(immigrants)
+
+        for connection in self.outbox:
+            connection.send(self.emigrants())
+
+    def receive(self) -> List[S]:
+        immigrants = []
+        while self.queue:
+            immigrants.extend(self.queue.popleft())
+        self.received += len(immigrants)
+
+        return immigrants
+
+    def emigrants(self) -> List[S]:
+        emigrants = []
+        for _ in range(self.number_of_migrants):
+            solution = self.algorithm.selection_operator.execute(self.algorithm.population)
+            emigrant = copy(solution)
+            emigrant.attributes = dict(solution.attributes)
+            emigrants.append(emigrant)
+
+        return emigrants
+
+    def integrate(self, immigrants: List[S]) -> List[S]:
+        """ Returns the population after merging the immigrants into it. NSGA-II variants use their own replacement;
+        otherwise the best solutions according to the first objective are kept """
+        population = self.algorithm.population
+        if isinstance(self.algorithm, NSGAII):
+            return self.algorithm.replacement(population, immigrants)
+
+        return sorted(population + immigrants, key=lambda s: s.objectives[0])[:len(population)]
+
+
+def _run_island(algorithm_factory: Callable[[], EvolutionaryAlgorithm], seed: int, inbox: List[Connection],
+                outbox: List[Connection], control: Connection, migration_interval: int, number_of_migrants: int):
+    random.seed(seed)
+    algorithm = algorithm_factory()
+    migration = MigrationObserver(algorithm, inbox, outbox, migration_interval, number_of_migrants)
+    algorithm.observable.register(migration)
+
+    algorithm.run()
+    control.send((list(algorithm.population), algorithm.evaluations, migration.received))
+
+    # Neighbours still running may be sending migrants, so the readers keep draining the inbox until the runner stops us
+    control.recv()
+
+
+class IslandModel(Generic[S]):
+    """ Island model: runs several instances of an evolutionary algorithm in separate processes, so they do not share
+    the interpreter lock. Islands send migrants to their neighbours in the topology over pipes every
+    `migration_interval` generations, without waiting for each other. The final populations of all the islands are
+    merged into a (non-dominated, by default) archive.
+
+    The algorithm factory is called once in each island process, so it must be picklable (e.g. a module level
+    function) on platforms which do not fork. Each island seeds the `random` module with `seed` plus its index, or
+    from the operating system if no seed is given.
+    """
+
+    def __init__(self,
+                 algorithm_factory: Callable[[], EvolutionaryAlgorithm],
+                 number_of_islands: int,
+                 topology: Union[str, List[Tuple[int, int]]] = 'ring',
+                 migration_interval: int = 10,
+                 number_of_migrants: int = 1,
+                 archive_factory: Callable[[], Archive] = NonDominatedSolutionListArchive,
+                 seed: int = None):
+        if number_of_islands < 1:
+            raise Exception("The number of islands is lower than one: " + str(number_of_islands))
+        if migration_interval < 1:
+            raise Exception("The migration interval is lower than one: " + str(migration_interval))
+
+        self.algorithm_factory = algorithm_factory
+        self.number_of_islands = number_of_islands
+        self.edges = topology_edges(topology, number_of_islands)
+        self.migration_interval = migration_interval
+        self.number_of_migrants = number_of_migrants
+        self.archive_factory = archive_factory
+        self.seed = seed
+
+        self.island_results: List[List[S]] = []
+        self.evaluations = 0
+        self.migrants_received = 0
+        self.archive = None
+
+    def run(self) -> None:
+        inboxes = [[] for _ in range(self.number_of_islands)]
+        outboxes = [[] for _ in range(self.number_of_islands)]
+        for source, destination in self.edges:
+            receiver, sender = Pipe(duplex=False)
+            outboxes[source].append(sender)
+            inboxes[destination].append(receiver)
+
+        seed = self.seed if self.seed is not None else random.SystemRandom().getrandbits(32)
+        controls = []
+        processes = []
+        for i in range(self.number_of_islands):
+            control, island_control = Pipe()
+            process = Process(target=_run_island,
+                              args=(self.algorithm_factory, seed + i, inboxes[i], outboxes[i], island_control,
+                                    self.migration_interval, self.number_of_migrants))
+            process.start()
+            island_control.close()  # So the runner gets EOF if the island dies
+            controls.append(control)
+            processes.append(process)
+        for connection in [connection for connections in inboxes + outboxes for connection in connections]:
+            connection.close()
+
+        results = {}
+        try:
+            while len(results) < self.number_of_islands:
+                for control in wait([control for control in controls if id(control) not in results]):
+                    try:
+                        results[id(control)] = control.recv()
+                    except EOFError:
+                        raise Exception("Island " + str(controls.index(control)) + " has failed")
+        finally:
+            for control in controls:
+                try:
+                    control.send(_STOP)
+                except (BrokenPipeError, OSError):
+                    pass
+            for process in processes:
+                process.join()
+
+        self.island_results = [results[id(control)][0] for control in controls]
+        self.evaluations = sum(results[id(control)][1] for control in controls)
+        self.migrants_received = sum(results[id(control)][2] for control in controls)
+
+        self.archive = self.archive_factory()
+        self.archive.add_all([solution for result in self.island_results for solution in result])
+
+    def get_result(self) -> List[S]:
+        return self.archive.get_solution_list()
+
+    def get_name(self) -> str:
+        return "Island model"
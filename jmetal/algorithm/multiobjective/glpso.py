@@ -1,10 +1,11 @@
+import random
 from copy import copy
-from random import Random
 from typing import TypeVar, List
 
 
 import numpy, time
 
+from jmetal.algorithm.multiobjective.smpso import variable_matrix, set_variables, constriction_coefficient
 from jmetal.component.archive import BoundedArchive
 from jmetal.component.evaluator import Evaluator, SequentialEvaluator
 from jmetal.core.algorithm import ParticleSwarmOptimization
@@ -71,17 +72,18 @@ class GLPSO(ParticleSwarmOptimization):
                            'population': self.swarm,
                            'computing time': self.get_current_computing_time()}
         self.observable.notify_all(**observable_data)
+        self.update_checkpoint()
 
     def is_stopping_condition_reached(self) -> bool:
         return self.evaluations >= self.max_evaluations #TODO: Another condition should be added which is the accepted fitness difference threshold
 
-	def create_initial_solutions(self) -> List[FloatSolution]:
-		''' Creates a list of special initial solutions to be embedded within the initial swarm
-		@return: List of special initial solutions
-		@rtype: List[FloatSolution]
-		'''
-		
-    	pass
+    def create_initial_solutions(self) -> List[FloatSolution]:
+        ''' Creates a list of special initial solutions to be embedded within the initial swarm
+        @return: List of special initial solutions
+        @rtype: List[FloatSolution]
+        '''
+
+        pass
     
     def create_initial_swarm(self) -> List[FloatSolution]:
         swarm = []
@@ -104,8 +106,7 @@ class GLPSO(ParticleSwarmOptimization):
         return self.evaluator.evaluate(swarm, self.problem) #TODO: I think the evaluate method needs more than 'pass'
 
     def initialize_global_best(self, swarm: List[FloatSolution]) -> None:   #TODO: This method may need to fixed to the limit on global best solution
-        for particle in self.swarm:
-            self.leaders.add(particle)
+        self.leaders.add_all(self.swarm)
 
     def initialize_particle_best(self, swarm: List[FloatSolution]) -> None:
         for particle in self.swarm:
@@ -115,43 +116,43 @@ class GLPSO(ParticleSwarmOptimization):
         pass # Velocity initialized in the constructor    #TODO: may need to be modified
 
     def update_velocity(self, swarm: List[FloatSolution]) -> None:
-        for i in range(self.swarm_size):
-            particle = copy(self.swarm[i])
-            best_particle = copy(self.swarm[i].attributes["local_best"])
-            best_global = self.__select_global_best()   #TODO: global should be fixed to the (upper/lower theoretical) limit
-                                                        #TODO: see __select_global_best() for more TODOs
+        size = len(swarm)
+        positions = variable_matrix(swarm)
+        best_particles = variable_matrix([particle.attributes["local_best"] for particle in swarm])
+        best_globals = self.__select_global_bests(size)  #TODO: global should be fixed to the (upper/lower theoretical) limit
+                                                         #TODO: see __select_global_bests() for more TODOs
 
-            r1 = Random.random()
-            r2 = Random.random()
+        r1 = self.rng.random((size, 1))
+        r2 = self.rng.random((size, 1))
 
-            c1 = Random.uniform(self.c1_min, self.c1_max)
-            c2 = Random.uniform(self.c2_min, self.c2_max)
+        c1 = self.rng.uniform(self.c1_min, self.c1_max, (size, 1))
+        c2 = self.rng.uniform(self.c2_min, self.c2_max, (size, 1))
 
-            wmin = self.min_weight
-            wmax = self.max_weight
+        wmax = self.max_weight
 
-            for var in range(self.problem.number_of_variables):
-                self.speed[i][var] = \
-                    self.__velocity_constriction(self.__constriction_coefficient(c1, c2) * \
-                                                 (wmax * self.speed[i][var] +
-                                                  c1 * r1 * (best_particle.variables[var] - particle.variables[var]) +
-                                                  c2 * r2 * (best_global.variables[var] - particle.variables[var])),
-                                                 var)
+        speed = self.speed[:size]
+        numpy.clip(constriction_coefficient(c1, c2) *
+                   (wmax * speed +
+                    c1 * r1 * (best_particles - positions) +
+                    c2 * r2 * (best_globals - positions)),
+                   self.delta_min, self.delta_max, out=speed)
 
     def update_position(self, swarm: List[FloatSolution]) -> None:
-        for i in range(self.swarm_size):
-            particle = self.swarm[i]
+        positions = variable_matrix(swarm)
+        speed = self.speed[:len(swarm)]
+        positions += speed
 
-            for j in particle.variables:
-                particle.variables[j] += self.speed[i][j]
+        lower_bound = numpy.broadcast_to(numpy.asarray(self.problem.lower_bound, dtype=float), positions.shape)
+        below = positions < lower_bound
+        positions[below] = lower_bound[below]
+        speed[below] *= self.change_velocity1
 
-                if particle.variables[j] < self.problem.lower_bound[j]:
-                    particle.variables[j] = self.problem.lower_bound[j]
-                    self.speed[i][j] *= self.change_velocity1
+        upper_bound = numpy.broadcast_to(numpy.asarray(self.problem.upper_bound, dtype=float), positions.shape)
+        above = positions > upper_bound
+        positions[above] = upper_bound[above]
+        speed[above] *= self.change_velocity2
 
-                if particle.variables[j] > self.problem.upper_bound[j]:
-                    particle.variables[j] = self.problem.upper_bound[j]
-                    self.speed[i][j] *= self.change_velocity2
+        set_variables(swarm, positions)
 
     def perturbation(self, swarm: List[FloatSolution]) -> None:
         for particle in self.swarm:
@@ -161,56 +162,56 @@ class GLPSO(ParticleSwarmOptimization):
         ''' #TODO: Global should be fixed at (upper/lower theoretical) limit. Thus, there may be no need to use this method
         Besides, it looks to me that this method just copies all particles into "leaders"
         '''
-        for particle in self.swarm:
-            self.leaders.add(copy(particle))
+        self.leaders.add_all([copy(particle) for particle in self.swarm])
 
     def update_particle_best(self, swarm: List[FloatSolution]) -> None:
         for i in range(self.swarm_size):
             flag = self.dominance_comparator.compare(
                 self.swarm[i],
-                self.swarm[i].attribute["local_best"])
+                self.swarm[i].attributes["local_best"])
 
-            if flag is not 1:
+            if flag != 1:
                 swarm[i].attributes["local_best"] = copy(self.swarm[i])
 
     def get_result(self) -> List[FloatSolution]:
-        self.leaders.solution_list
+        return self.leaders.solution_list
+
+    def get_state(self) -> dict:
+        state = super(GLPSO, self).get_state()
+        state['speed'] = self.speed
+        state['leaders'] = self.leaders
+
+        return state
 
-    def __select_global_best(self) -> FloatSolution:
+    def set_state(self, state: dict) -> None:
+        super(GLPSO, self).set_state(state)
+        self.speed = state['speed']
+        self.leaders = state['leaders']
+
+    @property
+    def rng(self) -> numpy.random.Generator:
+        """ Numpy generator of the velocity step. Unless it is set, it is seeded from the `random` module, so seeding
+        `random` makes runs reproducible """
+        if getattr(self, '_rng', None) is None:
+            self._rng = numpy.random.default_rng(random.getrandbits(64))
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: numpy.random.Generator) -> None:
+        self._rng = rng
+
+    def __select_global_bests(self, size: int) -> numpy.ndarray:
         ''' #TODO: This method may not be used here because the global can be a theoretical lower/upper limit. \
         This method chooses only 2 solutions from the swarm to decide the best global? while it should compare all solutions in the swarm
+        Variables of one leader per particle, each one selected by a binary tournament. The leaders are not copied
         '''
-        #pos1 = Random.randint(0, len(self.leaders.solution_list) - 1)
-        #pos2 = Random.randint(0, len(self.leaders.solution_list) - 1)
-        best_global = None
-        particles = Random.sample(self.leaders.solution_list, 2)
-        if self.leaders.get_comparator().compare(particles[0], particles[1]) < 1:
-            best_global = copy(particles[0])
-        else:
-            best_global = copy(particles[1])
-
-        return best_global
-
-    def __velocity_constriction(self, value: float, variable_index: int) -> float:
-        result = None
-        if value > self.delta_max[variable_index]:
-            result = self.delta_max[variable_index]
-
-        if value < self.delta_min[variable_index]:
-            result = self.delta_min[variable_index]
-
-        return result
-
-    def __constriction_coefficient(self, c1: float, c2: float) -> float:
-        result = 0.0
-        rho = c1 + c2
-        if rho <= 4:
-            result = 1.0
-        else:
-            result = 2.0 / (2.0 - rho - numpy.sqrt(pow(rho, 2.0) - 4.0 * rho))
-
-        return result
-    
+        leaders = self.leaders.solution_list
+        comparator = self.leaders.get_comparator()
+        winners = [first if comparator.compare(leaders[first], leaders[second]) < 1 else second
+                   for first, second in self.rng.integers(0, len(leaders), (size, 2)).tolist()]
+
+        return variable_matrix(leaders)[winners]
+
     def run(self):
         self.start_computing_time = time.time()
 
@@ -221,6 +222,9 @@ class GLPSO(ParticleSwarmOptimization):
         self.initialize_global_best(self.swarm)
         self.init_progress()
 
+        self.iterate()
+
+    def iterate(self) -> None:
         while not self.is_stopping_condition_reached():
             self.update_velocity(self.swarm)
             self.update_position(self.swarm)
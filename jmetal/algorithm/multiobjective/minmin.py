@@ -8,21 +8,28 @@ Created on Jul 21, 2018
 from jmetal.problem.multiobjective.constrained import Schedule
 from jmetal.core.algorithm import Algorithm
 from jmetal.util import machine
+from jmetal.util.completion_time import CompletionTimeMatrix, UNASSIGNED, taskState
 
-import time, sys
+import time
+import numpy
 
 class MINMIN(Algorithm[None,None]):
     '''
     MINMIN scheduling algorithm to minimize makespan
     '''
 
-    def __init__(self, problem: Schedule):
+    def __init__(self, problem: Schedule, indexed:bool=False):
         '''
         The algorithm expects a SCHEDULE problem
+        @param indexed: Keep unassigned tasks in a queue ordered by length, so that only the head of the queue is \
+        evaluated in each step instead of the whole completion time matrix (recommended for large number of tasks). \
+        Assignments are the same in both modes
+        @type indexed: bool
         '''
         
         super().__init__()
         self.problem=problem
+        self.indexed=indexed
         self.machin=self.problem.getMachines()  # Retrieve list of machines from input scheduling problem
         self.tin=self.problem.getTasks()        # Retrieve list of tasks from input scheduling problem
         
@@ -39,39 +46,11 @@ class MINMIN(Algorithm[None,None]):
         # Record running time of MINMIN
         self.start_computing_time = time.time()
         
-        # Calculate the initial completion time matrix of all tasks over all machines
-        ct=[[j.makespan+i.length/j.speed for j in self.machin] for i in self.tin]
-        
-        # Temporary counter to hold number of tasks that has been assigned to machines
-        tmp_cnt=len(ct)
-        
-        # Repeat until all tasks are assigned
-        while tmp_cnt!=0:
-            # Assign task with minimum completion time to the machine that causes this minimum completion time
-            job_min=-1       # Job index with minimum completion time (initialized to -1 which corresponds to no task)
-            machine_min=-1   # Machine index with minimum completion time (initialized to -1 which corresponds to no machine)
-            tmp_mach_at_inc=sys.float_info.max    # Current increase in machine makespan (i.e., availability time) (initialized to maximum float value)
-            
-            # Traverse all completion time matrix to find the job with minimum completion time
-            for job_no in range(len(ct)):
-                if not self.tin[job_no].m:
-                    for machine_no in range(len(ct[0])):
-                        if ct[job_no][machine_no]<tmp_mach_at_inc:
-                            job_min=job_no
-                            machine_min=machine_no
-                            tmp_mach_at_inc=ct[job_no][machine_no]  # Current increase in machine makespan (i.e., availability time)
-                            
-            # Assign found task to the corresponding machine that gives the minimum completion time
-            self.machin[machine_min].addTask(self.tin[job_min])
-            
-            # Decrement number of assigned tasks by one
-            tmp_cnt-=1
-            
-            # Modify completion time for other tasks on found machine
-            if tmp_cnt!=0:
-                for i in range(len(ct)):
-                    if not self.tin[i].m:
-                        ct[i][machine_min]+=tmp_mach_at_inc
+        # Assign all tasks to machines
+        if self.indexed:
+            self.__assign_indexed()
+        else:
+            self.__assign()
         
         # Record end of MINMIN running time
         self.total_computing_time = self.get_current_computing_time()
@@ -92,5 +71,81 @@ class MINMIN(Algorithm[None,None]):
         fin_res['run_time']=runtime_res
         fin_res['mach_res']=m_res
         return fin_res
+    
+    def __assign(self)->None:
+        ''' Assign all tasks by scanning the whole completion time matrix in each step
+        '''
+        
+        # Calculate the initial completion time matrix of all tasks over all machines
+        ct=CompletionTimeMatrix(self.machin,self.tin)
+        
+        # Temporary counter to hold number of tasks that has been assigned to machines
+        tmp_cnt=len(self.tin)
+        
+        # Repeat until all tasks are assigned
+        while tmp_cnt!=0:
+            # Find the task with minimum completion time, and the machine that causes this minimum completion time
+            job_min,machine_min,tmp_mach_at_inc=ct.minMin()
+                            
+            # Assign found task to the corresponding machine that gives the minimum completion time
+            ct.assign(job_min,machine_min)
+            
+            # Decrement number of assigned tasks by one
+            tmp_cnt-=1
+            
+            # Modify completion time for other tasks on found machine
+            if tmp_cnt!=0:
+                ct.addToColumn(machine_min,tmp_mach_at_inc)
+    
+    def __assign_indexed(self)->None:
+        ''' Assign all tasks using a queue of unassigned tasks ordered by length. The completion time of a task on a \
+        machine is the machine availability plus the task length over the machine speed, and each assignment adds the \
+        same value to the completion times of all unassigned tasks on one machine. Thus, each column of the completion \
+        time matrix, with rows in queue order, is sorted, and the minimum completion time is reached by the head of the \
+        queue. Other tasks reaching the same completion time (e.g., equal lengths or rounding) form a range after the \
+        head, which is found by binary search. Among them, the task with the lowest index is assigned as in @__assign.
+        '''
+        
+        # Unassigned tasks in ascending order of length (tasks of equal length in ascending order of index)
+        idx=[i for i in range(len(self.tin)) if taskState(self.tin[i])==UNASSIGNED]
+        idx.sort(key=lambda i:self.tin[i].length)
+        
+        # Completion time matrix with rows in the same order as the queue. Column-major layout as only columns are 
+        # updated as a whole. Rows of assigned tasks keep being updated (i.e., not excluded) to keep columns sorted
+        ct=CompletionTimeMatrix(self.machin,[self.tin[i] for i in idx],order='F')
+        
+        # Original index of each queued task (set to the number of tasks once assigned)
+        orig=numpy.array(idx,dtype=int)
+        head=0  # Position of the first unassigned task in the queue
+        
+        # Temporary counter to hold number of tasks that has been assigned to machines
+        tmp_cnt=len(idx)
         
-        
\ No newline at end of file
+        # Repeat until all tasks are assigned
+        while tmp_cnt!=0:
+            # Find the minimum completion time, reached by the head of the queue
+            while orig[head]==len(self.tin):
+                head+=1
+            row=ct.ct[head]
+            tmp_mach_at_inc=row.min()
+            
+            # Find the range of tasks that reach the same completion time on any of the machines giving it
+            end=head+1
+            for j in numpy.flatnonzero(row==tmp_mach_at_inc):
+                end=max(end,head+int(numpy.searchsorted(ct.ct[head:,j],tmp_mach_at_inc,side='right')))
+            
+            # Select the task with the lowest index in the range, and its first machine with minimum completion time
+            job_min=head+int(numpy.argmin(orig[head:end]))
+            machine_min=int(ct.ct[job_min].argmin())
+            tmp_mach_at_inc=float(tmp_mach_at_inc)
+            
+            # Assign found task to the corresponding machine that gives the minimum completion time
+            ct.assign(job_min,machine_min,False)
+            orig[job_min]=len(self.tin)
+            
+            # Decrement number of assigned tasks by one
+            tmp_cnt-=1
+            
+            # Modify completion time for other tasks on found machine (tasks before the head are all assigned)
+            if tmp_cnt!=0:
+                ct.addToColumn(machine_min,tmp_mach_at_inc,first=head)
@@ -1,11 +1,16 @@
+import os
+import time
+from concurrent.futures import wait, FIRST_COMPLETED
 from typing import TypeVar, List
 
 from jmetal.algorithm.singleobjective.evolutionaryalgorithm import GenerationalGeneticAlgorithm
+from jmetal.component.density_estimator import CrowdingDistance
 from jmetal.component.evaluator import SequentialEvaluator, Evaluator
 from jmetal.core.operator import Mutation, Crossover, Selection
 from jmetal.core.problem import Problem
 from jmetal.operator.selection import RankingAndCrowdingDistanceSelection
 from jmetal.util.observable import Observable, DefaultObservable
+from jmetal.util.ranking import Ranking, IncrementalNonDominatedRanking
 
 S = TypeVar('S')
 R = TypeVar(List[S])
@@ -20,7 +25,9 @@ class NSGAII(GenerationalGeneticAlgorithm[S, R]):
                  crossover: Crossover[S, S],
                  selection: Selection[List[S], S],
                  observable: Observable = DefaultObservable(),
-                 evaluator: Evaluator[S] = SequentialEvaluator[S]()):
+                 evaluator: Evaluator[S] = SequentialEvaluator[S](),
+                 batch_reproduction: bool = False,
+                 ranking: Ranking = None):
         super(NSGAII, self).__init__(
             problem,
             population_size,
@@ -29,11 +36,13 @@ class NSGAII(GenerationalGeneticAlgorithm[S, R]):
             crossover,
             selection,
             observable,
-            evaluator)
+            evaluator,
+            batch_reproduction)
+        self.ranking = ranking
 
     def replacement(self, population: List[S], offspring_population: List[S]) -> List[List[TypeVar('S')]]:
         join_population = population + offspring_population
-        return RankingAndCrowdingDistanceSelection(self.population_size).execute(join_population)
+        return RankingAndCrowdingDistanceSelection(self.population_size, self.ranking).execute(join_population)
 
     def get_name(self) -> str:
         return "NSGA-II"
@@ -42,3 +51,120 @@ class NSGAII(GenerationalGeneticAlgorithm[S, R]):
         return self.population
 
 
+class AsynchronousNSGAII(NSGAII[S, R]):
+    """ Steady-state NSGA-II without generational barriers. Up to `max_in_flight` offspring are being evaluated at
+    any time (by default, one per core). As soon as the evaluator returns one of them, it is inserted in the
+    population: the incremental ranking and the crowding distances of the changed subfronts are updated, the worst
+    solution is removed, and a new offspring is dispatched. Evaluations only overlap if the `submit` method of the
+    evaluator is asynchronous (e.g. :class:`MultiprocessEvaluator`).
+    """
+
+    steady_state = True  # update_progress is called once per evaluation, and offspring are evaluated with submit
+
+    def __init__(self,
+                 problem: Problem[S],
+                 population_size: int,
+                 max_evaluations: int,
+                 mutation: Mutation[S],
+                 crossover: Crossover[S, S],
+                 selection: Selection[List[S], S],
+                 observable: Observable = DefaultObservable(),
+                 evaluator: Evaluator[S] = SequentialEvaluator[S](),
+                 max_in_flight: int = None):
+        super(AsynchronousNSGAII, self).__init__(
+            problem,
+            population_size,
+            max_evaluations,
+            mutation,
+            crossover,
+            selection,
+            observable,
+            evaluator,
+            ranking=IncrementalNonDominatedRanking())
+        self.max_in_flight = max_in_flight if max_in_flight is not None else os.cpu_count() or 1
+        self.crowding_distance = CrowdingDistance()
+        self.offspring = []  # Offspring of the last crossover which have not been dispatched yet
+
+    def init_progress(self) -> None:
+        super(AsynchronousNSGAII, self).init_progress()
+        for subfront in self.ranking.compute_ranking(self.population):
+            self.crowding_distance.compute_density_estimator(subfront)
+
+    def update_progress(self) -> None:
+        # The observers are notified once per population_size evaluations, as in the generational version
+        self.evaluations += 1
+        if self.evaluations % self.population_size == 0:
+            observable_data = {'evaluations': self.evaluations,
+                               'population': self.population,
+                               'computing time': self.get_current_computing_time()}
+            self.observable.notify_all(**observable_data)
+        self.update_checkpoint()
+
+    def create_offspring(self) -> S:
+        """ Returns a new offspring. Parents are selected from the current population whenever the offspring of the
+        previous crossover have all been dispatched """
+        if not self.offspring:
+            parents = [self.selection_operator.execute(self.population)
+                       for _ in range(self.crossover_operator.get_number_of_parents())]
+            self.offspring = self.crossover_operator.execute(parents)
+            for solution in self.offspring:
+                self.mutation_operator.execute(solution)
+
+        return self.offspring.pop(0)
+
+    def replacement(self, population: List[S], offspring_population: List[S]) -> List[S]:
+        for solution in offspring_population:
+            population.append(solution)
+            self.__update_crowding_distances(self.ranking.add(solution))
+
+            last_subfront = self.ranking.get_subfront(self.ranking.get_number_of_subfronts() - 1)
+            worst = sorted(last_subfront, key=lambda x: x.attributes["crowding_distance"], reverse=True)[-1]
+            population[:] = [member for member in population if member is not worst]
+            self.__update_crowding_distances(self.ranking.remove(worst))
+
+        return population
+
+    def run(self):
+        self.start_computing_time = time.time()
+
+        self.population = self.create_initial_population()
+        self.population = self.evaluate_population(self.population)
+        self.init_progress()
+
+        self.iterate()
+
+    def iterate(self) -> None:
+        in_flight = []
+        while not self.is_stopping_condition_reached():
+            while len(in_flight) < self.max_in_flight and self.evaluations + len(in_flight) < self.max_evaluations:
+                in_flight.append(self.evaluator.submit(self.create_offspring(), self.problem))
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            # Evaluated offspring are inserted in the order they were dispatched, so runs are reproducible when the
+            # evaluator is synchronous
+            for future in [future for future in in_flight if future in done]:
+                in_flight.remove(future)
+                self.population = self.replacement(self.population, [future.result()])
+                self.update_progress()
+
+        self.total_computing_time = self.get_current_computing_time()
+
+    def get_state(self) -> dict:
+        """ Offspring being evaluated are not part of the state, so a resumed run dispatches new ones """
+        state = super(AsynchronousNSGAII, self).get_state()
+        state['ranking'] = self.ranking
+        state['offspring'] = self.offspring
+
+        return state
+
+    def set_state(self, state: dict) -> None:
+        super(AsynchronousNSGAII, self).set_state(state)
+        self.ranking = state['ranking']
+        self.offspring = state['offspring']
+
+    def get_name(self) -> str:
+        return "Asynchronous NSGA-II"
+
+    def __update_crowding_distances(self, ranks: List[int]) -> None:
+        for rank in ranks:
+            self.crowding_distance.compute_density_estimator(self.ranking.get_subfront(rank))
@@ -1,6 +1,6 @@
 from typing import TypeVar, List, Generic
 
-from jmetal.component.archive import NonDominatedSolutionListArchive
+from jmetal.component.archive import IndexedNonDominatedSolutionListArchive
 from jmetal.core.problem import Problem
 
 """ Class representing simple random search algorithms """
@@ -13,7 +13,7 @@ class RandomSearch(Generic[S]):
     def __init__(self, problem: Problem[S], max_evaluations: int):
         self.problem = problem
         self.max_evaluations = max_evaluations
-        self.archive = NonDominatedSolutionListArchive()
+        self.archive = IndexedNonDominatedSolutionListArchive()
 
     def run(self) -> None:
         for i in range(self.max_evaluations):
@@ -1,21 +1,49 @@
+import random
 from copy import copy
-from random import Random
 from typing import TypeVar, List
 
 import numpy
 
 from jmetal.component.archive import BoundedArchive
-from jmetal.component.evaluator import Evaluator, SequentialEvaluator
+from jmetal.component.evaluator import Evaluator, SequentialEvaluator, BatchEvaluator
 from jmetal.core.algorithm import ParticleSwarmOptimization
 from jmetal.core.operator import Mutation
+from jmetal.core.population import Population
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
 from jmetal.util.comparator import DominanceComparator
 from jmetal.util.observable import Observable, DefaultObservable
+from jmetal.util.ranking import objective_matrix, non_dominated_sort
 
 R = TypeVar('R')
 
 
+def variable_matrix(solution_list: List[FloatSolution]) -> numpy.ndarray:
+    """ Particles x variables matrix of a swarm. For a :class:`Population` it is a view of the population, otherwise
+    it is a new array """
+    if isinstance(solution_list, Population):
+        return solution_list.variables
+    return numpy.array([solution.variables for solution in solution_list], dtype=float)
+
+
+def set_variables(solution_list: List[FloatSolution], variables: numpy.ndarray) -> None:
+    """ Writes back a particles x variables matrix into the solutions of a swarm """
+    if isinstance(solution_list, Population):
+        if not numpy.shares_memory(variables, solution_list.variables):
+            solution_list.variables[:] = variables
+        return
+    for solution, values in zip(solution_list, variables.tolist()):
+        solution.variables = values
+
+
+def constriction_coefficient(c1: numpy.ndarray, c2: numpy.ndarray) -> numpy.ndarray:
+    """ Constriction coefficient of each pair of c1 and c2 values """
+    rho = c1 + c2
+    root = numpy.sqrt(numpy.maximum(rho * rho - 4.0 * rho, 0.0))
+
+    return numpy.where(rho <= 4.0, 1.0, 2.0 / (2.0 - rho - root))
+
+
 class SMPSO(ParticleSwarmOptimization):
     def __init__(self,
                  problem: FloatProblem,
@@ -69,6 +97,7 @@ class SMPSO(ParticleSwarmOptimization):
                            'population': self.swarm,
                            'computing time': self.get_current_computing_time()}
         self.observable.notify_all(**observable_data)
+        self.update_checkpoint()
 
     def is_stopping_condition_reached(self) -> bool:
         return self.evaluations >= self.max_evaluations
@@ -85,8 +114,7 @@ class SMPSO(ParticleSwarmOptimization):
         return self.evaluator.evaluate(swarm, self.problem)
 
     def initialize_global_best(self, swarm: List[FloatSolution]) -> None:
-        for particle in self.swarm:
-            self.leaders.add(particle)
+        self.leaders.add_all(self.swarm)
 
     def initialize_particle_best(self, swarm: List[FloatSolution]) -> None:
         for particle in self.swarm:
@@ -96,91 +124,211 @@ class SMPSO(ParticleSwarmOptimization):
         pass # Velocity initialized in the constructor
 
     def update_velocity(self, swarm: List[FloatSolution]) -> None:
-        for i in range(self.swarm_size):
-            particle = copy(self.swarm[i])
-            best_particle = copy(self.swarm[i].attributes["local_best"])
-            best_global = self.__select_global_best()
+        best_particles = variable_matrix([particle.attributes["local_best"] for particle in swarm])
+        self._update_speed(variable_matrix(swarm), best_particles)
 
-            r1 = Random.random()
-            r2 = Random.random()
+    def _update_speed(self, positions: numpy.ndarray, best_particles: numpy.ndarray) -> None:
+        size = len(positions)
+        best_globals = self._select_global_bests(size)
 
-            c1 = Random.uniform(self.c1_min, self.c1_max)
-            c2 = Random.uniform(self.c2_min, self.c2_max)
+        r1 = self.rng.random((size, 1))
+        r2 = self.rng.random((size, 1))
 
-            wmin = self.min_weight
-            wmax = self.max_weight
+        c1 = self.rng.uniform(self.c1_min, self.c1_max, (size, 1))
+        c2 = self.rng.uniform(self.c2_min, self.c2_max, (size, 1))
 
-            for var in range(self.problem.number_of_variables):
-                self.speed[i][var] = \
-                    self.__velocity_constriction(self.__constriction_coefficient(c1, c2) * \
-                                                 (wmax * self.speed[i][var] +
-                                                  c1 * r1 * (best_particle.variables[var] - particle.variables[var]) +
-                                                  c2 * r2 * (best_global.variables[var] - particle.variables[var])),
-                                                 var)
+        wmax = self.max_weight
+
+        speed = self.speed[:size]
+        numpy.clip(constriction_coefficient(c1, c2) *
+                   (wmax * speed +
+                    c1 * r1 * (best_particles - positions) +
+                    c2 * r2 * (best_globals - positions)),
+                   self.delta_min, self.delta_max, out=speed)
 
     def update_position(self, swarm: List[FloatSolution]) -> None:
-        for i in range(self.swarm_size):
-            particle = self.swarm[i]
+        positions = variable_matrix(swarm)
+        speed = self.speed[:len(swarm)]
+        positions += speed
 
-            for j in particle.variables:
-                particle.variables[j] += self.speed[i][j]
+        lower_bound = numpy.broadcast_to(numpy.asarray(self.problem.lower_bound, dtype=float), positions.shape)
+        below = positions < lower_bound
+        positions[below] = lower_bound[below]
+        speed[below] *= self.change_velocity1
 
-                if particle.variables[j] < self.problem.lower_bound[j]:
-                    particle.variables[j] = self.problem.lower_bound[j]
-                    self.speed[i][j] *= self.change_velocity1
+        upper_bound = numpy.broadcast_to(numpy.asarray(self.problem.upper_bound, dtype=float), positions.shape)
+        above = positions > upper_bound
+        positions[above] = upper_bound[above]
+        speed[above] *= self.change_velocity2
 
-                if particle.variables[j] > self.problem.upper_bound[j]:
-                    particle.variables[j] = self.problem.upper_bound[j]
-                    self.speed[i][j] *= self.change_velocity2
+        set_variables(swarm, positions)
 
     def perturbation(self, swarm: List[FloatSolution]) -> None:
         for particle in self.swarm:
             self.mutation.execute(particle)
 
     def update_global_best(self, swarm: List[FloatSolution]) -> None:
-        for particle in self.swarm:
-            self.leaders.add(copy(particle))
+        self.leaders.add_all([copy(particle) for particle in self.swarm])
 
     def update_particle_best(self, swarm: List[FloatSolution]) -> None:
         for i in range(self.swarm_size):
             flag = self.dominance_comparator.compare(
                 self.swarm[i],
-                self.swarm[i].attribute["local_best"])
+                self.swarm[i].attributes["local_best"])
 
-            if flag is not 1:
+            if flag != 1:
                 swarm[i].attributes["local_best"] = copy(self.swarm[i])
 
     def get_result(self) -> List[FloatSolution]:
-        self.leaders.solution_list
-
-    def __select_global_best(self) -> FloatSolution:
-        #pos1 = Random.randint(0, len(self.leaders.solution_list) - 1)
-        #pos2 = Random.randint(0, len(self.leaders.solution_list) - 1)
-        best_global = None
-        particles = Random.sample(self.leaders.solution_list, 2)
-        if self.leaders.get_comparator().compare(particles[0], particles[1]) < 1:
-            best_global = copy(particles[0])
-        else:
-            best_global = copy(particles[1])
+        return self.leaders.solution_list
+
+    def get_state(self) -> dict:
+        state = super(SMPSO, self).get_state()
+        state['speed'] = self.speed
+        state['leaders'] = self.leaders
+
+        return state
+
+    def set_state(self, state: dict) -> None:
+        super(SMPSO, self).set_state(state)
+        self.speed = state['speed']
+        self.leaders = state['leaders']
+
+    @property
+    def rng(self) -> numpy.random.Generator:
+        """ Numpy generator of the velocity step. Unless it is set, it is seeded from the `random` module, so seeding
+        `random` makes runs reproducible """
+        if getattr(self, '_rng', None) is None:
+            self._rng = numpy.random.default_rng(random.getrandbits(64))
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: numpy.random.Generator) -> None:
+        self._rng = rng
+
+    def _select_global_bests(self, size: int) -> numpy.ndarray:
+        """ Variables of one leader per particle, each one selected by a binary tournament. The leaders are not
+        copied """
+        leaders = self.leaders.solution_list
+        comparator = self.leaders.get_comparator()
+        winners = [first if comparator.compare(leaders[first], leaders[second]) < 1 else second
+                   for first, second in self.rng.integers(0, len(leaders), (size, 2)).tolist()]
+
+        return variable_matrix(leaders)[winners]
+
+
+class VectorizedSMPSO(SMPSO):
+    """ SMPSO keeping the swarm in a :class:`Population` and the personal bests in numpy arrays, so each iteration
+    is a few matrix operations. Random numbers are drawn from one seeded numpy generator (the mutation operator uses
+    it too if it supports `execute_batch`). Leaders are kept in the given :class:`BoundedArchive`, which only receives
+    copies of the non-dominated particles of the swarm. The default evaluator evaluates the whole swarm with one call
+    to `evaluate_batch` of the problem.
+    """
 
-        return best_global
+    def __init__(self,
+                 problem: FloatProblem,
+                 swarm_size: int,
+                 max_evaluations: int,
+                 mutation: Mutation[FloatSolution],
+                 leaders: BoundedArchive[FloatSolution],
+                 observable: Observable = DefaultObservable(),
+                 evaluator: Evaluator[FloatSolution] = BatchEvaluator[FloatSolution](),
+                 seed: int = None):
+        super(VectorizedSMPSO, self).__init__(
+            problem,
+            swarm_size,
+            max_evaluations,
+            mutation,
+            leaders,
+            observable,
+            evaluator)
+        if seed is not None:
+            self.rng = numpy.random.default_rng(seed)
+        if hasattr(self.mutation, 'execute_batch'):
+            self.mutation.rng = self.rng
+
+        self.best_positions: numpy.ndarray = None
+        self.best_objectives: numpy.ndarray = None
+        self.best_violation: numpy.ndarray = None  # NaN for particles without overall constraint violation
+
+    def create_initial_swarm(self) -> Population:
+        swarm = Population(self.problem.number_of_variables, self.problem.number_of_objectives,
+                           self.problem.number_of_constraints, self.problem.lower_bound, self.problem.upper_bound,
+                           capacity=self.swarm_size)
+        swarm.size = self.swarm_size
+        swarm.variables[:] = self.rng.uniform(self.problem.lower_bound, self.problem.upper_bound,
+                                              (self.swarm_size, self.problem.number_of_variables))
 
-    def __velocity_constriction(self, value: float, variable_index: int) -> float:
-        result = None
-        if value > self.delta_max[variable_index]:
-            result = self.delta_max[variable_index]
+        return swarm
 
-        if value < self.delta_min[variable_index]:
-            result = self.delta_min[variable_index]
+    def initialize_global_best(self, swarm: Population) -> None:
+        self.leaders.add_all(self.__leader_candidates(swarm))
 
-        return result
+    def initialize_particle_best(self, swarm: Population) -> None:
+        objectives, violation = self.__objectives(swarm)
+        self.best_positions = swarm.variables.copy()
+        self.best_objectives = objectives.copy()
+        self.best_violation = violation
 
-    def __constriction_coefficient(self, c1: float, c2: float) -> float:
-        result = 0.0
-        rho = c1 + c2
-        if rho <= 4:
-            result = 1.0
-        else:
-            result = 2.0 / (2.0 - rho - numpy.sqrt(pow(rho, 2.0) - 4.0 * rho))
+    def update_velocity(self, swarm: Population) -> None:
+        self._update_speed(swarm.variables, self.best_positions)
 
-        return result
+    def perturbation(self, swarm: Population) -> None:
+        if hasattr(self.mutation, 'execute_batch'):
+            self.mutation.execute_batch(swarm.variables, self.problem.lower_bound, self.problem.upper_bound)
+        else:
+            super(VectorizedSMPSO, self).perturbation(swarm)
+
+    def update_global_best(self, swarm: Population) -> None:
+        self.leaders.add_all(self.__leader_candidates(swarm))
+
+    def update_particle_best(self, swarm: Population) -> None:
+        objectives, violation = self.__objectives(swarm)
+
+        # Same rule as SMPSO: the personal best is replaced unless it dominates the particle
+        both_violations = ~numpy.isnan(violation) & ~numpy.isnan(self.best_violation)
+        worse_violation = both_violations & (violation < self.best_violation)
+        better = (objectives < self.best_objectives).any(axis=1)
+        worse = ((objectives != self.best_objectives) & ~(objectives < self.best_objectives)).any(axis=1)
+        dominated = numpy.where(both_violations & (violation != self.best_violation), worse_violation,
+                                worse & ~better)
+
+        replaced = ~dominated
+        self.best_positions[replaced] = swarm.variables[replaced]
+        self.best_objectives[replaced] = objectives[replaced]
+        self.best_violation[replaced] = violation[replaced]
+
+    def get_state(self) -> dict:
+        state = super(VectorizedSMPSO, self).get_state()
+        state['best_positions'] = self.best_positions
+        state['best_objectives'] = self.best_objectives
+        state['best_violation'] = self.best_violation
+
+        return state
+
+    def set_state(self, state: dict) -> None:
+        super(VectorizedSMPSO, self).set_state(state)
+        self.best_positions = state['best_positions']
+        self.best_objectives = state['best_objectives']
+        self.best_violation = state['best_violation']
+
+    def get_name(self) -> str:
+        return "Vectorized SMPSO"
+
+    def __objectives(self, swarm: Population):
+        objectives, violation = objective_matrix(swarm)
+        if violation is None:
+            violation = numpy.full(len(swarm), numpy.nan)
+
+        return objectives, violation
+
+    def __leader_candidates(self, swarm: Population) -> List[FloatSolution]:
+        """ Copies of the particles that may enter the leader archive. When the dominance relation is transitive
+        (no NaN values), particles dominated by another particle would be rejected or removed by the archive anyway,
+        so only the first front of the swarm is copied """
+        objectives, violation = objective_matrix(swarm)
+        if numpy.isnan(objectives).any() or (violation is not None and numpy.isnan(violation).any()):
+            return swarm.to_solutions()
+
+        first_front = non_dominated_sort(objectives, violation, max_solutions=1)[0]
+        return swarm.take(numpy.sort(first_front)).to_solutions()
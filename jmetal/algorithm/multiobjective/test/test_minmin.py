@@ -0,0 +1,51 @@
+import random
+import unittest
+
+from jmetal.algorithm.multiobjective.minmin import MINMIN
+from jmetal.problem.multiobjective.constrained import Schedule
+from jmetal.util.machine import Machine
+from jmetal.util.task import Task
+
+
+class MINMINTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.objectives = [{'name': 'makespan', 'weight': 1.0}]
+
+    def test_should_run_assign_the_shortest_task_first_to_the_fastest_machine(self):
+        machines = [Machine(1, 0, 1.0), Machine(1, 1, 2.0)]
+        tasks = [Task(1, 0, 4.0), Task(1, 1, 2.0), Task(1, 2, 6.0)]
+        problem = Schedule(self.objectives, machines, tasks)
+
+        result = MINMIN(problem).run(ds_id=1, iteration=0)
+
+        self.assertEqual('MINMIN', result['run_time']['algorithm'])
+        self.assertEqual([2], result['mach_res'][0]['tasks'])
+        self.assertEqual([1, 0], result['mach_res'][1]['tasks'])
+        self.assertEqual(6.0, result['run_time']['max_makespan'])
+
+    def test_should_run_reset_the_machines(self):
+        machines = [Machine(1, 0, 1.0), Machine(1, 1, 2.0)]
+        tasks = [Task(1, 0, 4.0), Task(1, 1, 2.0)]
+        problem = Schedule(self.objectives, machines, tasks)
+
+        MINMIN(problem).run()
+
+        self.assertTrue(all(machine.makespan == 0.0 and not machine.tasks for machine in machines))
+        self.assertTrue(all(task.m is None for task in tasks))
+
+    def test_should_indexed_mode_give_the_same_assignments(self):
+        for seed in range(50):
+            rand = random.Random(seed)
+            machines = [Machine(1, i, rand.randint(1, 4)) for i in range(rand.randint(1, 6))]
+            tasks = [Task(1, i, rand.choice([1.0, 2.0, rand.uniform(1, 10)])) for i in range(rand.randint(1, 40))]
+            problem = Schedule(self.objectives, machines, tasks)
+
+            expected = MINMIN(problem).run()['mach_res']
+            result = MINMIN(problem, indexed=True).run()['mach_res']
+
+            self.assertEqual(expected, result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from typing import List
+
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII, AsynchronousNSGAII
+from jmetal.component.evaluator import MultiprocessEvaluator
+from jmetal.core.solution import FloatSolution
+from jmetal.operator.crossover import SBX
+from jmetal.operator.mutation import Polynomial
+from jmetal.operator.selection import BinaryTournamentSelection
+from jmetal.problem.multiobjective.zdt import ZDT1
+from jmetal.util.checkpoint import Checkpoint, load_checkpoint
+from jmetal.util.ranking import EfficientNonDominatedRanking, FastNonDominatedRanking
+
+
+class NSGAIITestCases(unittest.TestCase):
+
+    def create_algorithm(self, batch_reproduction: bool, ranking=None) -> NSGAII:
+        problem = ZDT1(10)
+        return NSGAII[FloatSolution, List[FloatSolution]](
+            problem=problem, population_size=20, max_evaluations=400,
+            mutation=Polynomial(1.0 / problem.number_of_variables, distribution_index=20),
+            crossover=SBX(1.0, distribution_index=20), selection=BinaryTournamentSelection(),
+            batch_reproduction=batch_reproduction, ranking=ranking)
+
+    def test_should_batch_reproduction_create_offspring_copies_of_the_parents(self):
+        random.seed(1)
+        algorithm = self.create_algorithm(True)
+        parents = [algorithm.problem.create_solution() for _ in range(20)]
+
+        offspring = algorithm.reproduction(parents)
+
+        self.assertEqual(20, len(offspring))
+        for parent, solution in zip(parents, offspring):
+            self.assertIsNot(parent, solution)
+            self.assertIsInstance(solution.variables, list)
+            self.assertEqual(10, len(solution.variables))
+            self.assertTrue(all(0.0 <= x <= 1.0 for x in solution.variables))
+
+    def test_should_run_with_batch_reproduction(self):
+        random.seed(1)
+        algorithm = self.create_algorithm(True)
+        algorithm.run()
+
+        self.assertEqual(20, len(algorithm.get_result()))
+        self.assertEqual(400, algorithm.evaluations)
+
+    def test_should_batch_reproduction_be_reproducible_with_random_seed(self):
+        def run():
+            random.seed(2)
+            algorithm = self.create_algorithm(True)
+            algorithm.run()
+            return [s.objectives for s in algorithm.get_result()]
+
+        self.assertEqual(run(), run())
+
+    def test_should_run_with_efficient_non_dominated_ranking(self):
+        random.seed(1)
+        algorithm = self.create_algorithm(False, EfficientNonDominatedRanking())
+        algorithm.run()
+
+        self.assertEqual(20, len(algorithm.get_result()))
+        self.assertTrue(all("dominance_ranking" in solution.attributes for solution in algorithm.get_result()))
+
+
+class NSGAIICheckpointTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'nsgaii.ckpt')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def create_algorithm(self, max_evaluations: int, batch_reproduction: bool) -> NSGAII:
+        problem = ZDT1(10)
+        return NSGAII[FloatSolution, List[FloatSolution]](
+            problem=problem, population_size=20, max_evaluations=max_evaluations,
+            mutation=Polynomial(1.0 / problem.number_of_variables, distribution_index=20),
+            crossover=SBX(1.0, distribution_index=20), selection=BinaryTournamentSelection(),
+            batch_reproduction=batch_reproduction)
+
+    def test_should_update_progress_write_a_checkpoint_every_interval(self):
+        random.seed(1)
+        algorithm = self.create_algorithm(200, False)
+        algorithm.checkpoint = Checkpoint(self.path, interval=3)
+        algorithm.run()
+
+        state = load_checkpoint(self.path)
+        self.assertEqual(20 + 20 * 9, state['evaluations'])
+        self.assertEqual(20, len(state['population']))
+
+    def test_should_resume_continue_with_the_same_random_numbers(self):
+        for batch_reproduction in [False, True]:
+            random.seed(1)
+            algorithm = self.create_algorithm(400, batch_reproduction)
+            algorithm.run()
+            expected = [s.objectives for s in algorithm.get_result()]
+
+            random.seed(1)
+            algorithm = self.create_algorithm(200, batch_reproduction)
+            algorithm.checkpoint = Checkpoint(self.path)
+            algorithm.run()
+
+            random.seed(2)
+            algorithm = self.create_algorithm(400, batch_reproduction)
+            algorithm.resume(self.path)
+
+            self.assertEqual(400, algorithm.evaluations)
+            self.assertEqual(expected, [s.objectives for s in algorithm.get_result()])
+
+
+class AsynchronousNSGAIITestCases(unittest.TestCase):
+
+    def create_algorithm(self, max_in_flight: int, **kwargs) -> AsynchronousNSGAII:
+        problem = ZDT1(10)
+        return AsynchronousNSGAII[FloatSolution, List[FloatSolution]](
+            problem=problem, population_size=20, max_evaluations=400,
+            mutation=Polynomial(1.0 / problem.number_of_variables, distribution_index=20),
+            crossover=SBX(1.0, distribution_index=20), selection=BinaryTournamentSelection(),
+            max_in_flight=max_in_flight, **kwargs)
+
+    def assert_valid_population(self, algorithm):
+        self.assertEqual(400, algorithm.evaluations)
+        self.assertEqual(20, len(algorithm.get_result()))
+        self.assertEqual(20, sum(len(subfront) for subfront in algorithm.ranking.ranked_sublists))
+
+        expected = FastNonDominatedRanking().compute_ranking(list(algorithm.get_result()))
+        self.assertEqual([sorted(id(solution) for solution in subfront) for subfront in expected],
+                         [sorted(id(solution) for solution in subfront)
+                          for subfront in algorithm.ranking.ranked_sublists])
+
+    def test_should_run_keep_the_population_ranked(self):
+        random.seed(1)
+        algorithm = self.create_algorithm(1)
+        algorithm.run()
+
+        self.assert_valid_population(algorithm)
+
+    def test_should_run_be_reproducible_with_random_seed(self):
+        def run():
+            random.seed(2)
+            algorithm = self.create_algorithm(4)
+            algorithm.run()
+            return [s.objectives for s in algorithm.get_result()]
+
+        self.assertEqual(run(), run())
+
+    def test_should_run_with_the_multiprocess_evaluator(self):
+        random.seed(1)
+        evaluator = MultiprocessEvaluator(processes=2)
+        try:
+            algorithm = self.create_algorithm(4, evaluator=evaluator)
+            algorithm.run()
+        finally:
+            evaluator.close()
+
+        self.assert_valid_population(algorithm)
+
+
+if __name__ == '__main__':
+    unittest.main()
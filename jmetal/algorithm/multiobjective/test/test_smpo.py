@@ -1,12 +1,22 @@
+import os
+import random
+import shutil
+import tempfile
 import unittest
 
 import numpy
 
-from jmetal.algorithm.multiobjective.smpso import SMPSO
-from jmetal.component.archive import BoundedArchive
+from jmetal.algorithm.multiobjective.smpso import SMPSO, VectorizedSMPSO, constriction_coefficient
+from jmetal.component.archive import BoundedArchive, CrowdingDistanceArchive
+from jmetal.core.population import Population
 from jmetal.core.problem import Problem
 from jmetal.core.solution import FloatSolution
 from jmetal.operator.mutation import Polynomial
+from jmetal.problem.multiobjective.constrained import Srinivas
+from jmetal.problem.multiobjective.unconstrained import Kursawe
+from jmetal.problem.multiobjective.zdt import ZDT1
+from jmetal.util.checkpoint import Checkpoint
+from jmetal.util.comparator import DominanceComparator
 
 
 class SMPSOTestCases(unittest.TestCase):
@@ -38,6 +48,122 @@ class SMPSOTestCases(unittest.TestCase):
         numpy.testing.assert_array_almost_equal(numpy.array([2.0, 2.0]), algorithm.delta_max)
         numpy.testing.assert_array_almost_equal(algorithm.delta_max * -1.0, algorithm.delta_min)
 
+    def test_should_global_best_hooks_add_the_swarm_to_the_leaders_as_a_batch(self):
+        problem = self.__DummyFloatProblem()
+        algorithm = SMPSO(
+            problem=problem,
+            swarm_size=3,
+            max_evaluations=200,
+            mutation=Polynomial(probability=1.0/problem.number_of_variables),
+            leaders=CrowdingDistanceArchive[FloatSolution](10)
+        )
+        algorithm.swarm = []
+        for objectives in [[1.0, 1.0], [0.0, 2.0], [2.0, 2.0]]:
+            particle = FloatSolution(2, 2, 0, problem.lower_bound, problem.upper_bound)
+            particle.objectives = objectives
+            algorithm.swarm.append(particle)
+
+        algorithm.initialize_global_best(algorithm.swarm)
+        self.assertEqual(algorithm.swarm[:2], algorithm.leaders.get_solution_list())
+
+        algorithm.swarm[2].objectives = [0.5, 0.5]
+        algorithm.update_global_best(algorithm.swarm)
+        self.assertEqual([[0.0, 2.0], [0.5, 0.5]], [s.objectives for s in algorithm.leaders.get_solution_list()])
+        self.assertIsNot(algorithm.swarm[2], algorithm.leaders.get_solution_list()[1])
+
+    def test_should_constriction_coefficient_be_one_unless_c1_plus_c2_is_greater_than_four(self):
+        coefficients = constriction_coefficient(numpy.array([1.5, 2.0, 2.5]), numpy.array([1.5, 2.0, 2.5]))
+
+        numpy.testing.assert_array_almost_equal([1.0, 1.0, 2.0 / (2.0 - 5.0 - numpy.sqrt(5.0))], coefficients)
+
+    def test_should_update_velocity_be_equal_to_the_per_variable_update_without_copying_particles(self):
+        problem = self.__DummyFloatProblem()
+        algorithm = SMPSO(
+            problem=problem,
+            swarm_size=4,
+            max_evaluations=200,
+            mutation=Polynomial(probability=1.0/problem.number_of_variables),
+            leaders=CrowdingDistanceArchive[FloatSolution](10)
+        )
+        algorithm.swarm = []
+        for variables, objectives in [([0.0, 1.0], [1.0, 4.0]), ([1.5, -1.0], [2.0, 2.0]),
+                                      ([-1.0, -2.0], [4.0, 1.0]), ([2.0, 0.5], [5.0, 5.0])]:
+            particle = FloatSolution(2, 2, 0, problem.lower_bound, problem.upper_bound)
+            particle.variables = variables
+            particle.objectives = objectives
+            algorithm.swarm.append(particle)
+        algorithm.initialize_particle_best(algorithm.swarm)
+        algorithm.initialize_global_best(algorithm.swarm)
+        algorithm.leaders.compute_density_estimator()
+        algorithm.speed[:] = [[1.9, -0.5], [0.0, 0.3], [-1.2, 1.1], [0.4, -1.9]]
+        for particle in algorithm.swarm:
+            particle.attributes["local_best"].variables = [0.5, -0.5]
+        local_bests = [particle.attributes["local_best"] for particle in algorithm.swarm]
+        speed = algorithm.speed.copy()
+
+        algorithm.rng = numpy.random.default_rng(1)
+        algorithm.update_velocity(algorithm.swarm)
+
+        rng = numpy.random.default_rng(1)
+        leaders = algorithm.leaders.get_solution_list()
+        pairs = rng.integers(0, len(leaders), (4, 2))
+        r1, r2 = rng.random((4, 1)), rng.random((4, 1))
+        c1, c2 = rng.uniform(1.5, 2.5, (4, 1)), rng.uniform(1.5, 2.5, (4, 1))
+        for i, particle in enumerate(algorithm.swarm):
+            first, second = pairs[i]
+            comparator = algorithm.leaders.get_comparator()
+            best_global = leaders[first] if comparator.compare(leaders[first], leaders[second]) < 1 else leaders[second]
+            rho = c1[i, 0] + c2[i, 0]
+            chi = 1.0 if rho <= 4 else 2.0 / (2.0 - rho - numpy.sqrt(rho ** 2.0 - 4.0 * rho))
+            for var in range(2):
+                value = chi * (0.1 * speed[i][var] +
+                               c1[i, 0] * r1[i, 0] * (0.5 * (-1) ** var - particle.variables[var]) +
+                               c2[i, 0] * r2[i, 0] * (best_global.variables[var] - particle.variables[var]))
+                self.assertAlmostEqual(min(max(value, -2.0), 2.0), algorithm.speed[i][var])
+
+        for particle, local_best in zip(algorithm.swarm, local_bests):
+            self.assertIs(local_best, particle.attributes["local_best"])
+
+    def test_should_update_position_move_the_particles_and_bounce_them_at_the_bounds(self):
+        problem = self.__DummyFloatProblem()
+        algorithm = SMPSO(
+            problem=problem,
+            swarm_size=2,
+            max_evaluations=200,
+            mutation=Polynomial(probability=1.0/problem.number_of_variables),
+            leaders=CrowdingDistanceArchive[FloatSolution](10)
+        )
+        algorithm.swarm = []
+        for variables in [[0.0, 1.5], [-1.5, 0.0]]:
+            particle = FloatSolution(2, 2, 0, problem.lower_bound, problem.upper_bound)
+            particle.variables = variables
+            algorithm.swarm.append(particle)
+        algorithm.speed[:] = [[0.5, 1.0], [-1.0, -0.25]]
+
+        algorithm.update_position(algorithm.swarm)
+
+        self.assertEqual([[0.5, 2.0], [-2.0, -0.25]], [particle.variables for particle in algorithm.swarm])
+        numpy.testing.assert_array_equal([[0.5, -1.0], [1.0, -0.25]], algorithm.speed)
+
+    def test_should_run_return_the_leaders(self):
+        random.seed(1)
+        problem = Kursawe()
+        algorithm = SMPSO(
+            problem=problem,
+            swarm_size=10,
+            max_evaluations=100,
+            mutation=Polynomial(probability=1.0/problem.number_of_variables),
+            leaders=CrowdingDistanceArchive[FloatSolution](10)
+        )
+
+        algorithm.run()
+        result = algorithm.get_result()
+
+        self.assertEqual(100, algorithm.evaluations)
+        self.assertTrue(0 < len(result) <= 10)
+        for solution in result:
+            self.assertTrue(all(-5.0 <= value <= 5.0 for value in solution.variables))
+
     class __DummyFloatProblem(Problem[FloatSolution]):
         def __init__(self):
             self.number_of_variables = 2
@@ -51,6 +177,132 @@ class SMPSOTestCases(unittest.TestCase):
             FloatSolution.upper_bound = self.upper_bound
 
 
+class VectorizedSMPSOTestCases(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1)
+
+    def create_algorithm(self, problem, swarm_size=20, max_evaluations=200, seed=1):
+        return VectorizedSMPSO(
+            problem=problem,
+            swarm_size=swarm_size,
+            max_evaluations=max_evaluations,
+            mutation=Polynomial(probability=1.0/problem.number_of_variables, distribution_index=20),
+            leaders=CrowdingDistanceArchive[FloatSolution](10),
+            seed=seed
+        )
+
+    def random_swarm(self, problem, size, levels=4, constraints=False):
+        swarm = Population(problem.number_of_variables, problem.number_of_objectives, 0, problem.lower_bound,
+                           problem.upper_bound)
+        for _ in range(size):
+            solution = problem.create_solution()
+            solution.objectives = [float(random.randint(0, levels)) for _ in range(problem.number_of_objectives)]
+            if constraints and random.random() < 0.7:
+                solution.attributes["overall_constraint_violation"] = -float(random.randint(0, 2))
+            swarm.append(solution)
+
+        return swarm
+
+    def test_should_run_be_reproducible_with_the_same_seed(self):
+        results = []
+        for _ in range(2):
+            algorithm = self.create_algorithm(ZDT1(10))
+            algorithm.run()
+            results.append([solution.objectives for solution in algorithm.get_result()])
+
+        self.assertEqual(200, algorithm.evaluations)
+        self.assertEqual(results[0], results[1])
+        self.assertTrue(0 < len(results[0]) <= 10)
+        for solution in algorithm.get_result():
+            self.assertTrue(all(0.0 <= value <= 1.0 for value in solution.variables))
+
+    def test_should_run_evaluate_constraints_of_the_swarm(self):
+        algorithm = self.create_algorithm(Srinivas())
+        algorithm.run()
+
+        self.assertTrue(algorithm.swarm.has_attribute("overall_constraint_violation").all())
+        self.assertFalse(numpy.isnan(algorithm.best_violation).any())
+
+    def test_should_update_particle_best_keep_only_the_bests_dominating_the_particles(self):
+        problem = ZDT1(3)
+        for constraints, nan in [(False, False), (True, False), (True, True)]:
+            algorithm = self.create_algorithm(problem, swarm_size=200)
+            initial_swarm = self.random_swarm(problem, 200, constraints=constraints)
+            algorithm.initialize_particle_best(initial_swarm)
+            bests = initial_swarm.to_solutions()
+            swarm = self.random_swarm(problem, 200, constraints=constraints)
+            if nan:
+                swarm.objectives[::9, 0] = numpy.nan
+
+            algorithm.update_particle_best(swarm)
+
+            for i, particle in enumerate(swarm):
+                replaced = DominanceComparator().compare(particle, bests[i]) != 1
+                expected = particle if replaced else bests[i]
+                numpy.testing.assert_array_equal(expected.variables, algorithm.best_positions[i])
+                numpy.testing.assert_array_equal(expected.objectives, algorithm.best_objectives[i])
+
+    def test_should_leaders_be_equal_to_adding_the_whole_swarm(self):
+        problem = ZDT1(3)
+        for constraints in [False, True]:
+            swarm = self.random_swarm(problem, 100, levels=5, constraints=constraints)
+            expected = CrowdingDistanceArchive[FloatSolution](10)
+            expected.add_all(swarm.to_solutions())
+
+            algorithm = self.create_algorithm(problem)
+            algorithm.initialize_global_best(swarm)
+
+            self.assertEqual([solution.variables for solution in expected.get_solution_list()],
+                             [solution.variables for solution in algorithm.leaders.get_solution_list()])
+
+
+class SMPSOCheckpointTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'smpso.ckpt')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def assert_same_resumed_run(self, create_algorithm):
+        random.seed(1)
+        algorithm = create_algorithm(300)
+        algorithm.run()
+        expected = [s.objectives for s in algorithm.get_result()]
+
+        random.seed(1)
+        algorithm = create_algorithm(150)
+        algorithm.checkpoint = Checkpoint(self.path)
+        algorithm.run()
+
+        random.seed(2)
+        algorithm = create_algorithm(300)
+        algorithm.resume(self.path)
+
+        self.assertEqual(300, algorithm.evaluations)
+        self.assertEqual(expected, [s.objectives for s in algorithm.get_result()])
+
+    def test_should_resume_smpso_continue_with_the_same_random_numbers(self):
+        def create_algorithm(max_evaluations):
+            problem = ZDT1(5)
+            return SMPSO(problem=problem, swarm_size=10, max_evaluations=max_evaluations,
+                         mutation=Polynomial(probability=1.0/problem.number_of_variables),
+                         leaders=CrowdingDistanceArchive[FloatSolution](10))
+
+        self.assert_same_resumed_run(create_algorithm)
+
+    def test_should_resume_vectorized_smpso_continue_with_the_same_random_numbers(self):
+        def create_algorithm(max_evaluations):
+            problem = ZDT1(5)
+            return VectorizedSMPSO(problem=problem, swarm_size=10, max_evaluations=max_evaluations,
+                                   mutation=Polynomial(probability=1.0/problem.number_of_variables),
+                                   leaders=CrowdingDistanceArchive[FloatSolution](10))
+
+        self.assert_same_resumed_run(create_algorithm)
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -1,6 +1,8 @@
 from copy import copy
 from typing import TypeVar, List
 
+import numpy
+
 from jmetal.component.evaluator import Evaluator, SequentialEvaluator
 from jmetal.core.algorithm import EvolutionaryAlgorithm
 from jmetal.core.operator import Mutation, Crossover, Selection
@@ -30,6 +32,7 @@ class ElitistEvolutionStrategy(EvolutionaryAlgorithm[S, R]):
 
     def update_progress(self):
         self.evaluations += self.lambdA
+        self.update_checkpoint()
 
     def is_stopping_condition_reached(self) -> bool:
         return self.evaluations >= self.max_evaluations
@@ -109,7 +112,8 @@ class GenerationalGeneticAlgorithm(EvolutionaryAlgorithm[S, R]):
                  crossover: Crossover[S, S],
                  selection: Selection[List[S], S],
                  observable: Observable = DefaultObservable(),
-                 evaluator: Evaluator[S] = SequentialEvaluator[S]()):
+                 evaluator: Evaluator[S] = SequentialEvaluator[S](),
+                 batch_reproduction: bool = False):
         super(GenerationalGeneticAlgorithm, self).__init__(evaluator)
         self.problem = problem
         self.population_size = population_size
@@ -119,6 +123,7 @@ class GenerationalGeneticAlgorithm(EvolutionaryAlgorithm[S, R]):
         self.selection_operator = selection
         self.evaluations = 0
         self.observable = observable
+        self.batch_reproduction = batch_reproduction
 
     def init_progress(self):
         self.evaluations = self.population_size
@@ -131,6 +136,7 @@ class GenerationalGeneticAlgorithm(EvolutionaryAlgorithm[S, R]):
                            'computing time': self.get_current_computing_time()}
         
         self.observable.notify_all(**observable_data)
+        self.update_checkpoint()
 
     def is_stopping_condition_reached(self) -> bool:
         return self.evaluations >= self.max_evaluations
@@ -159,6 +165,9 @@ class GenerationalGeneticAlgorithm(EvolutionaryAlgorithm[S, R]):
         number_of_parents_to_combine = self.crossover_operator.get_number_of_parents()
         self.__check_number_of_parents(population, number_of_parents_to_combine)
 
+        if self.batch_reproduction:
+            return self.__batch_reproduction(population)
+
         offspring_population = []
         for i in range(0, self.population_size, number_of_parents_to_combine):
             parents = []
@@ -195,6 +204,24 @@ class GenerationalGeneticAlgorithm(EvolutionaryAlgorithm[S, R]):
     def get_name(self) -> str:
         return "Generational Genetic Algorithm"
 
+    def __batch_reproduction(self, population: List[S]) -> List[S]:
+        """ Generates all the offspring with the `execute_batch` methods of the crossover (of two parents) and
+        mutation operators, instead of one call per pair of parents and per offspring """
+        parents = numpy.array([solution.variables for solution in population[:self.population_size]], dtype=float)
+
+        offspring = numpy.empty_like(parents)
+        offspring[0::2], offspring[1::2] = self.crossover_operator.execute_batch(
+            parents[0::2], parents[1::2], self.problem.lower_bound, self.problem.upper_bound)
+        self.mutation_operator.execute_batch(offspring, self.problem.lower_bound, self.problem.upper_bound)
+
+        offspring_population = []
+        for parent, variables in zip(population, offspring.tolist()):
+            solution = copy(parent)
+            solution.variables = variables
+            offspring_population.append(solution)
+
+        return offspring_population
+
     def __check_number_of_parents(self, population: List[S], number_of_parents_for_crossover: int):
         if self.population_size % number_of_parents_for_crossover != 0:
             raise Exception("Wrong number of parents")
@@ -0,0 +1,151 @@
+import threading
+import unittest
+from typing import List
+
+from jmetal.algorithm.island import IslandModel, MigrationObserver, topology_edges
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII
+from jmetal.algorithm.singleobjective.evolutionaryalgorithm import GenerationalGeneticAlgorithm
+from jmetal.component.archive import NonDominatedSolutionListArchive
+from jmetal.core.solution import FloatSolution
+from jmetal.operator.crossover import SBX
+from jmetal.operator.mutation import Polynomial
+from jmetal.operator.selection import BinaryTournamentSelection
+from jmetal.problem.multiobjective.zdt import ZDT1
+from jmetal.problem.singleobjective.unconstrained import Sphere
+from jmetal.util.comparator import DominanceComparator
+from jmetal.util.observable import DefaultObservable
+
+
+def create_nsgaii() -> NSGAII:
+    problem = ZDT1(10)
+    return NSGAII[FloatSolution, List[FloatSolution]](
+        problem=problem, population_size=20, max_evaluations=400,
+        mutation=Polynomial(1.0 / problem.number_of_variables, distribution_index=20),
+        crossover=SBX(1.0, distribution_index=20), selection=BinaryTournamentSelection(),
+        observable=DefaultObservable())
+
+
+def create_genetic_algorithm() -> GenerationalGeneticAlgorithm:
+    problem = Sphere(5)
+    return GenerationalGeneticAlgorithm[FloatSolution, FloatSolution](
+        problem=problem, population_size=20, max_evaluations=400,
+        mutation=Polynomial(1.0 / problem.number_of_variables, distribution_index=20),
+        crossover=SBX(1.0, distribution_index=20), selection=BinaryTournamentSelection(),
+        observable=DefaultObservable())
+
+
+def create_large_nsgaii() -> NSGAII:
+    problem = ZDT1(2000)
+    return NSGAII[FloatSolution, List[FloatSolution]](
+        problem=problem, population_size=20, max_evaluations=200,
+        mutation=Polynomial(1.0 / problem.number_of_variables, distribution_index=20),
+        crossover=SBX(1.0, distribution_index=20), selection=BinaryTournamentSelection(),
+        observable=DefaultObservable())
+
+
+def create_failing_algorithm() -> NSGAII:
+    raise Exception("The algorithm cannot be created")
+
+
+class TopologyTestCases(unittest.TestCase):
+
+    def test_should_ring_topology_connect_each_island_to_the_next_one(self):
+        self.assertEqual([(0, 1), (1, 2), (2, 0)], topology_edges('ring', 3))
+
+    def test_should_fully_connected_topology_connect_all_the_islands(self):
+        self.assertEqual([(0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1)], topology_edges('fully_connected', 3))
+
+    def test_should_a_single_island_have_no_edges(self):
+        self.assertEqual([], topology_edges('ring', 1))
+
+    def test_should_an_invalid_topology_raise_an_exception(self):
+        with self.assertRaises(Exception):
+            topology_edges('star', 3)
+        with self.assertRaises(Exception):
+            topology_edges([(0, 3)], 3)
+
+
+class MigrationObserverTestCases(unittest.TestCase):
+
+    def test_should_integrate_keep_the_population_size(self):
+        algorithm = create_nsgaii()
+        algorithm.population = algorithm.evaluate_population(algorithm.create_initial_population())
+        immigrants = algorithm.evaluate_population([algorithm.problem.create_solution() for _ in range(5)])
+
+        population = MigrationObserver(algorithm, [], [], 1, 1).integrate(immigrants)
+
+        self.assertEqual(20, len(population))
+
+    def test_should_integrate_keep_the_best_solutions_of_a_single_objective_algorithm(self):
+        algorithm = create_genetic_algorithm()
+        algorithm.population = algorithm.evaluate_population(algorithm.create_initial_population())
+        immigrant = FloatSolution(5, 1, 0, algorithm.problem.lower_bound, algorithm.problem.upper_bound)
+        immigrant.variables = [0.0] * 5
+        immigrant.objectives = [0.0]
+
+        population = MigrationObserver(algorithm, [], [], 1, 1).integrate([immigrant])
+
+        self.assertEqual(20, len(population))
+        self.assertIs(immigrant, population[0])
+
+
+class IslandModelTestCases(unittest.TestCase):
+
+    def test_should_run_merge_the_populations_of_the_islands(self):
+        model = IslandModel(create_nsgaii, number_of_islands=3, migration_interval=2, number_of_migrants=2, seed=1)
+        model.run()
+
+        self.assertEqual(3, len(model.island_results))
+        self.assertTrue(all(len(population) == 20 for population in model.island_results))
+        self.assertEqual(1200, model.evaluations)
+        self.assertGreater(model.migrants_received, 0)
+
+        result = model.get_result()
+        self.assertGreater(len(result), 0)
+        expected = NonDominatedSolutionListArchive()
+        for population in model.island_results:
+            for solution in population:
+                expected.add(solution)
+        self.assertEqual(sorted(s.objectives for s in expected.get_solution_list()),
+                         sorted(s.objectives for s in result))
+        for solution in result:
+            self.assertFalse(any(DominanceComparator().compare(other, solution) == -1 for other in result))
+
+    def test_should_run_be_reproducible_with_a_seed(self):
+        def run():
+            model = IslandModel(create_genetic_algorithm, number_of_islands=2, topology='fully_connected',
+                                migration_interval=100, seed=3)
+            model.run()
+            return [[s.objectives for s in population] for population in model.island_results]
+
+        self.assertEqual(run(), run())
+
+    def test_should_run_a_single_objective_algorithm_keep_the_best_solution(self):
+        model = IslandModel(create_genetic_algorithm, number_of_islands=2, migration_interval=1, seed=1)
+        model.run()
+
+        best = min(solution.objectives[0] for population in model.island_results for solution in population)
+        self.assertEqual([best], [solution.objectives[0] for solution in model.get_result()][:1])
+
+    def test_should_run_not_deadlock_when_migrants_exceed_the_pipe_buffer(self):
+        # Each batch of 20 migrants with 2000 variables is several times larger than the pipe buffer, and both islands
+        # of the ring send at every generation
+        model = IslandModel(create_large_nsgaii, number_of_islands=2, migration_interval=1, number_of_migrants=20,
+                            seed=1)
+        runner = threading.Thread(target=model.run, daemon=True)
+        runner.start()
+        runner.join(timeout=120)
+
+        self.assertFalse(runner.is_alive())
+        self.assertEqual(400, model.evaluations)
+        self.assertGreater(model.migrants_received, 0)
+
+    def test_should_run_raise_an_exception_if_an_island_fails(self):
+        model = IslandModel(create_failing_algorithm, number_of_islands=2, seed=1)
+
+        with self.assertRaises(Exception):
+            model.run()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,39 @@
+import heapq
+from bisect import bisect_left, bisect_right
 from typing import TypeVar, Generic, List
 
+import numpy
+
 from jmetal.component.density_estimator import CrowdingDistance
 from jmetal.util.comparator import DominanceComparator, EqualSolutionsComparator, SolutionAttributeComparator
+from jmetal.util.ranking import non_dominated_sort, objective_matrix
 
 S = TypeVar('S')
 
 
+def _dominance(first: numpy.ndarray, first_violation: numpy.ndarray, second: numpy.ndarray,
+               second_violation: numpy.ndarray):
+    """ Compares each solution of a matrix of objectives against each solution of another one, as
+    :class:`DominanceComparator` does when neither the objectives nor the violations are NaN. Violations are None
+    for unconstrained solutions. Returns three len(first) x len(second) matrices: first dominates second, second
+    dominates first, and both are equal. """
+    better = numpy.zeros((len(first), len(second)), dtype=bool)
+    worse = numpy.zeros((len(first), len(second)), dtype=bool)
+    for k in range(first.shape[1]):
+        better |= first[:, k, None] < second[None, :, k]
+        worse |= first[:, k, None] > second[None, :, k]
+    first_dominates = better & ~worse
+    second_dominates = worse & ~better
+    equal = ~better & ~worse
+    if first_violation is not None:
+        decided = first_violation[:, None] != second_violation[None, :]
+        first_dominates = numpy.where(decided, first_violation[:, None] > second_violation[None, :], first_dominates)
+        second_dominates = numpy.where(decided, first_violation[:, None] < second_violation[None, :], second_dominates)
+        equal &= ~decided
+
+    return first_dominates, second_dominates, equal
+
+
 class Archive(Generic[S]):
     def __init__(self):
         self.solution_list: List[S] = []
@@ -13,6 +41,14 @@ class Archive(Generic[S]):
     def add(self, solution: S) -> bool:
         pass
 
+    def add_all(self, solution_list: List[S]) -> bool:
+        """ Adds a batch of solutions. Returns True if any of them has been accepted """
+        success = False
+        for solution in solution_list:
+            success = self.add(solution) or success
+
+        return success
+
     def get(self, index:int) -> S:
         return self.solution_list[index]
 
@@ -76,10 +112,182 @@ class NonDominatedSolutionListArchive(Archive[S]):
 
         return False
 
+    def add_all(self, solution_list: List[S]) -> bool:
+        """ Adds a batch of solutions. The batch is first filtered against itself, then its non-dominated solutions
+        are compared against the whole archive in one vectorized pass. The result is the same as adding the solutions
+        one by one. """
+        batch = self._non_dominated_candidates(solution_list)
+        objectives, violation = objective_matrix(self.solution_list)
+        if batch is None or numpy.isnan(objectives).any() or \
+                (violation is not None and numpy.isnan(violation).any()) or \
+                (len(self.solution_list) > 0 and (violation is None) != (batch[2] is None)):
+            # The dominance comparator is not transitive here, so the batch is added solution by solution
+            return super(NonDominatedSolutionListArchive, self).add_all(solution_list)
+
+        candidates, candidate_objectives, candidate_violation = batch
+        if len(self.solution_list) == 0:
+            self.solution_list.extend(candidates)
+            return len(candidates) > 0
+
+        dominates, dominated, equal = _dominance(candidate_objectives, candidate_violation, objectives, violation)
+        accepted = ~(dominated | equal).any(axis=1)
+        removed = (dominates & accepted[:, None]).any(axis=0)
+        self.solution_list[:] = [solution for solution, remove in zip(self.solution_list, removed.tolist())
+                                 if not remove] + \
+                                [solution for solution, accept in zip(candidates, accepted.tolist()) if accept]
+
+        return bool(accepted.any())
+
+    def _non_dominated_candidates(self, solution_list: List[S]):
+        """ Non-dominated solutions of a batch (without duplicates, in batch order), with their objectives and
+        violations, or None if the batch has NaN values or a mix of solutions with and without violation """
+        objectives, violation = objective_matrix(solution_list)
+        if numpy.isnan(objectives).any() or (violation is not None and numpy.isnan(violation).any()):
+            return None
+
+        indices = []
+        seen = set()
+        front = non_dominated_sort(objectives, violation, max_solutions=1)
+        for index in sorted(front[0].tolist()) if front else []:
+            key = tuple(objectives[index].tolist()) + ((violation[index],) if violation is not None else ())
+            if key not in seen:
+                seen.add(key)
+                indices.append(index)
+
+        return [solution_list[index] for index in indices], objectives[indices], \
+            violation[indices] if violation is not None else None
+
     def get_comparator(self):
         return self.comparator
 
 
+class IndexedNonDominatedSolutionListArchive(NonDominatedSolutionListArchive[S]):
+    """ Non-dominated archive accepting and keeping exactly the same solutions (in the same order) as
+    :class:`NonDominatedSolutionListArchive`, with an index answering the dominance queries of each insertion.
+
+    With two objectives and no constraints, the solutions are also kept sorted by the first objective (the second one
+    is then decreasing), so a candidate is checked with a binary search and the solutions it dominates are a
+    contiguous run after its position. Otherwise, the objectives (and overall constraint violations) of the solutions
+    are kept in a matrix and each candidate is compared against all of them in one vectorized operation.
+    Candidates with NaN objectives, or a mix of solutions with and without constraint violation (for which the
+    dominance comparator is not transitive), switch the archive to the linear search of its parent class.
+    """
+
+    SORTED, MATRIX, LINEAR = range(3)
+    BATCH_SIZE = 256  # Max. number of solutions of a batch filtered against each other at once
+
+    def __init__(self):
+        super(IndexedNonDominatedSolutionListArchive, self).__init__()
+        self.mode = None
+        self.constrained = None
+        self.__keys = []        # SORTED mode: (first objective, second objective) of the solutions, sorted
+        self.__sorted = []      # SORTED mode: solutions in the order of the keys
+        self.__objectives = None  # MATRIX mode: objectives of the solutions, in the order of the solution list
+        self.__violation = None   # MATRIX mode: overall constraint violation of the solutions
+        self.__rejecter = None    # MATRIX mode: objectives of the last solution rejecting a candidate
+
+    def add(self, solution: S) -> bool:
+        violation = solution.attributes.get("overall_constraint_violation")
+        self.__select_mode(solution.objectives, violation)
+        if self.mode == self.SORTED:
+            return self.__add_sorted(solution)
+        elif self.mode == self.MATRIX:
+            return self.__add_matrix(solution, violation)
+
+        return super(IndexedNonDominatedSolutionListArchive, self).add(solution)
+
+    def add_all(self, solution_list: List[S]) -> bool:
+        """ Adds a batch of solutions. Each chunk of the batch is first filtered against itself, so only its
+        non-dominated solutions are checked against the archive. The result is the same as adding the solutions one
+        by one; True is returned if any of them has been accepted. """
+        success = False
+        for start in range(0, len(solution_list), self.BATCH_SIZE):
+            chunk = solution_list[start:start + self.BATCH_SIZE]
+            batch = None
+            if self.mode not in (self.SORTED, self.LINEAR):
+                # A sorted index answers each query in logarithmic time, so the batch is not filtered first
+                batch = self._non_dominated_candidates(chunk)
+            candidates = chunk if batch is None else batch[0]
+            for solution in candidates:
+                success = self.add(solution) or success
+
+        return success
+
+    def __select_mode(self, objectives: List[float], violation: float) -> None:
+        if self.mode == self.LINEAR:
+            return
+        if any(value != value for value in objectives) or violation != violation or \
+                (self.constrained is not None and (violation is not None) != self.constrained):
+            self.mode = self.LINEAR
+            return
+
+        if self.mode is None:
+            # The first solution added to the archive selects the index
+            self.constrained = violation is not None
+            self.mode = self.SORTED if len(objectives) == 2 and not self.constrained else self.MATRIX
+            self.__objectives = numpy.empty((8, len(objectives)))
+            self.__violation = numpy.empty(8)
+
+    def __add_sorted(self, solution: S) -> bool:
+        key = (solution.objectives[0], solution.objectives[1])
+        position = bisect_right(self.__keys, key)
+        if position > 0 and self.__keys[position - 1][1] <= key[1]:
+            return False  # Dominated by (or equal to) the previous solution in the sorted order
+
+        end = position
+        while end < len(self.__keys) and self.__keys[end][1] >= key[1]:
+            end += 1
+        if end - position == 1:
+            self.solution_list.remove(self.__sorted[position])
+        elif end > position:
+            dominated = set(id(s) for s in self.__sorted[position:end])
+            self.solution_list[:] = [s for s in self.solution_list if id(s) not in dominated]
+        self.__keys[position:end] = [key]
+        self.__sorted[position:end] = [solution]
+        self.solution_list.append(solution)
+
+        return True
+
+    def __add_matrix(self, solution: S, violation: float) -> bool:
+        # Most rejected candidates are dominated by the solution that rejected the previous one. Even if that solution
+        # has been removed since then, the solution removing it dominates the candidate as well
+        if not self.constrained and self.__rejecter is not None and \
+                all(a <= b for a, b in zip(self.__rejecter, solution.objectives)):
+            return False
+
+        point = numpy.asarray(solution.objectives, dtype=float)
+        size = len(self.solution_list)
+        objectives = self.__objectives[:size]
+        dominates, dominated, equal = _dominance(
+            objectives, self.__violation[:size] if self.constrained else None,
+            point[None, :], numpy.array([violation], dtype=float) if self.constrained else None)
+        dominates, dominated, equal = dominates[:, 0], dominated[:, 0], equal[:, 0]
+        rejected = dominates | equal
+        if rejected.any():
+            self.__rejecter = objectives[numpy.argmax(rejected)].tolist()
+            return False
+
+        if dominated.any():
+            keep = ~dominated
+            removed = numpy.flatnonzero(dominated).tolist()
+            if len(removed) * 8 < size:
+                for index in reversed(removed):
+                    del self.solution_list[index]
+            else:
+                self.solution_list[:] = [s for s, k in zip(self.solution_list, keep.tolist()) if k]
+            size = len(self.solution_list)
+            self.__objectives[:size] = objectives[keep]
+            self.__violation[:size] = self.__violation[:len(keep)][keep]
+        if size == len(self.__objectives):
+            self.__objectives = numpy.concatenate((self.__objectives, numpy.empty_like(self.__objectives)))
+            self.__violation = numpy.concatenate((self.__violation, numpy.empty_like(self.__violation)))
+        self.__objectives[size] = point
+        self.__violation[size] = violation if violation is not None else 0.0
+        self.solution_list.append(solution)
+
+        return True
+
+
 class CrowdingDistanceArchive(BoundedArchive[S]):
     def __init__(self, maximum_size: int):
         super(CrowdingDistanceArchive, self).__init__(maximum_size)
@@ -99,6 +307,21 @@ class CrowdingDistanceArchive(BoundedArchive[S]):
 
         return success
 
+    def add_all(self, solution_list: List[S]) -> bool:
+        """ Adds a batch of solutions. The crowding distance is computed once after merging the batch, and the
+        solutions with the lowest crowding distances (the oldest ones in case of ties) are removed at once. """
+        success: bool = self.__non_dominated_solution_archive.add_all(solution_list)
+        if success:
+            excess = self.size() - self.get_max_size()
+            if excess > 0:
+                self.compute_density_estimator()
+                distances = [solution.attributes["crowding_distance"] for solution in self.get_solution_list()]
+                worst = set(sorted(range(len(distances)), key=distances.__getitem__)[:excess])
+                self.solution_list[:] = [solution for index, solution in enumerate(self.solution_list)
+                                         if index not in worst]
+
+        return success
+
     def compute_density_estimator(self):
         self.__crowding_distance.compute_density_estimator(self.get_solution_list())
 
@@ -117,3 +340,141 @@ class CrowdingDistanceArchive(BoundedArchive[S]):
 
     def get_comparator(self):
         return self.__comparator
+
+
+class IncrementalCrowdingDistanceArchive(BoundedArchive[S]):
+    """ Bounded archive evicting the solution with the lowest crowding distance, like :class:`CrowdingDistanceArchive`,
+    without recomputing the crowding distance of the whole archive on each insertion.
+
+    The archive keeps, for each objective, the solutions sorted by that objective, and the contribution of each
+    solution to its crowding distance. Inserting or removing a solution only updates the contributions of its
+    neighbours in each sorted order (all the contributions of an objective are updated only if its range changes).
+    The solution to evict is taken from a heap of (crowding distance, insertion number) entries; outdated entries are
+    discarded when they reach the top. Ties are broken in favour of the oldest solution, as
+    :class:`CrowdingDistanceArchive` does; solutions with equal objective values are ordered by insertion instead
+    of by the order of the sorts of the previous objectives, so tied distances may differ from that archive.
+    """
+
+    def __init__(self, maximum_size: int):
+        super(IncrementalCrowdingDistanceArchive, self).__init__(maximum_size)
+
+        self.__non_dominated_solution_archive = NonDominatedSolutionListArchive[S]()
+        self.__comparator = SolutionAttributeComparator("crowding_distance", lowest_is_best=False)
+        self.solution_list = self.__non_dominated_solution_archive.get_solution_list()
+
+        self.__next_key = 0
+        self.__key_of = {}          # id(solution) -> insertion number (key)
+        self.__solution_of = {}     # key -> solution
+        self.__orders = None        # Per objective, sorted list of (objective value, key)
+        self.__ranges = None        # Per objective, max - min objective value
+        self.__contributions = {}   # key -> contribution of each objective to the crowding distance
+        self.__distance = {}        # key -> crowding distance
+        self.__heap = []            # (crowding distance, key), possibly outdated
+
+    def add(self, solution: S) -> bool:
+        success: bool = self.__non_dominated_solution_archive.add(solution)
+        if not success:
+            return False
+
+        if self.__orders is None:
+            self.__orders = [[] for _ in range(solution.number_of_objectives)]
+            self.__ranges = [0.0] * solution.number_of_objectives
+
+        # Solutions dominated by the new one have been removed from the list
+        if len(self.__key_of) + 1 != len(self.solution_list):
+            current = set(id(s) for s in self.solution_list)
+            for key in [k for k, s in self.__solution_of.items() if id(s) not in current]:
+                self.__remove(key)
+
+        self.__insert(solution)
+        if self.size() > self.get_max_size():
+            key = self.__pop_worst()
+            self.solution_list.remove(self.__solution_of[key])
+            self.__remove(key)
+
+        return success
+
+    def compute_density_estimator(self):
+        for key, solution in self.__solution_of.items():
+            solution.attributes["crowding_distance"] = self.__distance[key]
+
+    def get_comparator(self):
+        return self.__comparator
+
+    def __insert(self, solution: S) -> None:
+        key = self.__next_key
+        self.__next_key += 1
+        self.__key_of[id(solution)] = key
+        self.__solution_of[key] = solution
+        self.__contributions[key] = [0.0] * len(self.__orders)
+
+        touched = {key}
+        for i, order in enumerate(self.__orders):
+            entry = (solution.objectives[i], key)
+            position = bisect_left(order, entry)
+            order.insert(position, entry)
+            touched.update(self.__update_objective(i, position - 1, position + 2))
+        self.__update_distances(touched)
+
+    def __remove(self, key: int) -> None:
+        solution = self.__solution_of.pop(key)
+        del self.__key_of[id(solution)]
+        del self.__contributions[key]
+        del self.__distance[key]
+
+        touched = set()
+        for i, order in enumerate(self.__orders):
+            position = bisect_left(order, (solution.objectives[i], key))
+            del order[position]
+            touched.update(self.__update_objective(i, position - 1, position + 1))
+        self.__update_distances(touched)
+
+    def __update_objective(self, i: int, start: int, end: int) -> List[int]:
+        """ Updates the contributions of objective i of the solutions at positions [start, end) of its sorted order,
+        or of all the solutions if the range of the objective has changed. Returns the keys of the updated solutions """
+        order = self.__orders[i]
+        if not order:  # The last solution has been removed (e.g. all of them are dominated by a new one)
+            self.__ranges[i] = 0.0
+            return []
+
+        objective_range = order[-1][0] - order[0][0]
+        if objective_range != self.__ranges[i]:
+            self.__ranges[i] = objective_range
+            start, end = 0, len(order)
+        start, end = max(start, 0), min(end, len(order))
+
+        keys = []
+        for position in range(start, end):
+            key = order[position][1]
+            if position == 0 or position == len(order) - 1:
+                contribution = float("inf")
+            else:
+                contribution = order[position + 1][0] - order[position - 1][0]
+                if objective_range != 0:
+                    contribution = contribution / objective_range
+            self.__contributions[key][i] = contribution
+            keys.append(key)
+
+        return keys
+
+    def __update_distances(self, keys) -> None:
+        for key in keys:
+            # Same summation order as CrowdingDistance
+            distance = 0.0
+            for contribution in self.__contributions[key]:
+                distance = contribution + distance
+            if distance != self.__distance.get(key):
+                self.__distance[key] = distance
+                heapq.heappush(self.__heap, (distance, key))
+                self.__solution_of[key].attributes["crowding_distance"] = distance
+
+        if len(self.__heap) > 4 * len(self.__distance) + 16:
+            self.__heap = [(distance, key) for key, distance in self.__distance.items()]
+            heapq.heapify(self.__heap)
+
+    def __pop_worst(self) -> int:
+        while True:
+            distance, key = heapq.heappop(self.__heap)
+            if self.__distance.get(key) == distance:
+                return key
+
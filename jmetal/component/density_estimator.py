@@ -1,6 +1,11 @@
 import logging
+from itertools import chain
 from typing import TypeVar, List
 
+import numpy
+
+from jmetal.core.population import Population
+
 S = TypeVar('S')
 
 """
@@ -47,29 +52,37 @@ class CrowdingDistance(DensityEstimator[List[S]]):
             solution_list[1].attributes["crowding_distance"] = float("inf")
             return
 
-        for i in range(len(solution_list)):
-            solution_list[i].attributes["crowding_distance"] = 0.0
-
         number_of_objectives = solution_list[0].number_of_objectives
-
+        if isinstance(solution_list, Population):
+            objectives = solution_list.objectives[:, :number_of_objectives].astype(float)
+        else:
+            objectives = numpy.fromiter(chain.from_iterable([solution.objectives for solution in solution_list]),
+                                        dtype=float)
+            if len(objectives) == size * number_of_objectives:
+                objectives = objectives.reshape(size, number_of_objectives)
+            else:
+                objectives = numpy.array([solution.objectives[:number_of_objectives] for solution in solution_list],
+                                         dtype=float)
+
+        distances = numpy.zeros(size)
+        order = numpy.arange(size)
         for i in range(number_of_objectives):
-            # Sort the population by Obj n
-            solution_list = sorted(solution_list, key=lambda x: x.objectives[i])
-            objective_minn = solution_list[0].objectives[i]
-            objective_maxn = solution_list[len(solution_list) - 1].objectives[i]
-
-            # Set de crowding distance
-            solution_list[0].attributes["crowding_distance"] = float("inf")
-            solution_list[size - 1].attributes["crowding_distance"] = float("inf")
-
-            for j in range(1, size - 1):
-                distance = solution_list[j + 1].objectives[i] - solution_list[j - 1].objectives[i]
-
-                # Check if minimum and maximum are the same (in which case do nothing)
-                if objective_maxn - objective_minn == 0:
-                    logger.info("Minimum and maximum are the same!")
-                else:
-                    distance = distance / (objective_maxn - objective_minn)
-
-                distance += solution_list[j].attributes["crowding_distance"]
-                solution_list[j].attributes["crowding_distance"] = distance
+            # Sort by objective i. The sort is stable and starts from the order of the previous objective, so ties
+            # are broken as when the list is re-sorted for each objective
+            order = order[numpy.argsort(objectives[order, i], kind='stable')]
+            values = objectives[order, i]
+            objective_range = values[-1] - values[0]
+
+            distance = values[2:] - values[:-2]
+            if objective_range != 0:
+                distance = distance / objective_range
+
+            distances[order[1:-1]] = distance + distances[order[1:-1]]
+            distances[order[0]] = float("inf")
+            distances[order[-1]] = float("inf")
+
+        if isinstance(solution_list, Population):
+            solution_list.set_attribute("crowding_distance", distances)
+        else:
+            for solution, distance in zip(solution_list, distances.tolist()):
+                solution.attributes["crowding_distance"] = distance
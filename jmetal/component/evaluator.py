@@ -1,6 +1,12 @@
+import os
+from concurrent.futures import Future
+from multiprocessing import Pool
 from multiprocessing.pool import ThreadPool
 from typing import TypeVar, List, Generic
 
+import numpy
+
+from jmetal.core.population import Population
 from jmetal.core.problem import Problem
 
 S = TypeVar('S')
@@ -10,6 +16,19 @@ class Evaluator(Generic[S]):
     def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
         pass
 
+    def submit(self, solution: S, problem: Problem) -> Future:
+        """ Starts the evaluation of one solution and returns a future resolved with the solution once it has been
+        evaluated. By default the solution is evaluated before returning """
+        future = Future()
+        try:
+            self.evaluate([solution], problem)
+        except Exception as exception:
+            future.set_exception(exception)
+        else:
+            future.set_result(solution)
+
+        return future
+
     @staticmethod
     def evaluate_solution(solution: S, problem: Problem) -> None:
         problem.evaluate(solution)
@@ -33,3 +52,130 @@ class ParallelEvaluator(Evaluator[S]):
         self.pool.map(lambda solution: Evaluator[S].evaluate_solution(solution, problem), solution_list)
 
         return solution_list
+
+    def submit(self, solution: S, problem: Problem) -> Future:
+        future = Future()
+        self.pool.apply_async(Evaluator.evaluate_solution, (solution, problem),
+                              callback=lambda _: future.set_result(solution), error_callback=future.set_exception)
+
+        return future
+
+
+class BatchEvaluator(Evaluator[S]):
+    """ Evaluates all solutions of a float problem with a single call to its evaluate_batch method. Constraints are
+    evaluated with evaluate_constraints_batch if the problem has a vectorized implementation of them, and one solution
+    at a time otherwise. A :class:`Population` is evaluated in place, without building any solution objects.
+    """
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        if not solution_list:
+            return solution_list
+
+        if isinstance(solution_list, Population):
+            variables = solution_list.variables
+            solution_list.objectives[:] = problem.evaluate_batch(variables)
+        else:
+            variables = numpy.array([solution.variables for solution in solution_list], dtype=float)
+            for solution, objectives in zip(solution_list, problem.evaluate_batch(variables).tolist()):
+                solution.objectives = objectives
+
+        if problem.number_of_constraints > 0:
+            constraints = problem.evaluate_constraints_batch(variables)
+            if constraints is None:
+                for solution in solution_list:
+                    problem.evaluate_constraints(solution)
+            else:
+                violated = constraints < 0.0
+                overall_constraint_violation = numpy.where(violated, constraints, 0.0).sum(axis=1)
+                number_of_violated_constraints = violated.sum(axis=1).astype(float)
+                if isinstance(solution_list, Population):
+                    solution_list.set_attribute("overall_constraint_violation", overall_constraint_violation)
+                    solution_list.set_attribute("number_of_violated_constraints", number_of_violated_constraints)
+                else:
+                    overall_constraint_violation = overall_constraint_violation.tolist()
+                    number_of_violated_constraints = number_of_violated_constraints.tolist()
+                    for i, solution in enumerate(solution_list):
+                        solution.attributes["overall_constraint_violation"] = overall_constraint_violation[i]
+                        solution.attributes["number_of_violated_constraints"] = number_of_violated_constraints[i]
+
+        return solution_list
+
+
+_worker_problem = None
+
+
+def _init_worker(problem: Problem) -> None:
+    global _worker_problem
+    _worker_problem = problem
+
+
+def _evaluate_in_worker(solution):
+    attributes = dict(solution.attributes)
+    Evaluator.evaluate_solution(solution, _worker_problem)
+
+    # Only attributes set by the evaluation are sent back
+    changed = {key: value for key, value in solution.attributes.items()
+               if key not in attributes or attributes[key] is not value}
+    return solution.objectives, changed
+
+
+class MultiprocessEvaluator(Evaluator[S]):
+    """ Evaluates solutions in a pool of processes. The problem is sent once to each worker when the pool is started
+    (the pool is started again if a different problem is evaluated). Solutions are dispatched in chunks, and the
+    evaluated objectives and attributes are copied back into the input solutions.
+    """
+
+    def __init__(self, processes: int = None, chunksize: int = None):
+        self.processes = processes
+        self.chunksize = chunksize
+        self.pool = None
+        self.problem = None
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        self.__start(problem)
+
+        chunksize = self.chunksize
+        if chunksize is None:
+            chunksize = max(1, -(-len(solution_list) // (4 * (self.processes or os.cpu_count() or 1))))
+
+        for solution, (objectives, attributes) in zip(
+                solution_list, self.pool.map(_evaluate_in_worker, solution_list, chunksize)):
+            solution.objectives = objectives
+            solution.attributes.update(attributes)
+
+        return solution_list
+
+    def submit(self, solution: S, problem: Problem) -> Future:
+        """ Evaluates one solution in the pool. The future is resolved from the result handler thread of the pool,
+        once the evaluated objectives and attributes have been copied back into the solution """
+        self.__start(problem)
+        future = Future()
+
+        def done(result) -> None:
+            objectives, attributes = result
+            solution.objectives = objectives
+            solution.attributes.update(attributes)
+            future.set_result(solution)
+
+        self.pool.apply_async(_evaluate_in_worker, (solution,), callback=done, error_callback=future.set_exception)
+
+        return future
+
+    def __start(self, problem: Problem) -> None:
+        if self.pool is None or self.problem is not problem:
+            self.close()
+            self.pool = Pool(self.processes, initializer=_init_worker, initargs=(problem,))
+            self.problem = problem
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+            self.problem = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['pool'] = None
+        state['problem'] = None
+        return state
@@ -1,6 +1,8 @@
+import random
 import unittest
 
-from jmetal.component.archive import NonDominatedSolutionListArchive, BoundedArchive, CrowdingDistanceArchive, Archive
+from jmetal.component.archive import NonDominatedSolutionListArchive, BoundedArchive, CrowdingDistanceArchive, Archive, \
+    IncrementalCrowdingDistanceArchive, IndexedNonDominatedSolutionListArchive
 from jmetal.core.solution import Solution
 
 
@@ -360,5 +362,250 @@ class CrowdingDistanceArchiveTestCases(unittest.TestCase):
         self.assertTrue(solution2.attributes["crowding_distance"] < float("inf"))
 
 
+class IncrementalCrowdingDistanceArchiveTestCases(unittest.TestCase):
+
+    def random_solutions(self, size: int, number_of_objectives: int):
+        random.seed(number_of_objectives)
+        solution_list = []
+        for k in range(size):
+            solution = Solution(1, number_of_objectives)
+            x = [random.random() for _ in range(number_of_objectives)]
+            solution.objectives = [v / (sum(x) + 0.01) + random.random() * 0.05 * (1 - k / size) for v in x]
+            solution_list.append(solution)
+
+        return solution_list
+
+    def test_should_constructor_create_an_empty_archive(self):
+        archive = IncrementalCrowdingDistanceArchive[Solution](4)
+
+        self.assertEqual(0, archive.size())
+        self.assertEqual(4, archive.get_max_size())
+
+    def test_should_add_keep_the_same_solutions_as_the_crowding_distance_archive(self):
+        for number_of_objectives in [2, 3]:
+            archive = CrowdingDistanceArchive[Solution](20)
+            incremental_archive = IncrementalCrowdingDistanceArchive[Solution](20)
+
+            for solution in self.random_solutions(1000, number_of_objectives):
+                self.assertEqual(archive.add(solution), incremental_archive.add(solution))
+                self.assertEqual([id(s) for s in archive.get_solution_list()],
+                                 [id(s) for s in incremental_archive.get_solution_list()])
+
+    def test_should_add_remove_the_dominated_solutions(self):
+        archive = IncrementalCrowdingDistanceArchive[Solution](4)
+        solution_list = []
+        for objectives in [[0.0, 3.0], [1.0, 2.0], [2.0, 1.0], [3.0, 0.0], [0.5, 0.5]]:
+            solution = Solution(1, 2)
+            solution.objectives = objectives
+            solution_list.append(solution)
+            archive.add(solution)
+
+        self.assertEqual([solution_list[0], solution_list[3], solution_list[4]], archive.get_solution_list())
+        archive.compute_density_estimator()
+        self.assertEqual(float("inf"), solution_list[0].attributes["crowding_distance"])
+        self.assertEqual(float("inf"), solution_list[3].attributes["crowding_distance"])
+        self.assertEqual(2.0, solution_list[4].attributes["crowding_distance"])
+
+    def test_should_add_a_solution_dominating_the_whole_archive(self):
+        archive = IncrementalCrowdingDistanceArchive[Solution](4)
+        solution1 = Solution(1, 2)
+        solution1.objectives = [0.5, 0.5]
+        solution2 = Solution(1, 2)
+        solution2.objectives = [0.1, 0.1]
+        solution3 = Solution(1, 2)
+        solution3.objectives = [0.0, 0.2]
+
+        self.assertTrue(archive.add(solution1))
+        self.assertTrue(archive.add(solution2))
+        self.assertEqual([solution2], archive.get_solution_list())
+        self.assertTrue(archive.add(solution3))
+
+        self.assertEqual([solution2, solution3], archive.get_solution_list())
+        archive.compute_density_estimator()
+        self.assertEqual(float("inf"), solution2.attributes["crowding_distance"])
+        self.assertEqual(float("inf"), solution3.attributes["crowding_distance"])
+
+    def test_should_add_keep_the_same_solutions_when_the_archive_is_often_dominated(self):
+        for seed in range(50):
+            rand = random.Random(seed)
+            archive = CrowdingDistanceArchive[Solution](5)
+            incremental_archive = IncrementalCrowdingDistanceArchive[Solution](5)
+
+            for k in range(60):
+                solution = Solution(1, 2)
+                solution.objectives = [rand.random() * (1 - k / 60), rand.random() * (1 - k / 60)]
+                self.assertEqual(archive.add(solution), incremental_archive.add(solution))
+                self.assertEqual([id(s) for s in archive.get_solution_list()],
+                                 [id(s) for s in incremental_archive.get_solution_list()])
+
+    def test_should_add_evict_the_oldest_of_the_most_crowded_solutions(self):
+        archive = IncrementalCrowdingDistanceArchive[Solution](3)
+        solution_list = []
+        for objectives in [[0.0, 4.0], [4.0, 0.0], [1.0, 3.0], [3.0, 1.0]]:
+            solution = Solution(1, 2)
+            solution.objectives = objectives
+            solution_list.append(solution)
+            archive.add(solution)
+
+        self.assertEqual([solution_list[0], solution_list[1], solution_list[3]], archive.get_solution_list())
+
+    def test_should_add_return_false_for_a_dominated_solution(self):
+        archive = IncrementalCrowdingDistanceArchive[Solution](3)
+        solution1 = Solution(1, 2)
+        solution1.objectives = [1.0, 1.0]
+        solution2 = Solution(1, 2)
+        solution2.objectives = [2.0, 2.0]
+
+        self.assertTrue(archive.add(solution1))
+        self.assertFalse(archive.add(solution2))
+        self.assertEqual([solution1], archive.get_solution_list())
+
+
+class IndexedNonDominatedSolutionListArchiveTestCases(unittest.TestCase):
+
+    def random_solutions(self, size: int, number_of_objectives: int, levels: int = None, constraints: bool = False):
+        solution_list = []
+        for _ in range(size):
+            solution = Solution(1, number_of_objectives)
+            solution.objectives = [random.randint(0, levels) if levels else random.random()
+                                   for _ in range(number_of_objectives)]
+            if constraints:
+                solution.attributes["overall_constraint_violation"] = -float(random.randint(0, 2))
+            solution_list.append(solution)
+
+        return solution_list
+
+    def assert_same_archive(self, solution_list):
+        archive = NonDominatedSolutionListArchive[Solution]()
+        indexed_archive = IndexedNonDominatedSolutionListArchive[Solution]()
+        batch_archive = IndexedNonDominatedSolutionListArchive[Solution]()
+
+        for solution in solution_list:
+            self.assertEqual(archive.add(solution), indexed_archive.add(solution))
+        batch_archive.add_all(solution_list)
+
+        self.assertEqual([id(s) for s in archive.get_solution_list()],
+                         [id(s) for s in indexed_archive.get_solution_list()])
+        self.assertEqual([id(s) for s in archive.get_solution_list()],
+                         [id(s) for s in batch_archive.get_solution_list()])
+
+    def test_should_add_keep_the_same_solutions_as_the_list_archive_with_two_objectives(self):
+        random.seed(1)
+        self.assert_same_archive(self.random_solutions(1000, 2))
+        self.assert_same_archive(self.random_solutions(1000, 2, levels=20))
+
+    def test_should_add_keep_the_same_solutions_as_the_list_archive_with_a_large_front(self):
+        random.seed(1)
+        solution_list = []
+        for _ in range(700):
+            solution = Solution(1, 3)
+            x = [random.random() for _ in range(3)]
+            solution.objectives = [v / sum(x) + random.random() * 0.01 for v in x]
+            solution_list.append(solution)
+
+        self.assert_same_archive(solution_list)
+
+    def test_should_add_keep_the_same_solutions_as_the_list_archive_with_many_objectives(self):
+        random.seed(1)
+        self.assert_same_archive(self.random_solutions(1000, 3))
+        self.assert_same_archive(self.random_solutions(1000, 4, levels=4))
+
+    def test_should_add_keep_the_same_solutions_as_the_list_archive_with_constraints(self):
+        random.seed(1)
+        self.assert_same_archive(self.random_solutions(600, 2, levels=10, constraints=True))
+
+    def test_should_add_fall_back_to_the_linear_search_with_nan_objectives(self):
+        random.seed(1)
+        solution_list = self.random_solutions(300, 2, levels=10)
+        solution_list[100].objectives[0] = float("nan")
+
+        self.assert_same_archive(solution_list)
+
+    def test_should_add_all_return_false_if_no_solution_is_accepted(self):
+        archive = IndexedNonDominatedSolutionListArchive[Solution]()
+        solution1 = Solution(1, 3)
+        solution1.objectives = [0.0, 0.0, 0.0]
+        solution2 = Solution(1, 3)
+        solution2.objectives = [1.0, 0.0, 0.0]
+
+        self.assertTrue(archive.add_all([solution1]))
+        self.assertFalse(archive.add_all([solution2, solution2]))
+        self.assertEqual([solution1], archive.get_solution_list())
+
+
+class AddAllTestCases(unittest.TestCase):
+
+    def random_solutions(self, size: int, number_of_objectives: int, levels: int, constraints: bool = False):
+        solution_list = []
+        for _ in range(size):
+            solution = Solution(1, number_of_objectives)
+            solution.objectives = [random.randint(0, levels) for _ in range(number_of_objectives)]
+            if constraints:
+                solution.attributes["overall_constraint_violation"] = -float(random.randint(0, 2))
+            solution_list.append(solution)
+
+        return solution_list
+
+    def test_should_archive_add_all_add_the_solutions_one_by_one(self):
+        archive = CrowdingDistanceArchive[Solution](3)
+        solution_list = self.random_solutions(20, 2, 10)
+        expected = CrowdingDistanceArchive[Solution](3)
+        for solution in solution_list:
+            expected.add(solution)
+
+        Archive.add_all(archive, solution_list)
+
+        self.assertEqual(expected.get_solution_list(), archive.get_solution_list())
+
+    def test_should_non_dominated_add_all_be_equal_to_adding_the_solutions_one_by_one(self):
+        random.seed(1)
+        for number_of_objectives, levels, constraints in [(2, 10, False), (3, 5, False), (2, 8, True)]:
+            archive = NonDominatedSolutionListArchive[Solution]()
+            expected = NonDominatedSolutionListArchive[Solution]()
+            for _ in range(10):
+                solution_list = self.random_solutions(30, number_of_objectives, levels, constraints)
+                accepted = [expected.add(solution) for solution in solution_list]
+
+                self.assertEqual(any(accepted), archive.add_all(solution_list))
+                self.assertEqual([id(s) for s in expected.get_solution_list()],
+                                 [id(s) for s in archive.get_solution_list()])
+
+    def test_should_non_dominated_add_all_fall_back_to_one_by_one_with_mixed_constraints(self):
+        random.seed(1)
+        archive = NonDominatedSolutionListArchive[Solution]()
+        expected = NonDominatedSolutionListArchive[Solution]()
+        solution_list = self.random_solutions(30, 2, 5, False) + self.random_solutions(30, 2, 5, True)
+        for solution in solution_list:
+            expected.add(solution)
+
+        archive.add_all(solution_list[:30])
+        archive.add_all(solution_list[30:])
+
+        self.assertEqual([id(s) for s in expected.get_solution_list()], [id(s) for s in archive.get_solution_list()])
+
+    def test_should_crowding_distance_add_all_keep_the_least_crowded_solutions(self):
+        archive = CrowdingDistanceArchive[Solution](3)
+        solution_list = []
+        for objectives in [[0.0, 4.0], [1.0, 3.0], [1.5, 2.5], [4.0, 0.0], [5.0, 5.0]]:
+            solution = Solution(1, 2)
+            solution.objectives = objectives
+            solution_list.append(solution)
+
+        self.assertTrue(archive.add_all(solution_list))
+
+        self.assertEqual([solution_list[0], solution_list[2], solution_list[3]], archive.get_solution_list())
+
+    def test_should_crowding_distance_add_all_return_false_if_no_solution_is_accepted(self):
+        archive = CrowdingDistanceArchive[Solution](3)
+        solution1 = Solution(1, 2)
+        solution1.objectives = [0.0, 0.0]
+        solution2 = Solution(1, 2)
+        solution2.objectives = [1.0, 1.0]
+        archive.add(solution1)
+
+        self.assertFalse(archive.add_all([solution2]))
+        self.assertEqual([solution1], archive.get_solution_list())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,30 @@
+import random
 import unittest
 
 from jmetal.component.density_estimator import CrowdingDistance
+from jmetal.core.population import Population
 from jmetal.core.solution import Solution
 
 
+def pairwise_crowding_distance(solution_list):
+    """ Reference implementation re-sorting the list for each objective. Returns the distances in list order """
+    size = len(solution_list)
+    distances = {id(solution): 0.0 for solution in solution_list}
+    for i in range(solution_list[0].number_of_objectives):
+        solution_list = sorted(solution_list, key=lambda x: x.objectives[i])
+        objective_min = solution_list[0].objectives[i]
+        objective_max = solution_list[size - 1].objectives[i]
+        distances[id(solution_list[0])] = float("inf")
+        distances[id(solution_list[size - 1])] = float("inf")
+        for j in range(1, size - 1):
+            distance = solution_list[j + 1].objectives[i] - solution_list[j - 1].objectives[i]
+            if objective_max - objective_min != 0:
+                distance = distance / (objective_max - objective_min)
+            distances[id(solution_list[j])] += distance
+
+    return distances
+
+
 class CrowdingDistanceTestCases(unittest.TestCase):
     def setUp(self):
         self.crowding = CrowdingDistance()
@@ -85,6 +106,49 @@ class CrowdingDistanceTestCases(unittest.TestCase):
         self.assertEqual(float("inf"), value_from_solution2)
         self.assertGreater(value_from_solution3, value_from_solution4)
 
+    def test_should_the_crowding_distance_be_equal_to_the_pairwise_computation(self):
+        random.seed(1)
+        for levels in [None, 3]:
+            for number_of_objectives in [2, 3, 5]:
+                solution_list = []
+                for _ in range(60):
+                    solution = Solution(1, number_of_objectives)
+                    solution.objectives = [random.randint(0, levels) if levels else random.random()
+                                           for _ in range(number_of_objectives)]
+                    solution_list.append(solution)
+                expected = pairwise_crowding_distance(solution_list)
+
+                self.crowding.compute_density_estimator(solution_list)
+
+                self.assertEqual([expected[id(solution)] for solution in solution_list],
+                                 [solution.attributes["crowding_distance"] for solution in solution_list])
+
+    def test_should_the_crowding_distance_of_solutions_with_equal_objectives_be_finite_inside(self):
+        solution_list = []
+        for _ in range(4):
+            solution = Solution(1, 2)
+            solution.objectives = [1.0, 1.0]
+            solution_list.append(solution)
+
+        self.crowding.compute_density_estimator(solution_list)
+
+        self.assertEqual([float("inf"), 0.0, 0.0, float("inf")],
+                         [solution.attributes["crowding_distance"] for solution in solution_list])
+
+    def test_should_the_crowding_distance_of_a_population_be_set_in_bulk(self):
+        solution_list = []
+        for objectives in [[0.0, 1.0], [1.0, 0.0], [0.5, 0.5]]:
+            solution = Solution(1, 2)
+            solution.variables = [0.0]
+            solution.objectives = objectives
+            solution_list.append(solution)
+        population = Population(1, 2, 0, [0.0], [1.0])
+        population.extend(solution_list)
+
+        self.crowding.compute_density_estimator(population)
+
+        self.assertEqual([float("inf"), float("inf"), 2.0], population.attribute("crowding_distance").tolist())
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
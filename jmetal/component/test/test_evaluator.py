@@ -0,0 +1,173 @@
+import copy
+import random
+import unittest
+from typing import List
+
+import numpy
+
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII
+from jmetal.component.evaluator import SequentialEvaluator, MultiprocessEvaluator, BatchEvaluator
+from jmetal.core.population import Population
+from jmetal.core.problem import FloatProblem
+from jmetal.core.solution import FloatSolution
+from jmetal.operator.crossover import SBX
+from jmetal.operator.mutation import Polynomial
+from jmetal.operator.selection import BinaryTournamentSelection
+from jmetal.problem.multiobjective.constrained import Srinivas
+from jmetal.problem.multiobjective.zdt import ZDT1
+
+
+class BatchEvaluatorTestCases(unittest.TestCase):
+
+    def test_should_evaluate_set_the_objectives_of_all_solutions(self):
+        problem = ZDT1()
+        solutions = [problem.create_solution() for _ in range(10)]
+        expected = SequentialEvaluator().evaluate([copy.copy(solution) for solution in solutions], problem)
+
+        result = BatchEvaluator().evaluate(solutions, problem)
+
+        self.assertIs(solutions, result)
+        for solution, other in zip(solutions, expected):
+            self.assertIsInstance(solution.objectives, list)
+            for value, expected_value in zip(solution.objectives, other.objectives):
+                self.assertAlmostEqual(expected_value, value)
+
+    def test_should_evaluate_set_the_constraint_attributes(self):
+        problem = Srinivas()
+        solutions = [problem.create_solution() for _ in range(50)]
+        expected = SequentialEvaluator().evaluate([copy.copy(solution) for solution in solutions], problem)
+
+        BatchEvaluator().evaluate(solutions, problem)
+
+        for solution, other in zip(solutions, expected):
+            self.assertAlmostEqual(other.attributes['overall_constraint_violation'],
+                                   solution.attributes['overall_constraint_violation'])
+            self.assertEqual(other.attributes['number_of_violated_constraints'],
+                             solution.attributes['number_of_violated_constraints'])
+
+    def test_should_evaluate_a_population_in_place(self):
+        problem = Srinivas()
+        solutions = [problem.create_solution() for _ in range(50)]
+        expected = SequentialEvaluator().evaluate([copy.copy(solution) for solution in solutions], problem)
+        population = Population.from_solutions(solutions)
+
+        result = BatchEvaluator().evaluate(population, problem)
+
+        self.assertIs(population, result)
+        for solution, other in zip(population, expected):
+            numpy.testing.assert_array_almost_equal(other.objectives, solution.objectives)
+            self.assertAlmostEqual(other.attributes['overall_constraint_violation'],
+                                   solution.attributes['overall_constraint_violation'])
+            self.assertEqual(other.attributes['number_of_violated_constraints'],
+                             solution.attributes['number_of_violated_constraints'])
+
+    def test_should_default_submit_evaluate_the_solution_at_once(self):
+        problem = ZDT1()
+        solution = problem.create_solution()
+        expected = SequentialEvaluator().evaluate([copy.copy(solution)], problem)[0]
+
+        future = BatchEvaluator().submit(solution, problem)
+
+        self.assertTrue(future.done())
+        self.assertIs(solution, future.result())
+        for value, expected_value in zip(solution.objectives, expected.objectives):
+            self.assertAlmostEqual(expected_value, value)
+
+    def test_should_default_evaluate_batch_evaluate_each_row(self):
+        problem = ZDT1(5)
+        variables = [[0.1, 0.2, 0.3, 0.4, 0.5], [0.5, 0.4, 0.3, 0.2, 0.1]]
+
+        objectives = FloatProblem.evaluate_batch(problem, variables)
+
+        for row, expected in zip(objectives, problem.evaluate_batch(variables)):
+            self.assertAlmostEqual(expected[0], row[0])
+            self.assertAlmostEqual(expected[1], row[1])
+
+
+class MultiprocessEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = MultiprocessEvaluator(processes=2)
+
+    def tearDown(self):
+        self.evaluator.close()
+
+    def test_should_evaluate_give_the_same_objectives_as_the_sequential_evaluator(self):
+        problem = ZDT1()
+        solutions = [problem.create_solution() for _ in range(20)]
+        expected = [copy.copy(solution) for solution in solutions]
+
+        result = self.evaluator.evaluate(solutions, problem)
+        SequentialEvaluator().evaluate(expected, problem)
+
+        self.assertIs(solutions, result)
+        self.assertEqual([s.objectives for s in expected], [s.objectives for s in solutions])
+
+    def test_should_evaluate_copy_back_the_constraint_attributes(self):
+        problem = Srinivas()
+        solutions = [problem.create_solution() for _ in range(10)]
+        for solution in solutions:
+            solution.attributes['other'] = solution
+
+        self.evaluator.evaluate(solutions, problem)
+        expected = [copy.copy(solution) for solution in solutions]
+        SequentialEvaluator().evaluate(expected, problem)
+
+        for solution, other in zip(solutions, expected):
+            self.assertEqual(other.attributes['overall_constraint_violation'],
+                             solution.attributes['overall_constraint_violation'])
+            self.assertEqual(other.attributes['number_of_violated_constraints'],
+                             solution.attributes['number_of_violated_constraints'])
+            self.assertIs(solution, solution.attributes['other'])
+
+    def test_should_submit_resolve_the_future_with_the_evaluated_solution(self):
+        problem = Srinivas()
+        solutions = [problem.create_solution() for _ in range(10)]
+        expected = SequentialEvaluator().evaluate([copy.copy(solution) for solution in solutions], problem)
+
+        futures = [self.evaluator.submit(solution, problem) for solution in solutions]
+
+        for future, solution, other in zip(futures, solutions, expected):
+            self.assertIs(solution, future.result(timeout=10))
+            self.assertEqual(other.objectives, solution.objectives)
+            self.assertEqual(other.attributes['overall_constraint_violation'],
+                             solution.attributes['overall_constraint_violation'])
+
+    def test_should_submit_set_the_exception_of_a_failed_evaluation(self):
+        problem = ZDT1()
+        solution = problem.create_solution()
+        solution.variables = None
+
+        future = self.evaluator.submit(solution, problem)
+
+        self.assertIsNotNone(future.exception(timeout=10))
+
+    def test_should_pool_be_restarted_only_for_a_different_problem(self):
+        problem = ZDT1()
+        self.evaluator.evaluate([problem.create_solution()], problem)
+        pool = self.evaluator.pool
+        self.evaluator.evaluate([problem.create_solution()], problem)
+
+        self.assertIs(pool, self.evaluator.pool)
+
+        self.evaluator.evaluate([problem.create_solution()], ZDT1())
+
+        self.assertIsNot(pool, self.evaluator.pool)
+
+    def test_should_nsgaii_give_the_same_result_with_the_multiprocess_evaluator(self):
+        def run(evaluator):
+            random.seed(1)
+            problem = ZDT1()
+            algorithm = NSGAII[FloatSolution, List[FloatSolution]](
+                problem=problem, population_size=20, max_evaluations=200,
+                mutation=Polynomial(1.0 / problem.number_of_variables, distribution_index=20),
+                crossover=SBX(1.0, distribution_index=20), selection=BinaryTournamentSelection(),
+                evaluator=evaluator)
+            algorithm.run()
+            return [s.objectives for s in algorithm.get_result()]
+
+        self.assertEqual(run(SequentialEvaluator()), run(self.evaluator))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,14 @@
 import logging
+import random
 import threading
 import time
 from typing import TypeVar, Generic, List
 
+import numpy
+
 from jmetal.component.evaluator import Evaluator, SequentialEvaluator
 from jmetal.core.solution import FloatSolution
+from jmetal.util.checkpoint import Checkpoint, load_checkpoint
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,6 +24,7 @@ class Algorithm(Generic[S, R], threading.Thread):
         self.evaluations: int = 0
         self.start_computing_time: int = 0
         self.total_computing_time: int = 0
+        self.checkpoint: Checkpoint = None
 
     def get_name(self) -> str:
         return type(self).__name__
@@ -30,6 +35,58 @@ class Algorithm(Generic[S, R], threading.Thread):
     def get_current_computing_time(self) -> float:
         return time.time() - self.start_computing_time
 
+    def iterate(self) -> None:
+        """ Main loop of the algorithm, from the current state until the stopping condition is reached """
+        pass
+
+    def get_state(self) -> dict:
+        """ State needed to continue the run: the evaluation counter, the computing time, the state of the `random`
+        module and of the numpy generators of the algorithm and of its components. Subclasses add their population """
+        return {'evaluations': self.evaluations,
+                'computing_time': self.get_current_computing_time(),
+                'random': random.getstate(),
+                'generators': [(names, generator.bit_generator.state) for names, generator in self.__generators()]}
+
+    def set_state(self, state: dict) -> None:
+        self.evaluations = state['evaluations']
+        self.start_computing_time = time.time() - state['computing_time']
+        random.setstate(state['random'])
+        for names, generator_state in state['generators']:
+            # Generators shared by several components are restored as one generator
+            generators = [getattr(self.__owner(name), name.rpartition('.')[2], None) for name in names]
+            generator = next((g for g in generators if isinstance(g, numpy.random.Generator)), None)
+            if generator is None:
+                generator = numpy.random.default_rng()
+            generator.bit_generator.state = generator_state
+            for name in names:
+                setattr(self.__owner(name), name.rpartition('.')[2], generator)
+
+    def update_checkpoint(self) -> None:
+        """ Writes a checkpoint of the state if one is due. It is called at the end of update_progress """
+        if self.checkpoint is not None and self.checkpoint.is_due():
+            self.checkpoint.save(self.get_state())
+
+    def resume(self, path: str) -> None:
+        """ Restores the state stored in a checkpoint file and continues the run, drawing the same random numbers the
+        checkpointed run would have drawn """
+        self.set_state(load_checkpoint(path))
+        self.iterate()
+
+    def __generators(self):
+        """ Numpy generators of the algorithm and of its attributes (e.g. operators), grouped by identity, with the
+        attribute paths which refer to them """
+        generators = {}
+        for name, value in vars(self).items():
+            if isinstance(value, numpy.random.Generator):
+                generators.setdefault(id(value), ([], value))[0].append(name)
+            elif isinstance(getattr(value, '_rng', None), numpy.random.Generator):
+                generators.setdefault(id(value._rng), ([], value._rng))[0].append(name + '._rng')
+
+        return list(generators.values())
+
+    def __owner(self, name: str):
+        return getattr(self, name.partition('.')[0]) if '.' in name else self
+
 
 class EvolutionaryAlgorithm(Algorithm[S, R]):
     def __init__(self, evaluator: Evaluator[S] = SequentialEvaluator[S]()):
@@ -64,6 +121,16 @@ class EvolutionaryAlgorithm(Algorithm[S, R]):
     def get_result(self) -> R:
         pass
 
+    def get_state(self) -> dict:
+        state = super(EvolutionaryAlgorithm, self).get_state()
+        state['population'] = self.population
+
+        return state
+
+    def set_state(self, state: dict) -> None:
+        super(EvolutionaryAlgorithm, self).set_state(state)
+        self.population = state['population']
+
     def run(self):
         """
         Step One: Generate the initial population of individuals randomly. (First generation)
@@ -81,6 +148,9 @@ class EvolutionaryAlgorithm(Algorithm[S, R]):
         self.population = self.evaluate_population(self.population) # Step Two
         self.init_progress()
 
+        self.iterate()
+
+    def iterate(self) -> None:
         while not self.is_stopping_condition_reached(): # Step Three
             mating_population = self.selection(self.population) # Step Three.1
             offspring_population = self.reproduction(mating_population) # Step Three.2
@@ -141,6 +211,16 @@ class ParticleSwarmOptimization(Algorithm[FloatSolution, List[FloatSolution]]):
     def get_result(self) -> R:
         pass
 
+    def get_state(self) -> dict:
+        state = super(ParticleSwarmOptimization, self).get_state()
+        state['swarm'] = self.swarm
+
+        return state
+
+    def set_state(self, state: dict) -> None:
+        super(ParticleSwarmOptimization, self).set_state(state)
+        self.swarm = state['swarm']
+
     def run(self):
         """
         """
@@ -153,6 +233,9 @@ class ParticleSwarmOptimization(Algorithm[FloatSolution, List[FloatSolution]]):
         self.initialize_global_best(self.swarm)
         self.init_progress()
 
+        self.iterate()
+
+    def iterate(self) -> None:
         while not self.is_stopping_condition_reached():
             self.update_velocity(self.swarm)
             self.update_position(self.swarm)
@@ -0,0 +1,307 @@
+from collections.abc import MutableMapping
+from typing import List, Iterable, Union
+
+import numpy
+
+from jmetal.core.solution import FloatSolution
+
+__author__ = "Antonio J. Nebro"
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (bool, int, float, numpy.bool_, numpy.number))
+
+
+class Population:
+    """ Class representing a population of float solutions stored as contiguous matrices.
+
+    Variables and objectives of all the solutions are kept in two matrices (one row per solution) and each attribute
+    is kept as a column with one value per solution. Indexing the population returns row views which behave like
+    :class:`FloatSolution` objects, so the population can be used where a list of solutions is expected.
+    """
+
+    def __init__(self, number_of_variables: int, number_of_objectives: int, number_of_constraints: int,
+                 lower_bound: List[float], upper_bound: List[float], capacity: int = 0):
+        self.number_of_variables = number_of_variables
+        self.number_of_objectives = number_of_objectives
+        self.number_of_constraints = number_of_constraints
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+
+        self.size = 0
+        self._variables = numpy.zeros((capacity, number_of_variables))
+        self._objectives = numpy.zeros((capacity, number_of_objectives))
+        self._attributes = {}  # Attribute name -> (values, mask of solutions having the attribute)
+
+    @classmethod
+    def from_solutions(cls, solutions: Iterable[FloatSolution], number_of_variables: int = None,
+                       number_of_objectives: int = None, number_of_constraints: int = None,
+                       lower_bound: List[float] = None, upper_bound: List[float] = None) -> 'Population':
+        """ Creates a population holding a copy of the given solutions (variables, objectives and attributes).
+        Missing sizes and bounds are taken from the first solution. """
+        solutions = list(solutions)
+        first = solutions[0] if solutions else None
+        population = cls(
+            number_of_variables if number_of_variables is not None else first.number_of_variables,
+            number_of_objectives if number_of_objectives is not None else first.number_of_objectives,
+            number_of_constraints if number_of_constraints is not None else first.number_of_constraints,
+            lower_bound if lower_bound is not None else getattr(first, 'lower_bound', None),
+            upper_bound if upper_bound is not None else getattr(first, 'upper_bound', None),
+            capacity=len(solutions))
+        population.extend(solutions)
+
+        return population
+
+    @property
+    def variables(self) -> numpy.ndarray:
+        """ Population x variables matrix (a view, not a copy) """
+        return self._variables[:self.size]
+
+    @property
+    def objectives(self) -> numpy.ndarray:
+        """ Population x objectives matrix (a view, not a copy) """
+        return self._objectives[:self.size]
+
+    def attribute(self, name: str) -> numpy.ndarray:
+        """ Values of an attribute for all the solutions (a view, not a copy) """
+        return self._attributes[name][0][:self.size]
+
+    def has_attribute(self, name: str) -> numpy.ndarray:
+        """ Mask of the solutions having an attribute """
+        if name not in self._attributes:
+            return numpy.zeros(self.size, dtype=bool)
+        return self._attributes[name][1][:self.size]
+
+    def set_attribute(self, name: str, values) -> None:
+        """ Sets an attribute of all the solutions at once """
+        values = numpy.asarray(values)
+        if values.shape != (self.size,):
+            raise Exception("The number of values is not equal to the size of the population")
+        column = numpy.empty(len(self._variables), dtype=values.dtype)
+        column[:self.size] = values
+        mask = numpy.zeros(len(self._variables), dtype=bool)
+        mask[:self.size] = True
+        self._attributes[name] = (column, mask)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [PopulationSolution(self, i) for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Population index out of range")
+        return PopulationSolution(self, index)
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield PopulationSolution(self, i)
+
+    def __add__(self, other: Iterable[FloatSolution]) -> 'Population':
+        population = self.take(numpy.arange(self.size))
+        population.extend(other)
+
+        return population
+
+    def _reserve(self, capacity: int) -> None:
+        if capacity <= len(self._variables):
+            return
+        capacity = max(capacity, 2 * len(self._variables))
+
+        def grow(array: numpy.ndarray) -> numpy.ndarray:
+            new_array = numpy.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            new_array[:self.size] = array[:self.size]
+            return new_array
+
+        self._variables = grow(self._variables)
+        self._objectives = grow(self._objectives)
+        self._attributes = {name: (grow(values), grow(mask)) for name, (values, mask) in self._attributes.items()}
+
+    def append(self, solution: FloatSolution) -> None:
+        """ Appends a copy of a solution (variables, objectives and attributes) """
+        self._reserve(self.size + 1)
+        self.size += 1
+        row = PopulationSolution(self, self.size - 1)
+        row.variables = solution.variables
+        row.objectives = solution.objectives
+        row.attributes = solution.attributes
+
+    def extend(self, solutions: Iterable[FloatSolution]) -> None:
+        if isinstance(solutions, Population):
+            self._reserve(self.size + solutions.size)
+            first = self.size
+            self.size += solutions.size
+            self._variables[first:self.size] = solutions.variables
+            self._objectives[first:self.size] = solutions.objectives
+            for name, (values, mask) in solutions._attributes.items():
+                if name not in self._attributes:
+                    self._attributes[name] = (numpy.zeros(len(self._variables), dtype=values.dtype),
+                                              numpy.zeros(len(self._variables), dtype=bool))
+                column, column_mask = self._attributes[name]
+                dtype = numpy.result_type(column.dtype, values.dtype)
+                if dtype != column.dtype:
+                    column = column.astype(dtype)
+                    self._attributes[name] = (column, column_mask)
+                mask = mask[:solutions.size]
+                column[first:self.size][mask] = values[:solutions.size][mask]
+                column_mask[first:self.size] |= mask
+        else:
+            for solution in solutions:
+                self.append(solution)
+
+    def take(self, indices) -> 'Population':
+        """ Returns a new population with the solutions at the given indices (in that order) """
+        indices = numpy.asarray(indices, dtype=numpy.int64)
+        population = Population(self.number_of_variables, self.number_of_objectives, self.number_of_constraints,
+                                self.lower_bound, self.upper_bound)
+        population.size = len(indices)
+        population._variables = self._variables[indices]
+        population._objectives = self._objectives[indices]
+        population._attributes = {name: (values[indices], mask[indices])
+                                  for name, (values, mask) in self._attributes.items()}
+
+        return population
+
+    def to_solutions(self) -> List[FloatSolution]:
+        """ Returns independent :class:`FloatSolution` copies of all the solutions, including their attributes """
+        solutions = []
+        for i, (variables, objectives) in enumerate(zip(self.variables.tolist(), self.objectives.tolist())):
+            solution = FloatSolution(self.number_of_variables, self.number_of_objectives,
+                                     self.number_of_constraints, self.lower_bound, self.upper_bound)
+            solution.variables = variables
+            solution.objectives = objectives
+            solution.attributes = dict(PopulationSolution(self, i).attributes)
+            solutions.append(solution)
+
+        return solutions
+
+    def _set_value(self, name: str, index: int, value) -> None:
+        if name not in self._attributes:
+            dtype = numpy.asarray(value).dtype if _is_number(value) else object
+            self._attributes[name] = (numpy.zeros(len(self._variables), dtype=dtype),
+                                      numpy.zeros(len(self._variables), dtype=bool))
+        values, mask = self._attributes[name]
+        if values.dtype != object and numpy.asarray(value).dtype != values.dtype:
+            new_dtype = numpy.result_type(values.dtype, numpy.asarray(value).dtype) \
+                if _is_number(value) else numpy.dtype(object)
+            if new_dtype != values.dtype:
+                values = values.astype(new_dtype)
+                self._attributes[name] = (values, mask)
+        values[index] = value
+        mask[index] = True
+
+
+class PopulationSolution(FloatSolution):
+    """ View of one row of a :class:`Population`. Reading and writing variables, objectives and attributes reads and
+    writes the population matrices. Copying the view returns an independent :class:`FloatSolution`. """
+
+    def __init__(self, population: Population, index: int):
+        self.population = population
+        self.index = index
+
+    @property
+    def number_of_variables(self) -> int:
+        return self.population.number_of_variables
+
+    @property
+    def number_of_objectives(self) -> int:
+        return self.population.number_of_objectives
+
+    @property
+    def number_of_constraints(self) -> int:
+        return self.population.number_of_constraints
+
+    @property
+    def lower_bound(self) -> List[float]:
+        return self.population.lower_bound
+
+    @property
+    def upper_bound(self) -> List[float]:
+        return self.population.upper_bound
+
+    @property
+    def variables(self) -> numpy.ndarray:
+        return self.population._variables[self.index]
+
+    @variables.setter
+    def variables(self, values) -> None:
+        self.population._variables[self.index] = values
+
+    @property
+    def objectives(self) -> numpy.ndarray:
+        return self.population._objectives[self.index]
+
+    @objectives.setter
+    def objectives(self, values) -> None:
+        self.population._objectives[self.index] = values
+
+    @property
+    def attributes(self) -> 'PopulationAttributes':
+        return PopulationAttributes(self.population, self.index)
+
+    @attributes.setter
+    def attributes(self, values: dict) -> None:
+        attributes = PopulationAttributes(self.population, self.index)
+        attributes.clear()
+        attributes.update(values)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, PopulationSolution) and other.population is self.population \
+               and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.population), self.index))
+
+    def __copy__(self) -> FloatSolution:
+        new_solution = FloatSolution(
+            self.number_of_variables,
+            self.number_of_objectives,
+            self.number_of_constraints,
+            self.lower_bound,
+            self.upper_bound)
+        new_solution.objectives = self.objectives.tolist()
+        new_solution.variables = self.variables.tolist()
+
+        return new_solution
+
+
+class PopulationAttributes(MutableMapping):
+    """ Dictionary-like view of the attributes of one row of a :class:`Population` """
+
+    def __init__(self, population: Population, index: int):
+        self.population = population
+        self.index = index
+
+    def __getitem__(self, name: str):
+        if name not in self.population._attributes:
+            raise KeyError(name)
+        values, mask = self.population._attributes[name]
+        if not mask[self.index]:
+            raise KeyError(name)
+        value = values[self.index]
+        return value.item() if isinstance(value, numpy.generic) else value
+
+    def __setitem__(self, name: str, value) -> None:
+        self.population._set_value(name, self.index, value)
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        values, mask = self.population._attributes[name]
+        mask[self.index] = False
+        if values.dtype == object:
+            values[self.index] = None
+
+    def __contains__(self, name) -> bool:
+        return name in self.population._attributes and bool(self.population._attributes[name][1][self.index])
+
+    def __iter__(self):
+        return iter([name for name in self.population._attributes if name in self])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
@@ -1,6 +1,8 @@
 import random
 from typing import Generic, TypeVar
 
+import numpy
+
 import jmetal
 from jmetal.core.solution import BinarySolution, FloatSolution, IntegerSolution
 
@@ -60,6 +62,24 @@ class FloatProblem(Problem[FloatSolution]):
 
         return new_solution
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        """ Evaluates a population x variables matrix and returns the population x objectives matrix. Problems
+        having a vectorized implementation override this method; by default each row is evaluated with evaluate() """
+        objectives = numpy.empty((len(variables), self.number_of_objectives))
+        for i, row in enumerate(numpy.asarray(variables, dtype=float)):
+            solution = FloatSolution(self.number_of_variables, self.number_of_objectives, self.number_of_constraints,
+                                     self.lower_bound, self.upper_bound)
+            solution.variables = row.tolist()
+            self.evaluate(solution)
+            objectives[i] = solution.objectives
+
+        return objectives
+
+    def evaluate_constraints_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        """ Returns the population x constraints matrix of constraint values (negative values are violated
+        constraints), or None if the problem has no vectorized implementation """
+        return None
+
 
 class IntegerProblem(Problem[IntegerSolution]):
     """ Class representing integer problems """
@@ -0,0 +1,113 @@
+import copy
+import unittest
+
+import numpy
+
+from jmetal.component.evaluator import SequentialEvaluator, BatchEvaluator
+from jmetal.core.population import Population
+from jmetal.core.solution import FloatSolution
+from jmetal.operator.mutation import Polynomial
+from jmetal.operator.crossover import SBX
+from jmetal.problem.multiobjective.constrained import Srinivas
+from jmetal.problem.multiobjective.zdt import ZDT1
+
+__author__ = "Antonio J. Nebro"
+
+
+class PopulationTestCases(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.problem = ZDT1(5)
+        self.solutions = [self.problem.create_solution() for _ in range(4)]
+        for i, solution in enumerate(self.solutions):
+            solution.objectives = [float(i), -float(i)]
+            solution.attributes['dominance_ranking'] = i
+        self.population = Population.from_solutions(self.solutions)
+
+    def test_should_from_solutions_copy_variables_objectives_and_attributes(self) -> None:
+        self.assertEqual(4, len(self.population))
+        self.assertEqual((4, 5), self.population.variables.shape)
+        self.assertEqual([s.variables for s in self.solutions], self.population.variables.tolist())
+        self.assertEqual([s.objectives for s in self.solutions], self.population.objectives.tolist())
+        self.assertEqual([0, 1, 2, 3], self.population.attribute('dominance_ranking').tolist())
+
+    def test_should_row_views_behave_like_float_solutions(self) -> None:
+        solution = self.population[1]
+
+        self.assertIsInstance(solution, FloatSolution)
+        self.assertEqual(5, solution.number_of_variables)
+        self.assertEqual(self.problem.lower_bound, solution.lower_bound)
+        self.assertEqual(1, solution.attributes['dominance_ranking'])
+
+        solution.variables[2] = 0.5
+        solution.objectives = [7.0, 8.0]
+        solution.attributes['crowding_distance'] = float('inf')
+
+        self.assertEqual(0.5, self.population.variables[1, 2])
+        self.assertEqual([7.0, 8.0], self.population.objectives[1].tolist())
+        self.assertEqual([False, True, False, False], self.population.has_attribute('crowding_distance').tolist())
+        self.assertEqual({'dominance_ranking': 1, 'crowding_distance': float('inf')}, dict(solution.attributes))
+
+    def test_should_copy_of_a_row_view_return_an_independent_float_solution(self) -> None:
+        solution = copy.copy(self.population[0])
+        solution.variables[0] = 10.0
+
+        self.assertIs(FloatSolution, type(solution))
+        self.assertIsInstance(solution.variables, list)
+        self.assertNotEqual(10.0, self.population.variables[0, 0])
+
+    def test_should_attributes_keep_object_values(self) -> None:
+        self.population[0].attributes['local_best'] = self.solutions[0]
+        self.population[2].attributes['dominance_ranking'] = 0.5
+
+        self.assertIs(self.solutions[0], self.population[0].attributes['local_best'])
+        self.assertNotIn('local_best', self.population[1].attributes)
+        self.assertEqual(0.5, self.population[2].attributes['dominance_ranking'])
+        self.assertEqual(3, self.population[3].attributes['dominance_ranking'])
+
+    def test_should_append_grow_the_population(self) -> None:
+        population = Population(5, 2, 0, self.problem.lower_bound, self.problem.upper_bound)
+        for solution in self.solutions * 3:
+            population.append(solution)
+
+        self.assertEqual(12, len(population))
+        self.assertEqual([s.variables for s in self.solutions * 3], population.variables.tolist())
+        self.assertEqual(3, population[11].attributes['dominance_ranking'])
+
+    def test_should_add_and_take_return_new_populations(self) -> None:
+        joined = self.population + self.population[:2]
+        selected = joined.take([5, 0])
+
+        self.assertEqual(6, len(joined))
+        self.assertEqual(4, len(self.population))
+        self.assertEqual([1, 0], selected.attribute('dominance_ranking').tolist())
+        self.assertEqual([self.solutions[1].variables, self.solutions[0].variables], selected.variables.tolist())
+
+    def test_should_to_solutions_return_independent_solutions(self) -> None:
+        solutions = self.population.to_solutions()
+
+        self.assertEqual([s.variables for s in self.solutions], [s.variables for s in solutions])
+        self.assertEqual({'dominance_ranking': 2}, solutions[2].attributes)
+
+    def test_should_evaluators_and_operators_work_on_row_views(self) -> None:
+        problem = Srinivas()
+        population = Population.from_solutions([problem.create_solution() for _ in range(6)])
+        expected = [copy.copy(solution) for solution in population]
+
+        SequentialEvaluator().evaluate(list(population), problem)
+        SequentialEvaluator().evaluate(expected, problem)
+        numpy.testing.assert_allclose([s.objectives for s in expected], population.objectives)
+        self.assertEqual([s.attributes['number_of_violated_constraints'] for s in expected],
+                         population.attribute('number_of_violated_constraints').tolist())
+
+        BatchEvaluator().evaluate(list(population), problem)
+        numpy.testing.assert_allclose([s.objectives for s in expected], population.objectives)
+
+        offspring = SBX(1.0, 20.0).execute([population[0], population[1]])
+        Polynomial(1.0, 20.0).execute(population[2])
+        self.assertEqual(2, len(offspring))
+        self.assertTrue(numpy.all(population.variables >= -20.0) and numpy.all(population.variables <= 20.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import copy
 import random
-from typing import List
+from typing import List, Tuple
+
+import numpy
 
 from jmetal.core.operator import Crossover
 from jmetal.core.solution import Solution, FloatSolution, BinarySolution
@@ -92,6 +94,64 @@ class SBX(Crossover[FloatSolution, FloatSolution]):
                     offspring[1].variables[i] = value_x2
         return offspring
 
+    def execute_batch(self, parents1: numpy.ndarray, parents2: numpy.ndarray, lower_bound, upper_bound) \
+            -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """ Applies the crossover to all the pairs of parents at once. Row i of the two parent matrices is one pair,
+        with the same semantics as :meth:`execute`. Random numbers are drawn from the numpy generator `self.rng`.
+
+        :return: The two offspring matrices.
+        """
+        x1 = numpy.asarray(parents1, dtype=float)
+        x2 = numpy.asarray(parents2, dtype=float)
+        lower_bound = numpy.asarray(lower_bound, dtype=float)
+        upper_bound = numpy.asarray(upper_bound, dtype=float)
+        rng = self.rng
+
+        apply = rng.random(len(x1)) <= self.probability
+        crossed = rng.random(x1.shape) <= 0.5
+        rand = rng.random(x1.shape)
+        swap = rng.random(x1.shape) <= 0.5
+        crossed &= apply[:, numpy.newaxis] & (numpy.abs(x1 - x2) > self.__EPS)
+
+        y1 = numpy.minimum(x1, x2)
+        y2 = numpy.maximum(x1, x2)
+        exponent = 1.0 / (self.distribution_index + 1.0)
+
+        with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            distance = numpy.where(crossed, y2 - y1, 1.0)
+
+            beta = 1.0 + (2.0 * (y1 - lower_bound) / distance)
+            alpha = 2.0 - numpy.power(beta, -(self.distribution_index + 1.0))
+            betaq = numpy.where(rand <= (1.0 / alpha), numpy.power(rand * alpha, exponent),
+                                numpy.power(1.0 / (2.0 - rand * alpha), exponent))
+            c1 = 0.5 * (y1 + y2 - betaq * (y2 - y1))
+
+            beta = 1.0 + (2.0 * (upper_bound - y2) / distance)
+            alpha = 2.0 - numpy.power(beta, -(self.distribution_index + 1.0))
+            betaq = numpy.where(rand <= (1.0 / alpha), numpy.power(rand * alpha, exponent),
+                                numpy.power(1.0 / (2.0 - rand * alpha), exponent))
+            c2 = 0.5 * (y1 + y2 + betaq * (y2 - y1))
+
+        c1 = numpy.minimum(numpy.maximum(c1, lower_bound), upper_bound)
+        c2 = numpy.minimum(numpy.maximum(c2, lower_bound), upper_bound)
+
+        offspring1 = numpy.where(crossed, numpy.where(swap, c2, c1), x1)
+        offspring2 = numpy.where(crossed, numpy.where(swap, c1, c2), x2)
+
+        return offspring1, offspring2
+
+    @property
+    def rng(self) -> numpy.random.Generator:
+        """ Numpy generator of :meth:`execute_batch`. Unless it is set, it is seeded from the `random` module, so
+        seeding `random` makes batch runs reproducible too """
+        if getattr(self, '_rng', None) is None:
+            self._rng = numpy.random.default_rng(random.getrandbits(64))
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: numpy.random.Generator) -> None:
+        self._rng = rng
+
     def get_number_of_parents(self):
         return 2
 
@@ -1,5 +1,7 @@
 import random
 
+import numpy
+
 from jmetal.core.operator import Mutation
 from jmetal.core.solution import BinarySolution, Solution, FloatSolution, IntegerSolution
 
@@ -74,6 +76,48 @@ class Polynomial(Mutation[FloatSolution]):
 
         return solution
 
+    def execute_batch(self, variables: numpy.ndarray, lower_bound, upper_bound) -> numpy.ndarray:
+        """ Mutates all the rows of a population x variables matrix in place, with the same semantics as
+        :meth:`execute`. Random numbers are drawn from the numpy generator `self.rng`.
+
+        :return: The mutated matrix.
+        """
+        y = variables
+        yl = numpy.asarray(lower_bound, dtype=float)
+        yu = numpy.asarray(upper_bound, dtype=float)
+        rng = self.rng
+
+        mutated = rng.random(y.shape) <= self.probability
+        rnd = rng.random(y.shape)
+        mut_pow = 1.0 / (self.distribution_index + 1.0)
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            delta1 = (y - yl) / (yu - yl)
+            delta2 = (yu - y) / (yu - yl)
+            lower = rnd <= 0.5
+            xy = numpy.where(lower, 1.0 - delta1, 1.0 - delta2)
+            val = numpy.where(lower, 2.0 * rnd + (1.0 - 2.0 * rnd) * numpy.power(xy, self.distribution_index + 1.0),
+                              2.0 * (1.0 - rnd) + 2.0 * (rnd - 0.5) * numpy.power(xy, self.distribution_index + 1.0))
+            deltaq = numpy.where(lower, numpy.power(val, mut_pow) - 1.0, 1.0 - numpy.power(val, mut_pow))
+            new_y = numpy.minimum(numpy.maximum(y + deltaq * (yu - yl), yl), yu)
+
+        new_y = numpy.where(yl == yu, yl, new_y)
+        y[mutated] = new_y[mutated]
+
+        return y
+
+    @property
+    def rng(self) -> numpy.random.Generator:
+        """ Numpy generator of :meth:`execute_batch`. Unless it is set, it is seeded from the `random` module, so
+        seeding `random` makes batch runs reproducible too """
+        if getattr(self, '_rng', None) is None:
+            self._rng = numpy.random.default_rng(random.getrandbits(64))
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: numpy.random.Generator) -> None:
+        self._rng = rng
+
 
 class IntegerPolynomial(Mutation[IntegerSolution]):
     def __init__(self, probability: float, distribution_index: float = 0.20):
@@ -4,7 +4,7 @@ from typing import List, TypeVar
 from jmetal.component.density_estimator import CrowdingDistance
 from jmetal.core.operator import Selection
 from jmetal.util.comparator import Comparator, DominanceComparator
-from jmetal.util.ranking import FastNonDominatedRanking
+from jmetal.util.ranking import FastNonDominatedRanking, Ranking
 
 """ Class implementing a best solution selection operators """
 
@@ -96,24 +96,28 @@ class RandomSolutionSelection(Selection[List[S], S]):
 
 
 class RankingAndCrowdingDistanceSelection(Selection[List[S], List[S]]):
-    def __init__(self, max_population_size: int):
+    def __init__(self, max_population_size: int, ranking: Ranking = None, truncated_ranking: bool = True):
         super(RankingAndCrowdingDistanceSelection, self).__init__()
         self.max_population_size = max_population_size
+        self.ranking = ranking
+        self.truncated_ranking = truncated_ranking
 
     def execute(self, solution_list: List[S]) -> List[S]:
-        ranking = FastNonDominatedRanking()
+        ranking = self.ranking if self.ranking is not None else FastNonDominatedRanking()
         crowding_distance = CrowdingDistance()
-        ranking.compute_ranking(solution_list)
+        # Fronts after the one completing the new population are never used, so they are not ranked
+        ranking.compute_ranking(solution_list, self.max_population_size if self.truncated_ranking else None)
 
         ranking_index = 0
         new_solution_list = []
 
         while len(new_solution_list) < self.max_population_size:
-            if len(ranking.get_subfront(ranking_index)) < self.max_population_size - len(new_solution_list):
-                new_solution_list = new_solution_list + ranking.get_subfront(ranking_index)
+            subfront = ranking.get_subfront(ranking_index)
+            if len(subfront) < self.max_population_size - len(new_solution_list):
+                new_solution_list = new_solution_list + subfront
                 ranking_index += 1
             else:
-                subfront = ranking.get_subfront(ranking_index)
+                # Only the last (partially taken) front needs crowding distances
                 crowding_distance.compute_density_estimator(subfront)
                 sorted_subfront = sorted(subfront, key=lambda x: x.attributes["crowding_distance"], reverse=True)
                 for i in range((self.max_population_size - len(new_solution_list))):
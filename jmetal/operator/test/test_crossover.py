@@ -1,8 +1,12 @@
+import copy
+import random
 import unittest
 from unittest import mock
 
-from jmetal.core.solution import BinarySolution
-from jmetal.operator.crossover import Null, SinglePoint
+import numpy
+
+from jmetal.core.solution import BinarySolution, FloatSolution
+from jmetal.operator.crossover import Null, SinglePoint, SBX
 
 
 class NullCrossoverTestCases(unittest.TestCase):
@@ -121,5 +125,61 @@ class SinglePointTestCases(unittest.TestCase):
         self.assertEqual([True, True, False, True, False, False], offspring[1].variables[1])
         self.assertEqual([True, False, True, True, True, True], offspring[1].variables[2])
 
+class SequenceGenerator:
+    """ Numpy generator replacement returning a fixed sequence of numbers """
+
+    def __init__(self, numbers):
+        self.numbers = list(numbers)
+
+    def random(self, size):
+        count = int(numpy.prod(size))
+        values, self.numbers = self.numbers[:count], self.numbers[count:]
+        return numpy.array(values).reshape(size)
+
+
+class SBXBatchTestCases(unittest.TestCase):
+
+    def test_should_execute_batch_work_as_execute_with_the_same_random_numbers(self):
+        rand = random.Random(1)
+        for _ in range(200):
+            parents = [FloatSolution(1, 2, 0, [-2.0], [3.0]), FloatSolution(1, 2, 0, [-2.0], [3.0])]
+            parents[0].variables = [rand.uniform(-2.0, 3.0)]
+            parents[1].variables = [rand.choice([parents[0].variables[0], rand.uniform(-2.0, 3.0)])]
+            numbers = [rand.random() for _ in range(4)]
+            crossover = SBX(0.9, rand.choice([2.0, 20.0]))
+
+            with mock.patch('random.random', side_effect=copy.copy(numbers)):
+                expected = crossover.execute(parents)
+            crossover.rng = SequenceGenerator(numbers)
+            offspring1, offspring2 = crossover.execute_batch([parents[0].variables], [parents[1].variables],
+                                                             [-2.0], [3.0])
+
+            self.assertAlmostEqual(expected[0].variables[0], offspring1[0, 0])
+            self.assertAlmostEqual(expected[1].variables[0], offspring2[0, 0])
+
+    def test_should_execute_batch_keep_the_offspring_within_the_bounds(self):
+        crossover = SBX(1.0, 20.0)
+        crossover.rng = numpy.random.default_rng(1)
+        lower_bound, upper_bound = numpy.full(30, -1.0), numpy.full(30, 2.0)
+        parents1 = crossover.rng.uniform(-1.0, 2.0, (100, 30))
+        parents2 = crossover.rng.uniform(-1.0, 2.0, (100, 30))
+
+        offspring1, offspring2 = crossover.execute_batch(parents1, parents2, lower_bound, upper_bound)
+
+        for offspring in (offspring1, offspring2):
+            self.assertEqual((100, 30), offspring.shape)
+            self.assertTrue(numpy.all(offspring >= -1.0) and numpy.all(offspring <= 2.0))
+        self.assertTrue(numpy.any(offspring1 != parents1))
+
+    def test_should_execute_batch_return_the_parents_if_the_probability_is_zero(self):
+        crossover = SBX(0.0, 20.0)
+        parents1, parents2 = numpy.zeros((5, 3)), numpy.ones((5, 3))
+
+        offspring1, offspring2 = crossover.execute_batch(parents1, parents2, [0.0] * 3, [1.0] * 3)
+
+        self.assertTrue(numpy.array_equal(parents1, offspring1))
+        self.assertTrue(numpy.array_equal(parents2, offspring2))
+
+
 if __name__ == '__main__':
     unittest.main()
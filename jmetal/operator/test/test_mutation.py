@@ -1,4 +1,9 @@
+import copy
+import random
 import unittest
+from unittest import mock
+
+import numpy
 
 from jmetal.core.solution import BinarySolution, FloatSolution, IntegerSolution
 from jmetal.operator.mutation import BitFlip, Uniform, SimpleRandom, Polynomial, IntegerPolynomial
@@ -226,5 +231,56 @@ class IntegerPolynomialMutationTestCases(unittest.TestCase):
         self.assertNotEqual([1, 2, 3], mutated_solution.variables)
         self.assertEqual([True, True, True], [isinstance(x, int) for x in  mutated_solution.variables])
 
+class SequenceGenerator:
+    """ Numpy generator replacement returning a fixed sequence of numbers """
+
+    def __init__(self, numbers):
+        self.numbers = list(numbers)
+
+    def random(self, size):
+        count = int(numpy.prod(size))
+        values, self.numbers = self.numbers[:count], self.numbers[count:]
+        return numpy.array(values).reshape(size)
+
+
+class PolynomialBatchTestCases(unittest.TestCase):
+
+    def test_should_execute_batch_work_as_execute_with_the_same_random_numbers(self):
+        rand = random.Random(1)
+        for _ in range(200):
+            bounds = rand.choice([([-2.0], [3.0]), ([1.0], [1.0])])
+            solution = FloatSolution(1, 2, 0, bounds[0], bounds[1])
+            solution.variables = [rand.uniform(bounds[0][0], bounds[1][0])]
+            variables = numpy.array([solution.variables])
+            numbers = [rand.random() for _ in range(2)]
+            mutation = Polynomial(0.5, rand.choice([0.2, 20.0]))
+
+            with mock.patch('random.random', side_effect=copy.copy(numbers)):
+                mutation.execute(solution)
+            mutation.rng = SequenceGenerator(numbers)
+            mutation.execute_batch(variables, bounds[0], bounds[1])
+
+            self.assertAlmostEqual(solution.variables[0], variables[0, 0])
+
+    def test_should_execute_batch_keep_the_variables_within_the_bounds(self):
+        mutation = Polynomial(1.0, 20.0)
+        mutation.rng = numpy.random.default_rng(1)
+        variables = mutation.rng.uniform(-1.0, 2.0, (100, 30))
+        original = variables.copy()
+
+        result = mutation.execute_batch(variables, numpy.full(30, -1.0), numpy.full(30, 2.0))
+
+        self.assertIs(variables, result)
+        self.assertTrue(numpy.all(variables >= -1.0) and numpy.all(variables <= 2.0))
+        self.assertTrue(numpy.any(variables != original))
+
+    def test_should_execute_batch_not_change_the_variables_if_the_probability_is_zero(self):
+        variables = numpy.full((4, 3), 0.5)
+
+        Polynomial(0.0).execute_batch(variables, [0.0] * 3, [1.0] * 3)
+
+        self.assertTrue(numpy.all(variables == 0.5))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from hamcrest import *
@@ -7,6 +8,7 @@ from jmetal.operator.selection import BinaryTournamentSelection, BestSolutionSel
     NaryRandomSolutionSelection, \
     RankingAndCrowdingDistanceSelection, BinaryTournament2Selection
 from jmetal.util.comparator import Comparator, SolutionAttributeComparator
+from jmetal.util.ranking import EfficientNonDominatedRanking, FastNonDominatedRanking
 
 __author__ = "Antonio J. Nebro"
 
@@ -281,6 +283,37 @@ class DominanceRankingTestCases(unittest.TestCase):
         self.assertEqual(solution4, list_of_crowding_and_rankings[3])
         self.assertEqual(solution2, list_of_crowding_and_rankings[4])
 
+    def test_should_execute_use_the_given_ranking_strategy(self):
+        solution_list = []
+        for objectives in [[1.0, 0.0], [0.6, 0.6], [0.5, 0.5], [1.1, 0.0], [0.0, 1.0], [1.05, 0.1]]:
+            solution = Solution(2, 2)
+            solution.objectives = objectives
+            solution_list.append(solution)
+        ranking = EfficientNonDominatedRanking()
+        selection = RankingAndCrowdingDistanceSelection(5, ranking)
+
+        result = selection.execute(solution_list)
+
+        self.assertEqual(2, ranking.get_number_of_subfronts())
+        self.assertEqual(5, len(result))
+        self.assertEqual([solution_list[i] for i in [0, 2, 4]], result[:3])
+        self.assertEqual({id(solution_list[1]), id(solution_list[3])}, {id(solution) for solution in result[3:]})
+
+    def test_should_truncated_ranking_select_the_same_solutions(self):
+        random.seed(1)
+        solution_list = []
+        for _ in range(100):
+            solution = Solution(2, 2)
+            solution.objectives = [random.random(), random.random()]
+            solution_list.append(solution)
+
+        expected = RankingAndCrowdingDistanceSelection(40, truncated_ranking=False).execute(solution_list)
+        ranking = FastNonDominatedRanking()
+        result = RankingAndCrowdingDistanceSelection(40, ranking).execute(solution_list)
+
+        self.assertEqual(expected, result)
+        self.assertLess(sum(len(front) for front in ranking.ranked_sublists), 100)
+
 
 class BinaryTournament2TestCases(unittest.TestCase):
 
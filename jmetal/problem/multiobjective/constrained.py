@@ -1,5 +1,7 @@
 from math import pi, cos, atan
 
+import numpy
+
 """ Unconstrained Test problems for multi-objective optimization """
 from jmetal.core.objective import Objective
 from jmetal.core.solution import FloatSolution
@@ -7,7 +9,6 @@ from jmetal.core.solution import FloatSolution
 from jmetal.core.problem import FloatProblem
 from builtins import str
 from typing import List
-from _ast import Str
 from jmetal.util.machine import Machine
 from jmetal.util.task import Task
 from jmetal.util import machine
@@ -31,6 +32,22 @@ class Srinivas(FloatProblem):
     def get_name(self):
         return "Srinivas"
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+        x1 = x[:, 0]
+        x2 = x[:, 1]
+        f1 = 2.0 + (x1 - 2.0) * (x1 - 2.0) + (x2 - 1.0) * (x2 - 1.0)
+        f2 = 9.0 * x1 - (x2 - 1.0) * (x2 - 1.0)
+
+        return numpy.column_stack((f1, f2))
+
+    def evaluate_constraints_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+        x1 = x[:, 0]
+        x2 = x[:, 1]
+
+        return numpy.column_stack((1.0 - (x1 * x1 + x2 * x2) / 225.0, (3.0 * x2 - x1) / 10.0 - 1.0))
+
     class Objective1(Objective):
         def compute(self, solution: FloatSolution, problem: FloatProblem):
             x1 = solution.variables[0]
@@ -84,6 +101,17 @@ class Tanaka(FloatProblem):
     def get_name(self):
         return "Tanaka"
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        return numpy.array(variables, dtype=float)[:, :2]
+
+    def evaluate_constraints_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+        x1 = x[:, 0]
+        x2 = x[:, 1]
+
+        return numpy.column_stack((x1 * x1 + x2 * x2 - 1.0 - 0.1 * numpy.cos(16.0 * numpy.arctan(x1 / x2)),
+                                   -2.0 * ((x1 - 0.5) * (x1 - 0.5) + (x2 - 0.5) * (x2 - 0.5) - 0.5)))
+
     class Objective1(Objective):
         def compute(self, solution: FloatSolution, problem: FloatProblem):
             return solution.variables[0]
@@ -25,6 +25,8 @@
 
 from math import pi, cos
 
+import numpy
+
 from jmetal.core.objective import Objective
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
@@ -81,6 +83,23 @@ class DTLZ1(FloatProblem):
                 aux = self.number_of_objectives - (i + 1)
                 solution.objectives[i] *= 1 - solution.variables[aux]
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+        k = self.number_of_variables - self.number_of_objectives + 1
+        tail = x[:, self.number_of_variables - k:] - 0.5
+        g = 100 * (k + (tail * tail - numpy.cos(20.0 * pi * tail)).sum(axis=1))
+
+        objectives = numpy.empty((len(x), self.number_of_objectives))
+        for i in range(self.number_of_objectives):
+            objectives[:, i] = (1.0 + g) * 0.5
+            for j in range(self.number_of_objectives - (i + 1)):
+                objectives[:, i] *= x[:, j]
+
+            if i != 0:
+                objectives[:, i] *= 1 - x[:, self.number_of_objectives - (i + 1)]
+
+        return objectives
+
     def get_name(self):
         return "DTLZ1"
 
@@ -1,7 +1,10 @@
 import unittest
+
+import numpy
 from math import pi
 
 from jmetal.problem.multiobjective.constrained import Srinivas, Tanaka
+from jmetal.problem.test.batch_evaluation import BatchEvaluationTestMixin
 
 __author__ = "Antonio J. Nebro"
 
@@ -71,5 +74,23 @@ class TanakaTestCases(unittest.TestCase):
         problem = Tanaka()
         self.assertEqual("Tanaka", problem.get_name())
 
+
+class EvaluateBatchTestCases(BatchEvaluationTestMixin, unittest.TestCase):
+
+    def test_should_evaluate_batch_work_as_evaluate(self) -> None:
+        for problem in [Srinivas(), Tanaka()]:
+            self.assert_batch_equals_evaluate(problem)
+
+    def test_should_evaluate_constraints_batch_work_as_evaluate_constraints(self) -> None:
+        for problem in [Srinivas(), Tanaka()]:
+            solutions = [problem.create_solution() for _ in range(50)]
+            constraints = problem.evaluate_constraints_batch(numpy.array([s.variables for s in solutions]))
+
+            for solution, row in zip(solutions, constraints):
+                problem.evaluate_constraints(solution)
+                self.assertAlmostEqual(solution.attributes["overall_constraint_violation"], sum(c for c in row if c < 0))
+                self.assertEqual(solution.attributes["number_of_violated_constraints"], sum(1 for c in row if c < 0))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+import numpy
+
+from jmetal.problem.multiobjective.dtlz import DTLZ1
+
+__author__ = "Antonio J. Nebro"
+
+
+class DTLZ1TestCases(unittest.TestCase):
+
+    def test_should_constructor_create_a_valid_problem_with_default_settings(self) -> None:
+        problem = DTLZ1()
+        self.assertEqual(30, problem.number_of_variables)
+        self.assertEqual(3, problem.number_of_objectives)
+        self.assertEqual(0, problem.number_of_constraints)
+
+    def test_should_evaluate_batch_work_as_evaluate(self) -> None:
+        for problem in [DTLZ1(), DTLZ1(7, 2), DTLZ1(12, 5)]:
+            solutions = [problem.create_solution() for _ in range(20)]
+            objectives = problem.evaluate_batch(numpy.array([solution.variables for solution in solutions]))
+
+            for solution, row in zip(solutions, objectives):
+                problem.evaluate(solution)
+                for expected, value in zip(solution.objectives, row):
+                    self.assertAlmostEqual(expected, value, delta=1e-9 * max(1.0, abs(expected)))
+
+    def test_should_get_name_return_the_right_name(self):
+        self.assertEqual("DTLZ1", DTLZ1().get_name())
+
+
+if __name__ == '__main__':
+    unittest.main()
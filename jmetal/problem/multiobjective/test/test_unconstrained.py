@@ -1,6 +1,7 @@
 import unittest
 
 from jmetal.problem.multiobjective.unconstrained import Kursawe, Fonseca, Schaffer, Viennet2
+from jmetal.problem.test.batch_evaluation import BatchEvaluationTestMixin
 
 __author__ = "Antonio J. Nebro"
 
@@ -206,5 +207,13 @@ class Viennet2TestCases(unittest.TestCase):
         problem = Viennet2()
         self.assertEqual("Viennet2", problem.get_name())
 
+
+class EvaluateBatchTestCases(BatchEvaluationTestMixin, unittest.TestCase):
+
+    def test_should_evaluate_batch_work_as_evaluate(self) -> None:
+        for problem in [Kursawe(), Kursawe(5), Fonseca(), Schaffer(), Viennet2()]:
+            self.assert_batch_equals_evaluate(problem)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 
 from jmetal.problem.multiobjective.zdt import ZDT1, ZDT2, ZDT3, ZDT4, ZDT6
+from jmetal.problem.test.batch_evaluation import BatchEvaluationTestMixin
 
 __author__ = "Antonio J. Nebro"
 
@@ -232,5 +233,13 @@ class ZDT6TestCases(unittest.TestCase):
         problem = ZDT6()
         self.assertEqual("ZDT6", problem.get_name())
 
+
+class EvaluateBatchTestCases(BatchEvaluationTestMixin, unittest.TestCase):
+
+    def test_should_evaluate_batch_work_as_evaluate(self) -> None:
+        for problem in [ZDT1(), ZDT2(), ZDT3(), ZDT4(), ZDT6(), ZDT1(5)]:
+            self.assert_batch_equals_evaluate(problem)
+
+
 if __name__ == '__main__':
     unittest.main()
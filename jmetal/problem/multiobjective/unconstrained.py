@@ -1,5 +1,7 @@
 from math import sqrt, exp, pow, sin
 
+import numpy
+
 from jmetal.core.objective import Objective
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
@@ -24,6 +26,14 @@ class Kursawe(FloatProblem):
     def get_name(self):
         return "Kursawe"
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+        square = x * x
+        f1 = (-10 * numpy.exp(-0.2 * numpy.sqrt(square[:, :-1] + square[:, 1:]))).sum(axis=1)
+        f2 = (numpy.power(numpy.abs(x), 0.8) + 5.0 * numpy.sin(numpy.power(x, 3.0))).sum(axis=1)
+
+        return numpy.column_stack((f1, f2))
+
     class Objective1(Objective):
         def compute(self, solution: FloatSolution, problem: FloatProblem):
             fx = 0.0
@@ -61,6 +71,14 @@ class Fonseca(FloatProblem):
     def get_name(self):
         return "Fonseca"
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+        shift = 1.0 / self.number_of_variables ** 0.5
+        f1 = 1 - numpy.exp(-((x - shift) ** 2).sum(axis=1))
+        f2 = 1 - numpy.exp(-((x + shift) ** 2).sum(axis=1))
+
+        return numpy.column_stack((f1, f2))
+
     class Objective1(Objective):
         def compute(self, solution: FloatSolution, problem: FloatProblem):
             n = problem.number_of_variables
@@ -90,6 +108,11 @@ class Schaffer(FloatProblem):
     def get_name(self):
         return "Schaffer"
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)[:, 0]
+
+        return numpy.column_stack((x ** 2, (x - 2.0) ** 2))
+
     class Objective1(Objective):
         def compute(self, solution: FloatSolution, problem: FloatProblem):
             return solution.variables[0] ** 2
@@ -116,6 +139,16 @@ class Viennet2(FloatProblem):
     def get_name(self):
         return "Viennet2"
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+        x0 = x[:, 0]
+        x1 = x[:, 1]
+        f1 = (x0 - 2) * (x0 - 2) / 2.0 + (x1 + 1) * (x1 + 1) / 13.0 + 3.0
+        f2 = (x0 + x1 - 3.0) * (x0 + x1 - 3.0) / 36.0 + (-x0 + x1 + 2.0) * (-x0 + x1 + 2.0) / 8.0 - 17.0
+        f3 = (x0 + 2 * x1 - 1) * (x0 + 2 * x1 - 1) / 175.0 + (2 * x1 - x0) * (2 * x1 - x0) / 17.0 - 13.0
+
+        return numpy.column_stack((f1, f2, f3))
+
     class Objective1(Objective):
         def compute(self, solution: FloatSolution, problem: FloatProblem):
             x0 = solution.variables[0]
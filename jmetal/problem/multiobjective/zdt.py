@@ -27,6 +27,8 @@
 
 from math import sqrt, exp, pow, sin, pi, cos
 
+import numpy
+
 from jmetal.core.objective import Objective
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
@@ -83,6 +85,14 @@ class ZDT1(FloatProblem):
         def __eval_h(f: float, g: float) -> float:
             return 1.0 - sqrt(f/g)
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+        f1 = x[:, 0]
+        g = 1.0 + 9.0 / (self.number_of_variables - 1) * (x.sum(axis=1) - x[:, 0])
+        f2 = (1.0 - numpy.sqrt(f1 / g)) * g
+
+        return numpy.column_stack((f1, f2))
+
     def get_name(self):
         return "ZDT1"
 
@@ -130,6 +140,14 @@ class ZDT2(FloatProblem):
         def __eval_h(self, f: float, g: float) -> float:
             return 1.0 - pow(f / g, 2.0)
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+        f1 = x[:, 0]
+        g = 1.0 + 9.0 / (self.number_of_variables - 1) * (x.sum(axis=1) - x[:, 0])
+        f2 = (1.0 - numpy.power(f1 / g, 2.0)) * g
+
+        return numpy.column_stack((f1, f2))
+
     def get_name(self):
         return "ZDT2"
 
@@ -177,6 +195,14 @@ class ZDT3(FloatProblem):
         def __eval_h(self, f: float, g: float) -> float:
             return 1.0 - sqrt(f / g) - (f / g) * sin(10.0 * f * pi)
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+        f1 = x[:, 0]
+        g = 1.0 + 9.0 / (self.number_of_variables - 1) * (x.sum(axis=1) - x[:, 0])
+        f2 = (1.0 - numpy.sqrt(f1 / g) - (f1 / g) * numpy.sin(10.0 * f1 * pi)) * g
+
+        return numpy.column_stack((f1, f2))
+
     def get_name(self):
         return "ZDT3"
 
@@ -228,6 +254,15 @@ class ZDT4(FloatProblem):
         def __eval_h(self, f: float, g: float) -> float:
             return 1.0 - sqrt(f / g)
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+        f1 = x[:, 0]
+        rest = x[:, 1:]
+        g = (rest * rest - 10.0 * numpy.cos(4.0 * pi * rest)).sum(axis=1) + 1.0 + 10.0 * (self.number_of_variables - 1)
+        f2 = (1.0 - numpy.sqrt(f1 / g)) * g
+
+        return numpy.column_stack((f1, f2))
+
     def get_name(self):
         return "ZDT4"
 
@@ -277,5 +312,13 @@ class ZDT6(FloatProblem):
         def __eval_h(self, f: float, g: float) -> float:
             return 1.0 - pow(f / g, 2.0)
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+        f1 = 1.0 - numpy.exp(-4.0 * x[:, 0]) * numpy.power(numpy.sin(6.0 * pi * x[:, 0]), 6.0)
+        g = 1.0 + 9.0 * numpy.power((x.sum(axis=1) - x[:, 0]) / (self.number_of_variables - 1), 0.25)
+        f2 = (1.0 - numpy.power(f1 / g, 2.0)) * g
+
+        return numpy.column_stack((f1, f2))
+
     def get_name(self):
         return "ZDT6"
@@ -1,6 +1,7 @@
 import unittest
 
 from jmetal.problem.singleobjective.unconstrained import OneMax, Sphere
+from jmetal.problem.test.batch_evaluation import BatchEvaluationTestMixin
 
 __author__ = "Antonio J. Nebro"
 
@@ -117,5 +118,12 @@ class SphereTestCases(unittest.TestCase):
         self.assertEqual("Sphere", problem.get_name())
 
 
+class EvaluateBatchTestCases(BatchEvaluationTestMixin, unittest.TestCase):
+
+    def test_should_evaluate_batch_work_as_evaluate(self) -> None:
+        self.assert_batch_equals_evaluate(Sphere())
+        self.assert_batch_equals_evaluate(Sphere(3))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,7 @@
 import random
 
+import numpy
+
 from jmetal.core.problem import BinaryProblem, FloatProblem
 from jmetal.core.solution import BinarySolution, FloatSolution
 
@@ -52,5 +54,10 @@ class Sphere(FloatProblem):
 
         solution.objectives[0] = total
 
+    def evaluate_batch(self, variables: numpy.ndarray) -> numpy.ndarray:
+        x = numpy.asarray(variables, dtype=float)
+
+        return (x * x).sum(axis=1)[:, numpy.newaxis]
+
     def get_name(self) -> str:
         return "Sphere"
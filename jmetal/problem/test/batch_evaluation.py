@@ -0,0 +1,16 @@
+import numpy
+
+
+class BatchEvaluationTestMixin:
+    """ Assertions shared by the test cases of the batch evaluation of the problems. To be mixed with
+    :class:`unittest.TestCase` """
+
+    def assert_batch_equals_evaluate(self, problem) -> None:
+        solutions = [problem.create_solution() for _ in range(20)]
+        objectives = problem.evaluate_batch(numpy.array([solution.variables for solution in solutions]))
+
+        self.assertEqual((20, problem.number_of_objectives), objectives.shape)
+        for solution, row in zip(solutions, objectives):
+            problem.evaluate(solution)
+            for expected, value in zip(solution.objectives, row):
+                self.assertAlmostEqual(expected, value, delta=1e-9 * max(1.0, abs(expected)))
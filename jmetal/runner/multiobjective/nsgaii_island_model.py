@@ -0,0 +1,49 @@
+import logging
+from typing import List
+
+from jmetal.algorithm.island import IslandModel
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII
+from jmetal.core.solution import FloatSolution
+from jmetal.operator.crossover import SBX
+from jmetal.operator.mutation import Polynomial
+from jmetal.operator.selection import BinaryTournamentSelection
+from jmetal.problem.multiobjective.zdt import ZDT1
+from jmetal.util.comparator import RankingAndCrowdingDistanceComparator
+from jmetal.util.observable import DefaultObservable
+from jmetal.util.solution_list_output import SolutionListOutput
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def create_algorithm() -> NSGAII:
+    problem = ZDT1()
+    return NSGAII[FloatSolution, List[FloatSolution]](
+        problem=problem,
+        population_size=100,
+        max_evaluations=25000,
+        mutation=Polynomial(1.0/problem.number_of_variables, distribution_index=20),
+        crossover=SBX(1.0, distribution_index=20),
+        selection=BinaryTournamentSelection(RankingAndCrowdingDistanceComparator()),
+        observable=DefaultObservable())
+
+
+def main() -> None:
+    islands = IslandModel[FloatSolution](
+        algorithm_factory=create_algorithm,
+        number_of_islands=4,
+        topology='ring',
+        migration_interval=10,
+        number_of_migrants=5)
+
+    islands.run()
+    result = islands.get_result()
+
+    SolutionListOutput[FloatSolution].print_function_values_to_file("FUN.ZDT1", result)
+
+    logger.info("Algorithm (continuous problem): " + islands.get_name() + " of NSGA-II")
+    logger.info("Islands: " + str(islands.number_of_islands) + ". Evaluations: " + str(islands.evaluations))
+    logger.info("Migrants received: " + str(islands.migrants_received))
+
+if __name__ == '__main__':
+    main()
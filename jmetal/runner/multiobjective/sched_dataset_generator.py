@@ -0,0 +1,33 @@
+'''
+Created on Oct 18, 2026
+
+@author: shambakey1
+@contact: shambakey1@gmail.com
+'''
+
+from jmetal.util.ds_generator import genDataset
+import argparse, json
+
+def main()->None:
+    # Generate synthetic scheduling datasets that can be used instead of the production configuration file, e.g.:
+    # python sched_dataset_generator.py /tmp/sched_ds --datasets 10 --tasks 1000000 --machines 64 --seed 1 \
+    #   --task-length '{"name":"lognormal","mean":3.0,"sigma":1.0,"min":1.0}'
+    parser=argparse.ArgumentParser(description='Generate synthetic scheduling datasets in the format of load_ds')
+    parser.add_argument('out_dir',help='output directory of conf.yml and the CSV files')
+    parser.add_argument('--datasets',type=int,default=1,help='number of datasets')
+    parser.add_argument('--tasks',type=int,default=1000,help='number of tasks in each dataset')
+    parser.add_argument('--machines',type=int,default=16,help='number of machines in each dataset')
+    parser.add_argument('--task-length',type=json.loads,default=None,help='JSON distribution of task length')
+    parser.add_argument('--machine-speed',type=json.loads,default=None,help='JSON distribution of machine speed')
+    parser.add_argument('--machine-cost',type=json.loads,default=None,help='JSON specification of machine cost')
+    parser.add_argument('--machine-energy',type=json.loads,default=None,help='JSON specification of machine energy')
+    parser.add_argument('--machine-types',type=int,default=None,help='number of machine types (heterogeneity)')
+    parser.add_argument('--seed',type=int,default=None)
+    args=parser.parse_args()
+    
+    conf=genDataset(args.out_dir,[(args.tasks,args.machines)]*args.datasets,args.task_length,args.machine_speed,\
+                    args.machine_cost,args.machine_energy,args.machine_types,args.seed)
+    print('Experiments configuration: '+conf)
+    
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import os
+import pickle
+import tempfile
+import time
+
+
+class Checkpoint:
+    """ Periodic checkpoints of the state of an algorithm.
+
+    The state is pickled (binary, highest protocol) as a single object, so references shared between its parts (e.g.
+    solutions held both by the population and by a ranking) are kept. Each checkpoint is written to a temporary file
+    in the same directory, flushed to disk and then renamed over the previous one, so the file at `path` is always a
+    complete checkpoint. A checkpoint is written every `interval` calls to :meth:`update` and, if `min_seconds` is
+    given, only when at least that time has passed since the last one.
+    """
+
+    def __init__(self, path: str, interval: int = 1, min_seconds: float = 0.0):
+        if interval < 1:
+            raise Exception("The checkpoint interval is lower than one: " + str(interval))
+
+        self.path = path
+        self.interval = interval
+        self.min_seconds = min_seconds
+        self.calls = 0
+        self.last_time = time.time()
+
+    def is_due(self) -> bool:
+        """ Counts one call and returns True if a checkpoint has to be written """
+        self.calls += 1
+        return self.calls % self.interval == 0 and time.time() - self.last_time >= self.min_seconds
+
+    def save(self, state: dict) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        self.last_time = time.time()
+
+
+def load_checkpoint(path: str) -> dict:
+    """ Returns the state stored in a checkpoint file """
+    with open(path, 'rb') as f:
+        return pickle.load(f)
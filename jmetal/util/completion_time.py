@@ -0,0 +1,212 @@
+'''
+Created on Oct 18, 2026
+
+@author: shambakey1
+@contact: shambakey1@gmail.com
+'''
+
+import sys
+from typing import List, Tuple
+
+import numpy
+
+from jmetal.util.fleet import FleetMachine, FleetTask, NO_MACHINE, SKIPPED_MACHINE
+from jmetal.util.machine import Machine
+from jmetal.util.task import Task
+
+# Task states mirrored from the 'm' attribute of each task
+UNASSIGNED=0    # t.m is None
+SKIPPED=-1      # t.m==-1 (i.e., task has been investigated, but not assigned, by a threshold phase)
+ASSIGNED=1      # t.m is a machine
+
+
+def taskState(t:Task)->int:
+    ''' Map the machine reference of a task to one of UNASSIGNED, SKIPPED or ASSIGNED
+    @param t: Task to be investigated
+    @type t: Task
+    @return: State of the task
+    @rtype: int
+    '''
+    if not t.m:
+        return UNASSIGNED
+    if isinstance(t.m,int) and t.m==-1:
+        return SKIPPED
+    return ASSIGNED
+
+
+class CompletionTimeMatrix(object):
+    '''
+    NumPy-backed task x machine completion time matrix shared by the MINMIN and MAXMIN family of scheduling \
+    algorithms. Entry [i,j] holds the completion time of task i if it is assigned to machine j. Rows of assigned \
+    tasks are set to infinity, so reductions over the matrix never select them again. Selections follow the same \
+    tie-breaking rules as the original list-based implementations, so assignments are identical.
+    '''
+
+    def __init__(self,mach:List[Machine],tasks:List[Task],ct=None,order:str='C'):
+        '''
+        @param mach: List of machines
+        @type mach: List[Machine]
+        @param tasks: List of tasks
+        @type tasks: List[Task]
+        @param ct: Optional initial completion time matrix (list of rows, or 2D array). Empty rows correspond to already assigned tasks
+        @type ct: List[List[float]] or numpy.ndarray
+        @param order: Memory layout of the matrix. 'F' (column-major) speeds up column updates when rows are rarely scanned as a whole
+        @type order: str
+        '''
+
+        self.mach=mach
+        self.tasks=tasks
+        fleet=self._fleet(mach,tasks)
+        if fleet is not None:   # Read properties directly from the fleet arrays
+            mi=numpy.array([m.idx for m in mach],dtype=numpy.int64)
+            ti=numpy.array([t.idx for t in tasks],dtype=numpy.int64)
+            assignment=fleet.assignment[ti]
+            self.state=numpy.where(assignment==NO_MACHINE,UNASSIGNED,\
+                                   numpy.where(assignment==SKIPPED_MACHINE,SKIPPED,ASSIGNED)).astype(numpy.int8)
+        else:
+            self.state=numpy.array([taskState(t) for t in tasks],dtype=numpy.int8)
+        self.num_skipped=int(numpy.count_nonzero(self.state==SKIPPED))
+
+        if ct is None or len(ct)==0:
+            if fleet is not None:
+                speed,makespan,length=fleet.speed[mi],fleet.makespan[mi],fleet.length[ti]
+            else:
+                speed=numpy.array([m.speed for m in mach],dtype=float)
+                makespan=numpy.array([m.makespan for m in mach],dtype=float)
+                length=numpy.array([t.length for t in tasks],dtype=float)
+            self.ct=makespan[numpy.newaxis,:]+length[:,numpy.newaxis]/speed[numpy.newaxis,:]
+        elif isinstance(ct,numpy.ndarray):
+            self.ct=ct.astype(float)
+        else:
+            self.ct=numpy.array([row if len(row) else [numpy.inf]*len(mach) for row in ct],dtype=float)
+        self.ct=numpy.asarray(self.ct.reshape((len(tasks),len(mach))),order=order)
+
+        # Assigned tasks are never investigated again
+        self.ct[self.state==ASSIGNED]=numpy.inf
+
+    @staticmethod
+    def _fleet(mach:List[Machine],tasks:List[Task]):
+        ''' Return the fleet if all machines and tasks are views of the same fleet, otherwise None '''
+
+        if not mach or not tasks or not isinstance(mach[0],FleetMachine):
+            return None
+        fleet=mach[0].fleet
+        if all(isinstance(m,FleetMachine) and m.fleet is fleet for m in mach) and \
+            all(isinstance(t,FleetTask) and t.fleet is fleet for t in tasks):
+            return fleet
+        return None
+
+    def numUnassigned(self)->int:
+        ''' Number of tasks that have not been assigned yet (i.e., either UNASSIGNED or SKIPPED) '''
+
+        return int(numpy.count_nonzero(self.state!=ASSIGNED))
+
+    def _candidates(self,include_skipped:bool)->numpy.ndarray:
+        ''' Return completion time matrix where rows that should not be investigated are set to infinity
+        @param include_skipped: Whether SKIPPED tasks (i.e., t.m==-1) are investigated
+        @type include_skipped: bool
+        '''
+
+        if include_skipped or not self.num_skipped:
+            return self.ct
+        return numpy.where((self.state==UNASSIGNED)[:,numpy.newaxis],self.ct,numpy.inf)
+
+    def minMin(self)->Tuple[int,int,float]:
+        ''' Find the unassigned task, with corresponding machine, that gives the minimum completion time. Ties are \
+        broken in favour of the lowest task index, then the lowest machine index. SKIPPED tasks are not investigated.
+        @return: Task index, machine index and completion time. Indices are -1 if no task can be found
+        @rtype: Tuple[int,int,float]
+        '''
+
+        ct=self._candidates(False)
+        if ct.size==0:
+            return -1,-1,sys.float_info.max
+        idx=int(numpy.argmin(ct))   # First occurrence in row-major order
+        job_no,machine_no=divmod(idx,ct.shape[1])
+        val=float(ct[job_no,machine_no])
+        if not val<sys.float_info.max:
+            return -1,-1,sys.float_info.max
+        return job_no,machine_no,val
+
+    def maxMin(self,include_skipped:bool=True,thr:float=sys.float_info.max)->Tuple[int,int,float,numpy.ndarray]:
+        ''' For each candidate task, find the machine with minimum completion time that does not exceed the given \
+        threshold (ties are broken in favour of the highest machine index). Then, among these tasks, find the task \
+        with the maximum completion time (ties are broken in favour of the highest task index).
+        @param include_skipped: Whether SKIPPED tasks (i.e., t.m==-1) are investigated
+        @type include_skipped: bool
+        @param thr: Completion time threshold. Machines that give larger completion time are not considered
+        @type thr: float
+        @return: Task index, machine index, completion time, and indices of candidate tasks that have no machine within the threshold
+        @rtype: Tuple[int,int,float,numpy.ndarray]
+        '''
+
+        none=numpy.empty(0,dtype=int)
+        if self.ct.size==0:
+            return -1,-1,0.0,none
+        if include_skipped:
+            rows=numpy.flatnonzero(self.state!=ASSIGNED)
+        else:
+            rows=numpy.flatnonzero(self.state==UNASSIGNED)
+        if rows.size==0:
+            return -1,-1,0.0,none
+
+        ct=self.ct[rows]
+        ct=numpy.where(ct<=thr,ct,numpy.inf)
+        num_mach=ct.shape[1]
+        row_min=ct.min(axis=1)
+        row_arg=num_mach-1-numpy.argmin(ct[:,::-1],axis=1)  # Last occurrence of the minimum in each row
+
+        valid=row_min<numpy.inf
+        if not numpy.any(valid):
+            return -1,-1,0.0,rows
+        vals=numpy.where(valid,row_min,-numpy.inf)
+        k=len(vals)-1-int(numpy.argmax(vals[::-1]))         # Last occurrence of the maximum
+        if not vals[k]>=0.0:
+            return -1,-1,0.0,rows[~valid]
+        return int(rows[k]),int(row_arg[k]),float(vals[k]),rows[~valid]
+
+    def assign(self,job_no:int,machine_no:int,exclude:bool=True)->None:
+        ''' Assign task to machine, and exclude the task from later investigations
+        @param job_no: Task index
+        @type job_no: int
+        @param machine_no: Machine index
+        @type machine_no: int
+        @param exclude: Set completion times of the task to infinity, so reductions over the matrix never select it again
+        @type exclude: bool
+        '''
+
+        self.mach[machine_no].addTask(self.tasks[job_no])
+        if self.state[job_no]==SKIPPED:
+            self.num_skipped-=1
+        self.state[job_no]=ASSIGNED
+        if exclude:
+            self.ct[job_no,:]=numpy.inf
+
+    def skip(self,rows:numpy.ndarray)->None:
+        ''' Mark tasks as investigated but not assigned (i.e., t.m=-1)
+        @param rows: Task indices
+        @type rows: numpy.ndarray
+        '''
+
+        for i in rows:
+            self.tasks[i].m=-1
+        self.num_skipped+=int(numpy.count_nonzero(self.state[rows]!=SKIPPED))
+        self.state[rows]=SKIPPED
+
+    def addToColumn(self,machine_no:int,val:float,include_skipped:bool=False,first:int=0)->None:
+        ''' Increase completion time of not yet assigned tasks on the given machine
+        @param machine_no: Machine index
+        @type machine_no: int
+        @param val: Value to be added
+        @type val: float
+        @param include_skipped: Whether completion times of SKIPPED tasks are modified as well
+        @type include_skipped: bool
+        @param first: Index of the first task to be modified. Tasks before it are known to be assigned
+        @type first: int
+        '''
+
+        if include_skipped or not self.num_skipped:
+            self.ct[first:,machine_no]+=val # Rows of excluded tasks are infinity, so they are not affected
+        else:
+            rows=first+numpy.flatnonzero(self.state[first:]==UNASSIGNED)
+            self.ct[rows,machine_no]+=val
@@ -0,0 +1,229 @@
+'''
+Created on Oct 18, 2026
+
+@author: shambakey1
+@contact: shambakey1@gmail.com
+'''
+
+import os
+from typing import List, Tuple
+
+import numpy
+import pandas as pd
+import yaml
+
+from jmetal.util.ds_index import DS_COL
+
+CHUNK_SIZE=1000000  # Default number of task rows generated and written at once
+
+# Distributions that can be named in a distribution specification, with their required parameters
+DISTRIBUTIONS={'constant':['value'],
+               'uniform':['low','high'],
+               'normal':['mean','std'],
+               'lognormal':['mean','sigma'],
+               'exponential':['scale'],
+               'pareto':['shape','scale'],
+               'choice':['values']}
+
+
+def checkDistribution(dist:dict)->None:
+    '''
+    Check that a distribution specification names a known distribution with all its parameters
+    @param dist: Distribution specification (e.g., {'name':'uniform','low':1,'high':100}). Optional 'min' and 'max' \
+    keys clip the sampled values. For 'choice', an optional 'p' key gives the probability of each value
+    @type dist: dict
+    '''
+
+    if dist.get('name') not in DISTRIBUTIONS:
+        raise Exception("Unknown distribution: "+str(dist.get('name')))
+    missing=[p for p in DISTRIBUTIONS[dist['name']] if p not in dist]
+    if missing:
+        raise Exception("Missing parameters of "+dist['name']+" distribution: "+', '.join(missing))
+
+def sampleDistribution(rng:numpy.random.Generator,dist:dict,size:int)->numpy.ndarray:
+    '''
+    Draw values from a distribution specification
+    @param rng: Random generator
+    @type rng: numpy.random.Generator
+    @param dist: Distribution specification (see @checkDistribution)
+    @type dist: dict
+    @param size: Number of values
+    @type size: int
+    @return: Sampled values
+    @rtype: numpy.ndarray
+    '''
+
+    checkDistribution(dist)
+    name=dist['name']
+    if name=='constant':
+        val=numpy.full(size,float(dist['value']))
+    elif name=='uniform':
+        val=rng.uniform(dist['low'],dist['high'],size)
+    elif name=='normal':
+        val=rng.normal(dist['mean'],dist['std'],size)
+    elif name=='lognormal':
+        val=rng.lognormal(dist['mean'],dist['sigma'],size)
+    elif name=='exponential':
+        val=rng.exponential(dist['scale'],size)
+    elif name=='pareto':
+        val=(rng.pareto(dist['shape'],size)+1.0)*dist['scale']    # Classical Pareto with minimum value 'scale'
+    else:
+        val=rng.choice(numpy.asarray(dist['values'],dtype=float),size,p=dist.get('p'))
+    if 'min' in dist or 'max' in dist:
+        val=numpy.clip(val,dist.get('min'),dist.get('max'))
+    return val
+
+def _positive(val:numpy.ndarray,what:str)->numpy.ndarray:
+    if len(val) and val.min()<=0:
+        raise Exception("Non-positive "+what+" sampled. Use the 'min' key of the distribution to clip values")
+    return val
+
+def _machineAttribute(rng:numpy.random.Generator,spec:dict,speed:numpy.ndarray)->numpy.ndarray:
+    ''' Sample a machine attribute (i.e., cost or energy). The 'speed' specification {'name':'speed','factor':f, \
+    'exponent':e} makes the attribute f*speed^e, so faster machines can be made more expensive '''
+
+    if spec.get('name')=='speed':
+        return spec.get('factor',1.0)*speed**spec.get('exponent',1.0)
+    return sampleDistribution(rng,spec,len(speed))
+
+def genMachineColumns(rng:numpy.random.Generator,ds_id:int,n_machines:int,speed:dict,cost:dict=None,\
+                      energy:dict=None,machine_types:int=None)->pd.DataFrame:
+    '''
+    Generate machines configuration of one dataset, in the format expected by genMachines
+    @param rng: Random generator
+    @type rng: numpy.random.Generator
+    @param ds_id: Dataset ID
+    @type ds_id: int
+    @param n_machines: Number of machines
+    @type n_machines: int
+    @param speed: Distribution specification of machine speed
+    @type speed: dict
+    @param cost: Optional specification of cost per time unit (distribution, or relation to speed). The 'cost' column \
+    is written only if given
+    @type cost: dict
+    @param energy: Optional specification of energy consumption, as for cost
+    @type energy: dict
+    @param machine_types: Optional number of machine types controlling heterogeneity. Machine profiles (speed, cost, \
+    energy) are drawn once per type, and each machine gets a random type. 1 gives homogeneous machines. If not \
+    given, each machine has its own profile (i.e., fully heterogeneous)
+    @type machine_types: int
+    @return: Machines configuration with 'dataset_conf_id', 'machine_id', 'speed' and optional 'cost' and 'energy' columns
+    @rtype: DataFrame
+    '''
+
+    n_profiles=n_machines if machine_types is None else int(machine_types)
+    if n_profiles<1:
+        raise Exception("The number of machine types is lower than one: "+str(machine_types))
+    profiles={'speed':_positive(sampleDistribution(rng,speed,n_profiles),'machine speed')}
+    if cost is not None:
+        profiles['cost']=_machineAttribute(rng,cost,profiles['speed'])
+    if energy is not None:
+        profiles['energy']=_machineAttribute(rng,energy,profiles['speed'])
+    types=numpy.arange(n_machines) if machine_types is None else rng.integers(0,n_profiles,n_machines)
+
+    cols={DS_COL:numpy.full(n_machines,ds_id),'machine_id':numpy.arange(n_machines)}
+    for c,val in profiles.items():
+        cols[c]=val[types]
+    return pd.DataFrame(cols)
+
+def genTaskChunks(rng:numpy.random.Generator,ds_id:int,n_tasks:int,length:dict,chunk_size:int=CHUNK_SIZE):
+    '''
+    Generate tasks configuration of one dataset as a stream of chunks, in the format expected by genTasks
+    @param rng: Random generator
+    @type rng: numpy.random.Generator
+    @param ds_id: Dataset ID
+    @type ds_id: int
+    @param n_tasks: Number of tasks
+    @type n_tasks: int
+    @param length: Distribution specification of task length
+    @type length: dict
+    @param chunk_size: Maximum number of tasks in each chunk
+    @type chunk_size: int
+    @return: Generator of tasks configurations with 'dataset_conf_id', 'task_id' and 'length' columns
+    @rtype: Iterator[DataFrame]
+    '''
+
+    for start in range(0,n_tasks,chunk_size):
+        n=min(chunk_size,n_tasks-start)
+        yield pd.DataFrame({DS_COL:numpy.full(n,ds_id),'task_id':numpy.arange(start,start+n),\
+                            'length':_positive(sampleDistribution(rng,length,n),'task length')})
+
+def genDataset(out_dir:str,datasets:List[Tuple[int,int]],task_length:dict=None,machine_speed:dict=None,\
+               machine_cost:dict=None,machine_energy:dict=None,machine_types:int=None,seed:int=None,sep:str=';',\
+               chunk_size:int=CHUNK_SIZE,objectives:List[dict]=None,algorithms:List[str]=None,iterations:int=1,\
+               results_path:str=None)->str:
+    '''
+    Generate a synthetic scheduling experiments configuration that can be loaded by load_ds: conf.yml, and the \
+    ds_conf, ds_cons, machines and tasks CSV files it points to. Tasks are generated and appended to the tasks file \
+    in chunks, so memory does not depend on the number of tasks. Each dataset draws from its own random stream \
+    (spawned from the seed), so a dataset is the same whatever the other datasets are
+    @param out_dir: Output directory (created if it does not exist)
+    @type out_dir: str
+    @param datasets: Number of tasks and number of machines of each dataset (at least one of each, as the scheduling \
+    algorithms need them). Dataset IDs are 1, 2, ... in this order
+    @type datasets: List[Tuple[int,int]]
+    @param task_length: Distribution specification of task length (default is uniform in [1,100])
+    @type task_length: dict
+    @param machine_speed: Distribution specification of machine speed (default is uniform in [1,10])
+    @type machine_speed: dict
+    @param machine_cost: Optional specification of machine cost (see @genMachineColumns)
+    @type machine_cost: dict
+    @param machine_energy: Optional specification of machine energy (see @genMachineColumns)
+    @type machine_energy: dict
+    @param machine_types: Optional number of machine types in each dataset (see @genMachineColumns)
+    @type machine_types: int
+    @param seed: Optional seed. If not given, datasets are different in each call
+    @type seed: int
+    @param sep: Separator of CSV files
+    @type sep: str
+    @param chunk_size: Maximum number of task rows generated and written at once
+    @type chunk_size: int
+    @param objectives: Scheduling objectives written to conf.yml (default is makespan with weight 1)
+    @type objectives: List[dict]
+    @param algorithms: Scheduling algorithms written to conf.yml (default is MINMIN)
+    @type algorithms: List[str]
+    @param iterations: Number of iterations written to conf.yml
+    @type iterations: int
+    @param results_path: Results path written to conf.yml (default is a 'results' directory in out_dir)
+    @type results_path: str
+    @return: Path to conf.yml
+    @rtype: str
+    '''
+
+    task_length=task_length or {'name':'uniform','low':1.0,'high':100.0}
+    machine_speed=machine_speed or {'name':'uniform','low':1.0,'high':10.0}
+    for dist in [task_length,machine_speed]+[d for d in [machine_cost,machine_energy] if d and d.get('name')!='speed']:
+        checkDistribution(dist)
+    if chunk_size<1:
+        raise Exception("The chunk size is lower than one: "+str(chunk_size))
+    for ds_id,(n_tasks,n_machines) in enumerate(datasets,1):
+        if n_tasks<1 or n_machines<1:
+            raise Exception("Dataset "+str(ds_id)+" has no tasks or no machines: "+str((n_tasks,n_machines)))
+
+    os.makedirs(out_dir,exist_ok=True)
+    paths={f:os.path.join(os.path.abspath(out_dir),f+'.csv') for f in ['ds_conf','ds_cons','machines','tasks']}
+    results_path=results_path or os.path.join(os.path.abspath(out_dir),'results')
+    os.makedirs(results_path,exist_ok=True)
+
+    pd.DataFrame({'id':numpy.arange(1,len(datasets)+1),'machines':[m for _,m in datasets],\
+                  'tasks':[t for t,_ in datasets]}).to_csv(paths['ds_conf'],sep=sep,index=False)
+    pd.DataFrame(columns=['name','value']).to_csv(paths['ds_cons'],sep=sep,index=False)   # No constraints
+
+    streams=numpy.random.SeedSequence(seed).spawn(len(datasets))
+    header=True
+    with open(paths['machines'],'w') as mach_f,open(paths['tasks'],'w') as task_f:
+        for ds_id,((n_tasks,n_machines),stream) in enumerate(zip(datasets,streams),1):
+            rng=numpy.random.default_rng(stream)
+            genMachineColumns(rng,ds_id,n_machines,machine_speed,machine_cost,machine_energy,machine_types)\
+                .to_csv(mach_f,sep=sep,index=False,header=header)
+            for chunk in genTaskChunks(rng,ds_id,n_tasks,task_length,chunk_size):
+                chunk.to_csv(task_f,sep=sep,index=False,header=header)
+                header=False
+
+    conf={name:{'path':path,'sep':sep} for name,path in paths.items()}
+    conf.update({'objectives':objectives or [{'name':'makespan','weight':1.0}],'algorithms':algorithms or ['MINMIN'],\
+                 'results_path':results_path,'ds_id':['all'],'iter':int(iterations)})
+    conf_path=os.path.join(os.path.abspath(out_dir),'conf.yml')
+    with open(conf_path,'w') as f:
+        yaml.safe_dump(conf,f,default_flow_style=False,sort_keys=False)
+    return conf_path
@@ -0,0 +1,158 @@
+'''
+Created on Oct 18, 2026
+
+@author: shambakey1
+@contact: shambakey1@gmail.com
+'''
+
+import hashlib
+import os
+import tempfile
+from typing import List
+
+import numpy
+import pandas as pd
+
+from jmetal.util.fleet import Fleet
+from jmetal.util.machine import Machine
+from jmetal.util.task import Task
+
+DS_COL='dataset_conf_id'    # Column that identifies the dataset of each machine/task row
+
+
+class DatasetIndex(object):
+    '''
+    Columnar index over the machines and tasks configurations of all datasets. Rows are grouped once by dataset \
+    ID into contiguous column arrays, so machines, tasks or fleets of one dataset are generated in O(rows in dataset) \
+    instead of scanning the whole configuration for each dataset.
+    '''
+
+    def __init__(self,machines:pd.DataFrame,tasks:pd.DataFrame):
+        '''
+        @param machines: Machines configuration of all datasets. The important columns are 'dataset_conf_id', 'machine_id' and 'speed'
+        @type machines: DataFrame
+        @param tasks: Tasks configuration of all datasets. The important columns are 'dataset_conf_id', 'task_id' and 'length'
+        @type tasks: DataFrame
+        '''
+
+        self.mach_cols,self.mach_ids,self.mach_bounds=self._group(machines)
+        self.task_cols,self.task_ids,self.task_bounds=self._group(tasks)
+
+    @staticmethod
+    def _group(df:pd.DataFrame):
+        ''' Stable sort rows by dataset ID, then return the columns as arrays, the sorted unique dataset IDs, and \
+        the start of each dataset group (with the total number of rows appended) '''
+
+        cols={c:df[c].to_numpy() for c in df.columns}
+        order=numpy.argsort(cols[DS_COL],kind='stable')
+        cols={c:numpy.ascontiguousarray(a[order]) for c,a in cols.items()}
+        ids,starts=numpy.unique(cols[DS_COL],return_index=True)
+        return cols,ids,numpy.append(starts,len(order))
+
+    @staticmethod
+    def _slice(ids:numpy.ndarray,bounds:numpy.ndarray,ds_id:int)->slice:
+        k=int(numpy.searchsorted(ids,ds_id))
+        if k==len(ids) or ids[k]!=ds_id:
+            return slice(0,0)
+        return slice(int(bounds[k]),int(bounds[k+1]))
+
+    def datasetIds(self)->List[int]:
+        ''' Dataset IDs that have machines or tasks '''
+
+        return sorted(set(self.mach_ids.tolist())|set(self.task_ids.tolist()))
+
+    def machineColumns(self,ds_id:int)->dict:
+        ''' Machine configuration columns of one dataset, as array views (no copy) '''
+
+        s=self._slice(self.mach_ids,self.mach_bounds,ds_id)
+        return {c:a[s] for c,a in self.mach_cols.items()}
+
+    def taskColumns(self,ds_id:int)->dict:
+        ''' Task configuration columns of one dataset, as array views (no copy) '''
+
+        s=self._slice(self.task_ids,self.task_bounds,ds_id)
+        return {c:a[s] for c,a in self.task_cols.items()}
+
+    def getMachines(self,ds_id:int)->List[Machine]:
+        ''' Same as genMachines, but in O(machines in dataset) '''
+
+        cols=self.machineColumns(ds_id)
+        return [Machine(ds_id,i,s) for i,s in zip(cols['machine_id'].tolist(),cols['speed'].tolist())]
+
+    def getTasks(self,ds_id:int)->List[Task]:
+        ''' Same as genTasks, but in O(tasks in dataset) '''
+
+        cols=self.taskColumns(ds_id)
+        return [Task(ds_id,i,l) for i,l in zip(cols['task_id'].tolist(),cols['length'].tolist())]
+
+    def getFleet(self,ds_id:int)->Fleet:
+        ''' Fleet of one dataset. Optional 'cost' and 'energy' machine columns are used if they exist '''
+
+        m=self.machineColumns(ds_id)
+        t=self.taskColumns(ds_id)
+        return Fleet(ds_id,m['machine_id'],m['speed'],t['task_id'],t['length'],m.get('cost'),m.get('energy'))
+
+    def machinesFrame(self)->pd.DataFrame:
+        ''' Machines configuration (grouped by dataset ID) as a DataFrame '''
+
+        return pd.DataFrame(self.mach_cols)
+
+    def tasksFrame(self)->pd.DataFrame:
+        ''' Tasks configuration (grouped by dataset ID) as a DataFrame '''
+
+        return pd.DataFrame(self.task_cols)
+
+    def save(self,path:str,key:str='')->None:
+        ''' Save index to a NPZ file. The file is written to a temporary file first, then renamed
+        @param path: Path to the NPZ file
+        @type path: str
+        @param key: Cache key stored with the index
+        @type key: str
+        '''
+
+        arrays={'key':numpy.array(key)}
+        for prefix,cols in (('m_',self.mach_cols),('t_',self.task_cols)):
+            for c,a in cols.items():
+                arrays[prefix+c]=a.astype(str) if a.dtype==object else a
+        fd,tmp=tempfile.mkstemp(suffix='.npz',dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd,'wb') as f:
+                numpy.savez(f,**arrays)
+            os.replace(tmp,path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    @classmethod
+    def load(cls,path:str,key:str=None):
+        ''' Load index from a NPZ file
+        @param path: Path to the NPZ file
+        @type path: str
+        @param key: Expected cache key. If given and different from the stored key, None is returned
+        @type key: str
+        @rtype: DatasetIndex
+        '''
+
+        with numpy.load(path,allow_pickle=False) as f:
+            if key is not None and str(f['key'])!=key:
+                return None
+            mach={n[2:]:f[n] for n in f.files if n.startswith('m_')}
+            tasks={n[2:]:f[n] for n in f.files if n.startswith('t_')}
+        idx=cls.__new__(cls)
+        idx.mach_cols,idx.mach_ids,idx.mach_bounds=cls._group(pd.DataFrame(mach))
+        idx.task_cols,idx.task_ids,idx.task_bounds=cls._group(pd.DataFrame(tasks))
+        return idx
+
+
+def cacheKey(*files:dict)->str:
+    ''' Key of the on-disk cache. The key changes if any of the input files is modified
+    @param files: File descriptions as in the configuration file (i.e., dictionaries with 'path' and 'sep')
+    @type files: dict
+    @rtype: str
+    '''
+
+    parts=[]
+    for f in files:
+        st=os.stat(f['path'])
+        parts.append('|'.join([os.path.abspath(f['path']),str(f.get('sep')),str(st.st_mtime_ns),str(st.st_size)]))
+    return hashlib.sha1('\n'.join(parts).encode()).hexdigest()
@@ -0,0 +1,345 @@
+'''
+Created on Oct 18, 2026
+
+@author: shambakey1
+@contact: shambakey1@gmail.com
+'''
+
+from typing import List
+
+import numpy
+from pandas import DataFrame
+
+from jmetal.util.machine import Machine
+from jmetal.util.task import Task
+
+# Special values of the task to machine assignment array
+NO_MACHINE=-1       # Task is not assigned (i.e., t.m is None)
+SKIPPED_MACHINE=-2  # Task has been investigated, but not assigned, by a threshold phase (i.e., t.m==-1)
+
+
+class Fleet(object):
+    '''
+    Compact struct-of-arrays representation of a set of machines and a set of tasks. Machine properties (speed, cost, \
+    energy and makespan) and task properties (ID and length) are kept in NumPy arrays, and the assignment of tasks to \
+    machines is kept in a single integer array. Tasks of each machine are chained in an array-backed doubly linked list, \
+    so adding and removing tasks take O(1) time while keeping the order in which tasks were added to the machine.
+    Views returned by @machines and @tasks behave like lists of Machine and Task objects, so heuristics in sched_utils \
+    (and scheduling algorithms) can run on the fleet directly.
+    '''
+
+    def __init__(self,ds_conf_id:int,machine_id,speed,task_id,length,cost=None,energy=None):
+        '''
+        @param ds_conf_id: The specific dataset ID
+        @type ds_conf_id: int
+        @param machine_id: Machines IDs
+        @type machine_id: array_like
+        @param speed: Machines speeds
+        @type speed: array_like
+        @param task_id: Tasks IDs
+        @type task_id: array_like
+        @param length: Tasks lengths
+        @type length: array_like
+        @param cost: Optional cost per time unit for each machine (default is 0.0)
+        @type cost: array_like
+        @param energy: Optional energy consumption for each machine (default is 0.0)
+        @type energy: array_like
+        '''
+
+        self.ds_conf_id=int(ds_conf_id)
+
+        # Machines
+        self.machine_id=numpy.array(machine_id,dtype=numpy.int64).ravel()
+        num_mach=len(self.machine_id)
+        self.speed=numpy.array(speed,dtype=float).ravel()
+        self.cost=numpy.zeros(num_mach) if cost is None else numpy.array(cost,dtype=float).ravel()
+        self.energy=numpy.zeros(num_mach) if energy is None else numpy.array(energy,dtype=float).ravel()
+        self.makespan=numpy.zeros(num_mach)
+        self.head=numpy.full(num_mach,-1,dtype=numpy.int64)  # First task assigned to each machine
+        self.tail=numpy.full(num_mach,-1,dtype=numpy.int64)  # Last task assigned to each machine
+        self.count=numpy.zeros(num_mach,dtype=numpy.int64)   # Number of tasks assigned to each machine
+
+        # Tasks
+        self.task_id=numpy.array(task_id,dtype=numpy.int64).ravel()
+        num_tasks=len(self.task_id)
+        self.length=numpy.array(length,dtype=float).ravel()
+        self.assignment=numpy.full(num_tasks,NO_MACHINE,dtype=numpy.int64)
+        self.next=numpy.full(num_tasks,-1,dtype=numpy.int64)  # Next task on the same machine
+        self.prev=numpy.full(num_tasks,-1,dtype=numpy.int64)  # Previous task on the same machine
+
+        if len(self.speed)!=num_mach or len(self.cost)!=num_mach or len(self.energy)!=num_mach:
+            raise Exception("Machine arrays must have the same length")
+        if len(self.length)!=num_tasks:
+            raise Exception("Task arrays must have the same length")
+
+        self._mach_views=None
+        self._task_views=None
+
+    def numMachines(self)->int:
+        return len(self.machine_id)
+
+    def numTasks(self)->int:
+        return len(self.task_id)
+
+    def addTask(self,task_no:int,machine_no:int)->None:
+        ''' Add a task to a machine in O(1)
+        @param task_no: Task index
+        @type task_no: int
+        @param machine_no: Machine index
+        @type machine_no: int
+        '''
+
+        if self.assignment[task_no]>=0:
+            raise Exception("Task "+str(self.task_id[task_no])+" is already assigned")
+        last=self.tail[machine_no]
+        self.prev[task_no]=last
+        self.next[task_no]=-1
+        if last==-1:
+            self.head[machine_no]=task_no
+        else:
+            self.next[last]=task_no
+        self.tail[machine_no]=task_no
+        self.count[machine_no]+=1
+        self.makespan[machine_no]+=self.length[task_no]/self.speed[machine_no]  # Same operation order as Machine.addTask
+        self.assignment[task_no]=machine_no
+
+    def remTask(self,task_no:int)->None:
+        ''' Remove a task from its machine in O(1)
+        @param task_no: Task index
+        @type task_no: int
+        '''
+
+        machine_no=self.assignment[task_no]
+        if machine_no<0:
+            raise Exception("Task "+str(self.task_id[task_no])+" is not assigned")
+        p,n=self.prev[task_no],self.next[task_no]
+        if p==-1:
+            self.head[machine_no]=n
+        else:
+            self.next[p]=n
+        if n==-1:
+            self.tail[machine_no]=p
+        else:
+            self.prev[n]=p
+        self.prev[task_no]=self.next[task_no]=-1
+        self.count[machine_no]-=1
+        self.makespan[machine_no]-=self.length[task_no]/self.speed[machine_no]
+        self.assignment[task_no]=NO_MACHINE
+
+    def machineTasks(self,machine_no:int)->List[int]:
+        ''' Indices of tasks assigned to a machine, in the order they were added
+        @param machine_no: Machine index
+        @type machine_no: int
+        @rtype: List[int]
+        '''
+
+        res=[]
+        i=self.head[machine_no]
+        while i!=-1:
+            res.append(int(i))
+            i=self.next[i]
+        return res
+
+    def resetMachine(self,machine_no:int)->None:
+        ''' Remove all tasks assigned to a machine '''
+
+        for i in self.machineTasks(machine_no):
+            self.assignment[i]=NO_MACHINE
+            self.prev[i]=self.next[i]=-1
+        self.head[machine_no]=self.tail[machine_no]=-1
+        self.count[machine_no]=0
+        self.makespan[machine_no]=0.0
+
+    def resetFleet(self)->None:
+        ''' Remove all assignments (as well as skipped marks) from all machines and tasks '''
+
+        self.assignment[:]=NO_MACHINE
+        self.next[:]=-1
+        self.prev[:]=-1
+        self.head[:]=-1
+        self.tail[:]=-1
+        self.count[:]=0
+        self.makespan[:]=0.0
+
+    def maxMakespanMachine(self)->int:
+        ''' Index of the machine with maximum makespan (first one in case of ties), or -1 if all makespans are zero. \
+        Same as getMachMaxMakespan, but without a Python-level scan
+        @rtype: int
+        '''
+
+        if not len(self.makespan):
+            return -1
+        i=int(numpy.argmax(self.makespan))
+        return i if self.makespan[i]>0.0 else -1
+
+    def machines(self)->List['FleetMachine']:
+        ''' List of Machine-like views over the fleet. The same view objects are returned on each call (in a new list, \
+        so the caller may modify it) '''
+
+        return list(self._machineViews())
+
+    def tasks(self)->List['FleetTask']:
+        ''' List of Task-like views over the fleet. The same view objects are returned on each call (in a new list, \
+        so the caller may modify it) '''
+
+        return list(self._taskViews())
+
+    def _machineViews(self)->List['FleetMachine']:
+        ''' Cached machine views (not a copy, so it must not be modified) '''
+
+        if self._mach_views is None:
+            self._mach_views=[FleetMachine(self,i) for i in range(self.numMachines())]
+        return self._mach_views
+
+    def _taskViews(self)->List['FleetTask']:
+        ''' Cached task views (not a copy, so it must not be modified) '''
+
+        if self._task_views is None:
+            self._task_views=[FleetTask(self,i) for i in range(self.numTasks())]
+        return self._task_views
+
+
+class FleetMachine(object):
+    '''
+    Machine-like view of one machine of a Fleet. All state lives in the fleet arrays
+    '''
+
+    __slots__=('fleet','idx')
+
+    def __init__(self,fleet:Fleet,idx:int):
+        self.fleet=fleet
+        self.idx=idx
+
+    @property
+    def ds_conf_id(self)->int:
+        return self.fleet.ds_conf_id
+
+    @property
+    def id(self)->int:
+        return int(self.fleet.machine_id[self.idx])
+
+    @property
+    def speed(self)->float:
+        return float(self.fleet.speed[self.idx])
+
+    @property
+    def cost(self)->float:
+        return float(self.fleet.cost[self.idx])
+
+    @property
+    def energy(self)->float:
+        return float(self.fleet.energy[self.idx])
+
+    @property
+    def makespan(self)->float:
+        return float(self.fleet.makespan[self.idx])
+
+    @property
+    def tasks(self)->List['FleetTask']:
+        views=self.fleet._taskViews()
+        return [views[i] for i in self.fleet.machineTasks(self.idx)]
+
+    def addTask(self,t:'FleetTask')->None:
+        self.fleet.addTask(t.idx,self.idx)
+
+    def remTask(self,t:'FleetTask')->None:
+        if self.fleet.assignment[t.idx]!=self.idx:
+            raise Exception("Task "+str(t.id)+" is not assigned to machine "+str(self.id))
+        self.fleet.remTask(t.idx)
+
+    def resetMachine(self)->None:
+        self.fleet.resetMachine(self.idx)
+
+
+class FleetTask(object):
+    '''
+    Task-like view of one task of a Fleet. All state lives in the fleet arrays
+    '''
+
+    __slots__=('fleet','idx')
+
+    def __init__(self,fleet:Fleet,idx:int):
+        self.fleet=fleet
+        self.idx=idx
+
+    @property
+    def ds_conf_id(self)->int:
+        return self.fleet.ds_conf_id
+
+    @property
+    def id(self)->int:
+        return int(self.fleet.task_id[self.idx])
+
+    @property
+    def length(self)->float:
+        return float(self.fleet.length[self.idx])
+
+    @property
+    def m(self):
+        ''' Assigned machine view, None if the task is not assigned, or -1 if the task has been skipped '''
+
+        machine_no=self.fleet.assignment[self.idx]
+        if machine_no==NO_MACHINE:
+            return None
+        if machine_no==SKIPPED_MACHINE:
+            return -1
+        return self.fleet._machineViews()[machine_no]
+
+    @m.setter
+    def m(self,val)->None:
+        ''' Only marks of unassigned tasks can be set directly. Use addTask/remTask of the machine otherwise '''
+
+        if self.fleet.assignment[self.idx]>=0:
+            raise Exception("Task "+str(self.id)+" is assigned. Use remTask of its machine instead")
+        if val is None:
+            self.fleet.assignment[self.idx]=NO_MACHINE
+        elif isinstance(val,int) and val==-1:
+            self.fleet.assignment[self.idx]=SKIPPED_MACHINE
+        elif isinstance(val,FleetMachine) and val.fleet is self.fleet:
+            self.fleet.addTask(self.idx,val.idx)
+        else:
+            raise Exception("Invalid machine for task "+str(self.id))
+
+
+def fleetFromObjects(mach:List[Machine],tasks:List[Task])->Fleet:
+    ''' Build a fleet from lists of Machine and Task objects. Current assignments of tasks to machines in the input \
+    lists (including the order of tasks on each machine) are preserved
+    @param mach: List of machines
+    @type mach: List[Machine]
+    @param tasks: List of tasks
+    @type tasks: List[Task]
+    @rtype: Fleet
+    '''
+
+    ds_conf_id=mach[0].ds_conf_id if mach else (tasks[0].ds_conf_id if tasks else 0)
+    fleet=Fleet(ds_conf_id,[m.id for m in mach],[m.speed for m in mach],[t.id for t in tasks],[t.length for t in tasks],\
+                [m.cost for m in mach],[m.energy for m in mach])
+    task_no={id(t):i for i,t in enumerate(tasks)}
+    for j,m in enumerate(mach):
+        for t in m.tasks:
+            if id(t) in task_no:
+                fleet.addTask(task_no[id(t)],j)
+            else:   # Task is not part of the input task list. Only its contribution to the makespan is kept
+                fleet.makespan[j]+=t.length/m.speed
+    for i,t in enumerate(tasks):
+        if isinstance(t.m,int) and t.m==-1:
+            fleet.assignment[i]=SKIPPED_MACHINE
+    return fleet
+
+def genFleet(ds_id:int,mach_conf:DataFrame,task_conf:DataFrame)->Fleet:
+    '''
+    Generate fleet from input machine and task configurations. Same as genMachines and genTasks, but no Python object \
+    is created per machine or task
+    @param ds_id: Specific dataset ID to read machine and task configurations
+    @type ds_id: int
+    @param mach_conf: Input machine configuration. The important columns are 'dataset_conf_id', 'machine_id' and 'speed'
+    @type mach_conf: DataFrame
+    @param task_conf: Input task configuration. The important columns are 'dataset_conf_id', 'task_id' and 'length'
+    @type task_conf: DataFrame
+    @rtype: Fleet
+    '''
+
+    m_sel=mach_conf[mach_conf['dataset_conf_id']==ds_id]
+    t_sel=task_conf[task_conf['dataset_conf_id']==ds_id]
+    return Fleet(ds_id,m_sel['machine_id'].to_numpy(),m_sel['speed'].to_numpy(),t_sel['task_id'].to_numpy(),\
+                 t_sel['length'].to_numpy())
@@ -99,9 +99,8 @@ def genMachines(ds_id:int, mach_conf:DataFrame)-> List[Machine]:
     @rtype: List[Machine]    
     '''
     
-    import copy
-    
-    return copy.deepcopy([Machine(ds_id,i.machine_id,i.speed) for i in mach_conf.itertuples() if i.dataset_conf_id==ds_id])
+    sel=mach_conf[mach_conf['dataset_conf_id']==ds_id]   # Filter rows of the dataset once, instead of a Python-level scan
+    return [Machine(ds_id,i,s) for i,s in zip(sel['machine_id'].tolist(),sel['speed'].tolist())]
    
 def getMachMaxMakespan(mach: List[Machine])->Machine:
 	''' Extract the machine from the input list with maximum makespan
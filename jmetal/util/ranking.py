@@ -1,16 +1,270 @@
-from typing import TypeVar, List
+from typing import TypeVar, List, Iterator, Tuple
 
+import numpy
+
+from jmetal.core.population import Population
 from jmetal.util.comparator import DominanceComparator
 
 S = TypeVar('S')
 
+DEFAULT_BLOCK_ELEMENTS = 2 ** 24  # Max. number of solution pairs compared (and kept in memory) at once
+
+
+def objective_matrix(solution_list: List[S]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """ Returns the solutions x objectives matrix of a list of solutions, and the overall constraint violation of each
+    solution (NaN for solutions without the attribute), or None if no solution has the attribute. """
+    key = "overall_constraint_violation"
+    if isinstance(solution_list, Population):
+        violation = None
+        if solution_list.has_attribute(key).any():
+            violation = numpy.where(solution_list.has_attribute(key),
+                                    solution_list.attribute(key).astype(float), numpy.nan)
+        return solution_list.objectives.astype(float, copy=False), violation
+
+    if len(solution_list) == 0:
+        return numpy.zeros((0, 0)), None
+    number_of_objectives = solution_list[0].number_of_objectives
+    objectives = numpy.array([solution.objectives[:number_of_objectives] for solution in solution_list], dtype=float)
+    values = [solution.attributes.get(key) for solution in solution_list]
+    violation = None
+    if any(value is not None for value in values):
+        violation = numpy.array([numpy.nan if value is None else value for value in values], dtype=float)
+
+    return objectives, violation
+
+
+def dominance_block(objectives: numpy.ndarray, violation: numpy.ndarray, rows: numpy.ndarray) -> numpy.ndarray:
+    """ Returns a len(rows) x N boolean matrix where [k, j] is True if solution rows[k] dominates solution j, using the
+    same rules as :class:`DominanceComparator` (constraint violation first, then Pareto dominance). """
+    rows = numpy.asarray(rows)
+    block = objectives[rows]
+    nan = numpy.isnan(objectives).any()
+    better = numpy.zeros((len(rows), len(objectives)), dtype=bool)
+    worse = numpy.zeros((len(rows), len(objectives)), dtype=bool)
+    if nan:
+        better_first = better.copy()
+        worse_first = worse.copy()
+    # One objective at a time: comparisons over a (rows x N) matrix are much faster than over (rows x N x M)
+    for k in range(objectives.shape[1]):
+        a = block[:, k, None]
+        b = objectives[None, :, k]
+        less = a < b
+        greater = a > b
+        better |= less
+        worse |= greater
+        if nan:
+            # DominanceComparator is not symmetric with NaN values (a NaN objective always counts as better for the
+            # second solution), so the pair (p, q) is evaluated as compare(min(p, q), max(p, q)) like the pairwise
+            # loop does
+            different = a != b
+            better_first |= different & ~greater
+            worse_first |= different & ~less
+
+    if nan:
+        row_first = better & ~worse_first
+        column_first = better_first & ~worse
+        dominates = numpy.where(rows[:, None] < numpy.arange(len(objectives))[None, :], row_first, column_first)
+    else:
+        dominates = better & ~worse
+
+    if violation is not None:
+        # Missing violations are NaN, so they never decide a comparison
+        va = violation[rows][:, None]
+        vb = violation[None, :]
+        decided = (va > vb) | (va < vb)
+        dominates = numpy.where(decided, va > vb, dominates)
+
+    # A solution never dominates itself (the NaN rules above would say so, as NaN != NaN)
+    dominates[numpy.arange(len(rows)), rows] = False
+
+    return dominates
+
+
+def non_dominated_sort(objectives: numpy.ndarray, violation: numpy.ndarray = None,
+                       max_block_elements: int = DEFAULT_BLOCK_ELEMENTS,
+                       max_solutions: int = None) -> List[numpy.ndarray]:
+    """ Sorts solutions into non-dominated fronts using NumPy dominance blocks.
+
+    The fronts (arrays of solution indices) are returned in the same order as the pairwise loop of NSGA-II builds
+    them. If the N x N dominance matrix does not fit in `max_block_elements`, it is never stored: rows are recomputed in
+    tiles when they are needed, so memory stays bounded at the cost of evaluating each row twice.
+
+    Fronts are peeled lazily: if `max_solutions` is given, no more fronts are computed once the returned fronts hold
+    at least that number of solutions.
+    """
+    size = len(objectives)
+    if size == 0:
+        return []
+    rows_per_block = max(1, max_block_elements // size)
+    matrix = dominance_block(objectives, violation, numpy.arange(size)) if rows_per_block >= size else None
+
+    def blocks(rows: numpy.ndarray) -> Iterator[Tuple[int, numpy.ndarray]]:
+        if matrix is not None:
+            yield 0, matrix[rows]
+        else:
+            for start in range(0, len(rows), rows_per_block):
+                yield start, dominance_block(objectives, violation, rows[start:start + rows_per_block])
+
+    dominate_me = numpy.zeros(size, dtype=numpy.int64)
+    for _, block in blocks(numpy.arange(size)):
+        dominate_me += block.sum(axis=0)
+
+    fronts = []
+    ranked = 0
+    front = numpy.flatnonzero(dominate_me == 0)
+    while len(front) > 0:
+        fronts.append(front)
+        ranked += len(front)
+        if max_solutions is not None and ranked >= max_solutions:
+            break
+        # Position (in the current front) of the last solution dominating each solution
+        last = numpy.full(size, -1, dtype=numpy.int64)
+        for start, block in blocks(front):
+            dominate_me -= block.sum(axis=0)
+            position = start + len(block) - 1 - numpy.argmax(block[::-1], axis=0)
+            last = numpy.where(block.any(axis=0), position, last)
+
+        # A solution joins the next front when its last dominator is processed; ties keep the index order
+        new_front = numpy.flatnonzero((dominate_me == 0) & (last >= 0))
+        front = new_front[numpy.lexsort((new_front, last[new_front]))]
+
+    return fronts
+
+
+def efficient_non_dominated_sort(objectives: numpy.ndarray, violation: numpy.ndarray = None,
+                                  binary_search: bool = True, max_solutions: int = None) -> List[numpy.ndarray]:
+    """ Sorts solutions into non-dominated fronts with the Efficient Non-dominated Sort (ENS) of Zhang et al.
+
+    Solutions are presorted lexicographically (by constraint violation first, if any), so no solution can be dominated
+    by a later one. Each solution is then inserted into the first front having no solution that dominates it; the
+    front is found by a sequential (ENS-SS) or a binary (ENS-BS) search. Fronts are returned as arrays of solution
+    indices in increasing index order.
+
+    Missing violations and NaN objectives make the dominance relation of :class:`DominanceComparator` non-transitive,
+    so these cases fall back to :func:`non_dominated_sort`. As every solution is inserted anyway, `max_solutions` only
+    drops the fronts that are not needed to hold that number of solutions.
+    """
+    size = len(objectives)
+    if size == 0:
+        return []
+    if violation is not None:
+        if numpy.isnan(violation).all() or (violation == violation[0]).all():
+            violation = None
+        elif numpy.isnan(violation).any():
+            return non_dominated_sort(objectives, violation, max_solutions=max_solutions)
+    if numpy.isnan(objectives).any():
+        return non_dominated_sort(objectives, violation, max_solutions=max_solutions)
+
+    keys = [objectives[:, k] for k in reversed(range(objectives.shape[1]))]
+    if violation is not None:
+        keys.append(-violation)
+    order = numpy.lexsort(keys) if keys else numpy.arange(size)
+
+    if objectives.shape[1] == 2 and violation is None:
+        ranks = _ens_two_objectives(objectives, order, binary_search)
+    else:
+        ranks = _ens(objectives, violation, order, binary_search)
+
+    # Group indices by rank, keeping the index order inside each front
+    ranks = numpy.asarray(ranks)
+    by_rank = numpy.argsort(ranks, kind='stable')
+    bounds = numpy.cumsum(numpy.bincount(ranks))
+    if max_solutions is not None:
+        bounds = bounds[:numpy.searchsorted(bounds, max_solutions) + 1]
+
+    return numpy.split(by_rank[:bounds[-1]], bounds[:-1])
+
+
+def _search_front(number_of_fronts: int, dominated, binary_search: bool) -> int:
+    """ Index of the first front not dominating a solution. If a front dominates the solution, every previous front
+    dominates it as well, so the search can be binary. """
+    if binary_search:
+        low, high = 0, number_of_fronts
+        while low < high:
+            middle = (low + high) // 2
+            if dominated(middle):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    k = 0
+    while k < number_of_fronts and dominated(k):
+        k += 1
+    return k
+
+
+def _ens_two_objectives(objectives: numpy.ndarray, order: numpy.ndarray, binary_search: bool) -> List[int]:
+    # With two objectives, the last solution added to a front has the lowest second objective of the front, so a front
+    # dominates a later solution iff its last solution does
+    first, second = objectives[order, 0].tolist(), objectives[order, 1].tolist()
+    last_first, last_second = [], []
+    ranks = [0] * len(order)
+    for index, f1, f2 in zip(order.tolist(), first, second):
+        k = _search_front(len(last_second),
+                          lambda k: last_second[k] < f2 or (last_second[k] == f2 and last_first[k] < f1),
+                          binary_search)
+        if k == len(last_second):
+            last_first.append(f1)
+            last_second.append(f2)
+        else:
+            last_first[k] = f1
+            last_second[k] = f2
+        ranks[index] = k
+
+    return ranks
+
+
+def _ens(objectives: numpy.ndarray, violation: numpy.ndarray, order: numpy.ndarray, binary_search: bool) -> List[int]:
+    size, number_of_objectives = objectives.shape
+    # Solutions of each front are kept in a growing matrix (objectives, then violation if any) with its used length
+    width = number_of_objectives + (violation is not None)
+    values = objectives if violation is None else numpy.column_stack((objectives, violation))
+    fronts = []
+    lengths = []
+    last_points = []
+    ranks = [0] * size
+
+    def dominated(k: int) -> bool:
+        # The last solution added to a front is the closest one in the presorted order, so it is checked first
+        last = last_points[k]
+        if all(a <= b for a, b in zip(last, point_list)) and last != point_list:
+            if violation is None or last[-1] == point_list[-1]:
+                return True
+        members = fronts[k][:lengths[k]]
+        result = (members[:, :number_of_objectives] <= point[:number_of_objectives]).all(axis=1) & \
+                 (members[:, :number_of_objectives] < point[:number_of_objectives]).any(axis=1)
+        if violation is not None:
+            result = (members[:, -1] > point[-1]) | ((members[:, -1] == point[-1]) & result)
+        return bool(result.any())
+
+    value_list = values.tolist()
+    for index in order.tolist():
+        point = values[index]
+        point_list = value_list[index]
+        k = _search_front(len(fronts), dominated, binary_search)
+        if k == len(fronts):
+            fronts.append(numpy.empty((8, width)))
+            lengths.append(0)
+            last_points.append(point_list)
+        elif lengths[k] == len(fronts[k]):
+            fronts[k] = numpy.concatenate((fronts[k], numpy.empty_like(fronts[k])))
+        fronts[k][lengths[k]] = point
+        lengths[k] += 1
+        last_points[k] = point_list
+        ranks[index] = k
+
+    return ranks
+
 
 class Ranking(List[S]):
     def __init__(self):
         self.number_of_comparions = 0
         self.ranked_sublists = []
 
-    def compute_ranking(self, solution_list: List[S]):
+    def compute_ranking(self, solution_list: List[S], max_solutions: int = None):
+        """ Sorts the solutions into subfronts. If `max_solutions` is given, the ranking may stop as soon as the
+        computed subfronts hold that number of solutions; solutions out of them get no dominance ranking. """
         pass
 
     def get_subfront(self, rank: int):
@@ -24,66 +278,116 @@ class Ranking(List[S]):
     def get_number_of_comparions(self) -> int:
         return self.number_of_comparisons
 
+    def _set_fronts(self, solution_list: List[S], fronts: List[numpy.ndarray]):
+        """ Sets the dominance ranking attribute and the ranked sublists from fronts of solution indices """
+        if isinstance(solution_list, Population) and sum(len(front) for front in fronts) == len(solution_list):
+            ranks = numpy.zeros(len(solution_list), dtype=numpy.int64)
+            for rank, front in enumerate(fronts):
+                ranks[front] = rank
+            solution_list.set_attribute("dominance_ranking", ranks)
+        else:
+            for rank, front in enumerate(fronts):
+                for index in front.tolist():
+                    solution_list[index].attributes["dominance_ranking"] = rank
+
+        self.ranked_sublists = [[solution_list[index] for index in front.tolist()] for front in fronts]
+
+        return self.ranked_sublists
+
 
 class FastNonDominatedRanking(Ranking[List[S]]):
-    """ Class implementing the non-dominated ranking of NSGA-II"""
-    def __init__(self):
+    """ Class implementing the non-dominated ranking of NSGA-II.
+
+    The dominance relation is computed on the objective matrix in NumPy blocks of at most `max_block_elements`
+    solution pairs, so large merged populations are ranked without allocating N^2 booleans at once.
+    """
+    def __init__(self, max_block_elements: int = DEFAULT_BLOCK_ELEMENTS):
         super(FastNonDominatedRanking, self).__init__()
+        self.max_block_elements = max_block_elements
 
-    def compute_ranking(self, solution_list: List[S]):
-        # number of solutions dominating solution ith
-        dominate_me = [0 for i in range(len(solution_list))]
-
-        # list of solutions dominated by solution ith
-        i_dominate = [[] for i in range(len(solution_list))]
-
-        # front[i] contains the list of solutions belonging to front i
-        front = [[] for i in range(len(solution_list) + 1)]
-
-        for p in range(len(solution_list) - 1):
-            for q in range(p + 1, len(solution_list)):
-                dominance_test_result = DominanceComparator().compare(solution_list[p], solution_list[q])
-                self.number_of_comparions += 1
-                if dominance_test_result is -1:
-                    i_dominate[p].append(q)
-                    dominate_me[q] += 1
-                elif dominance_test_result is 1:
-                    i_dominate[q].append(p)
-                    dominate_me[p] += 1
-
-        for i in range(len(solution_list)):
-            if dominate_me[i] is 0:
-                front[0].append(i)
-                solution_list[i].attributes["dominance_ranking"] = 0
-
-        i = 0
-        while len(front[i]) != 0:
-            i += 1
-            for p in front[i - 1]:
-                if p <= len(i_dominate):
-                    for q in i_dominate[p]:
-                        index = q
-                        dominate_me[index] -= 1
-                        if dominate_me[index] is 0:
-                            front[i].append(index)
-                            solution_list[index].attributes["dominance_ranking"] = i
-
-        self.ranked_sublists = [[]] * i
-        for j in range(i):
-            Q = [0] * len(front[j])
-            for k in range(len(front[j])):
-                Q[k] = solution_list[front[j][k]]
-            self.ranked_sublists[j] = Q
+    def compute_ranking(self, solution_list: List[S], max_solutions: int = None):
+        objectives, violation = objective_matrix(solution_list)
+        fronts = non_dominated_sort(objectives, violation, self.max_block_elements, max_solutions)
+        self.number_of_comparions += len(solution_list) * (len(solution_list) - 1) // 2
 
-        return self.ranked_sublists
+        return self._set_fronts(solution_list, fronts)
 
 
 class EfficientNonDominatedRanking(Ranking[List[S]]):
-    """ Class implementing the EDS (efficient non-dominated sorting) algorithm """
-    def __init__(self):
+    """ Class implementing the ENS (efficient non-dominated sorting) algorithm, with sequential (ENS-SS) or binary
+    (ENS-BS) search of the front of each solution. Solutions of each subfront are kept in the order of the list. """
+    def __init__(self, binary_search: bool = True):
         super(EfficientNonDominatedRanking, self).__init__()
+        self.binary_search = binary_search
+
+    def compute_ranking(self, solution_list: List[S], max_solutions: int = None):
+        objectives, violation = objective_matrix(solution_list)
+        fronts = efficient_non_dominated_sort(objectives, violation, self.binary_search, max_solutions)
+
+        return self._set_fronts(solution_list, fronts)
+
+
+class IncrementalNonDominatedRanking(Ranking[List[S]]):
+    """ Non-dominated ranking that is updated as single solutions are added or removed, instead of being computed
+    again. A new solution is inserted in the first subfront in which no solution dominates it, and the solutions it
+    dominates are pushed down one subfront, pushing down in turn the ones they dominate (ENLU). This assumes that the
+    dominance relation is transitive, as it is for solutions without NaN objectives. """
+    def __init__(self, comparator=DominanceComparator()):
+        super(IncrementalNonDominatedRanking, self).__init__()
+        self.comparator = comparator
+
+    def compute_ranking(self, solution_list: List[S], max_solutions: int = None):
+        ranking = FastNonDominatedRanking()
+        self.ranked_sublists = ranking.compute_ranking(solution_list, max_solutions)
+        self.number_of_comparions += ranking.number_of_comparions
+
+        return self.ranked_sublists
+
+    def add(self, solution: S) -> List[int]:
+        """ Adds a solution to the ranking. Returns the ranks of the subfronts that have changed """
+        rank = 0
+        while rank < len(self.ranked_sublists) and self.__is_dominated(solution, self.ranked_sublists[rank]):
+            rank += 1
+
+        changed = []
+        moved = [solution]
+        while moved:
+            if rank == len(self.ranked_sublists):
+                self.ranked_sublists.append([])
+            subfront = self.ranked_sublists[rank]
+            pushed = [member for member in subfront if any(self.__dominates(other, member) for other in moved)]
+            if pushed:
+                pushed_ids = {id(member) for member in pushed}
+                subfront[:] = [member for member in subfront if id(member) not in pushed_ids]
+            for member in moved:
+                member.attributes["dominance_ranking"] = rank
+            subfront.extend(moved)
+            changed.append(rank)
+
+            moved = pushed
+            rank += 1
+
+        return changed
+
+    def remove(self, solution: S) -> List[int]:
+        """ Removes a solution from the ranking. Returns the ranks of the subfronts that have changed. Removing from
+        the last subfront does not change any other rank; otherwise the remaining solutions are ranked again """
+        rank = solution.attributes["dominance_ranking"]
+        subfront = self.ranked_sublists[rank]
+        subfront[:] = [member for member in subfront if member is not solution]
+
+        if rank < len(self.ranked_sublists) - 1:
+            self.compute_ranking([member for sublist in self.ranked_sublists for member in sublist])
+            return list(range(rank, len(self.ranked_sublists)))
+
+        if not subfront:
+            self.ranked_sublists.pop()
+            return []
+        return [rank]
 
-    def compute_ranking(self, solution_list: List[S]):
-        #todo       
+    def __dominates(self, solution1: S, solution2: S) -> bool:
+        self.number_of_comparions += 1
+        return self.comparator.compare(solution1, solution2) == -1
 
-        return self.ranked_sublists
\ No newline at end of file
+    def __is_dominated(self, solution: S, subfront: List[S]) -> bool:
+        return any(self.__dominates(member, solution) for member in subfront)
@@ -0,0 +1,162 @@
+'''
+Created on Oct 18, 2026
+
+@author: shambakey1
+@contact: shambakey1@gmail.com
+'''
+
+import glob
+import os
+import tempfile
+from typing import List, Set, Tuple
+
+import numpy
+import pandas as pd
+
+RUN_COLS=['algorithm','ds_id','iteration','start','end','total_time','max_makespan']   # Columns of running time results
+NONE_ID=-1  # Stored instead of None dataset ID or iteration
+
+
+def _id(val)->int:
+    return NONE_ID if val is None else int(val)
+
+
+class ResultStore(object):
+    '''
+    Append-only store of scheduling results, in the format returned by the run method of scheduling algorithms \
+    (i.e., {'run_time':{...},'mach_res':[...]}). Results are buffered, then written to a directory as chunks of \
+    column arrays (one NPZ file per chunk). Task lists of machines are kept as one flat array with offsets. Chunks are \
+    written to a temporary file, then renamed, so a run is either completely stored or not stored at all. When the \
+    store is opened again, already stored (dataset, algorithm, iteration) keys are known by @completed, and temporary \
+    files left by an interrupted flush are removed.
+    '''
+
+    def __init__(self,path:str,chunk_size:int=1000):
+        '''
+        @param path: Directory of the store. It is created if it does not exist
+        @type path: str
+        @param chunk_size: Number of runs per chunk
+        @type chunk_size: int
+        '''
+
+        self.path=path
+        self.chunk_size=chunk_size
+        os.makedirs(path,exist_ok=True)
+        self._runs=[]           # Buffered running time results
+        self._machines=[]       # Buffered machines results of each buffered run
+        self._completed=set()
+        self._next_chunk=0
+        for f in glob.glob(os.path.join(path,'*.tmp')):    # Chunks whose writing was interrupted (e.g., by a crash)
+            os.remove(f)
+        for f in self.chunks():
+            self._next_chunk=max(self._next_chunk,int(os.path.basename(f)[6:-4])+1)
+            with numpy.load(f,allow_pickle=False) as c:
+                self._completed.update(zip(c['ds_id'].tolist(),c['algorithm'].tolist(),c['iteration'].tolist()))
+
+    def chunks(self)->List[str]:
+        ''' Paths of stored chunks in order of writing '''
+
+        return sorted(glob.glob(os.path.join(self.path,'chunk_*.npz')))
+
+    def completed(self)->Set[Tuple[int,str,int]]:
+        ''' Stored (dataset ID, algorithm, iteration) keys. None dataset ID or iteration is reported as NONE_ID '''
+
+        return set(self._completed)
+
+    def isCompleted(self,ds_id:int,algorithm:str,iteration:int)->bool:
+        return (_id(ds_id),algorithm,_id(iteration)) in self._completed
+
+    def add(self,res:dict)->None:
+        ''' Add results of one run. Results are written to disk when the number of buffered runs reaches the chunk size
+        @param res: Results of one run of a scheduling algorithm
+        @type res: dict
+        '''
+
+        self._runs.append(res['run_time'])
+        self._machines.append(res['mach_res'])
+        if len(self._runs)>=self.chunk_size:
+            self.flush()
+
+    def flush(self)->None:
+        ''' Write buffered results as a new chunk '''
+
+        if not self._runs:
+            return
+        arrays={'algorithm':numpy.array([str(r['algorithm']) for r in self._runs]),
+                'ds_id':numpy.array([_id(r['ds_id']) for r in self._runs],dtype=numpy.int64),
+                'iteration':numpy.array([_id(r['iteration']) for r in self._runs],dtype=numpy.int64)}
+        for c in RUN_COLS[3:]:
+            arrays[c]=numpy.array([r[c] for r in self._runs],dtype=float)
+
+        # Machines results of all runs. Each machine points to its run, and to its tasks in the flat task array
+        mach=[(k,m) for k,m_res in enumerate(self._machines) for m in m_res]
+        arrays['m_run']=numpy.array([k for k,_ in mach],dtype=numpy.int64)
+        arrays['m_machine_id']=numpy.array([m['machine_id'] for _,m in mach],dtype=numpy.int64)
+        arrays['m_makespan']=numpy.array([m['makespan'] for _,m in mach],dtype=float)
+        arrays['m_task_offsets']=numpy.cumsum([0]+[len(m['tasks']) for _,m in mach],dtype=numpy.int64)
+        arrays['m_tasks']=numpy.array([t for _,m in mach for t in m['tasks']],dtype=numpy.int64)
+
+        path=os.path.join(self.path,'chunk_%06d.npz'%self._next_chunk)
+        fd,tmp=tempfile.mkstemp(suffix='.tmp',dir=self.path)
+        try:
+            with os.fdopen(fd,'wb') as f:
+                numpy.savez(f,**arrays)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp,path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        self._next_chunk+=1
+        self._completed.update(zip(arrays['ds_id'].tolist(),arrays['algorithm'].tolist(),arrays['iteration'].tolist()))
+        self._runs=[]
+        self._machines=[]
+
+    def close(self)->None:
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*args)->None:
+        self.close()
+
+    def runTimeFrame(self)->pd.DataFrame:
+        ''' Stored running time results, in the same columns as the 'run_time' results of each run '''
+
+        frames=[]
+        for f in self.chunks():
+            with numpy.load(f,allow_pickle=False) as c:
+                frames.append(pd.DataFrame({col:c[col] for col in RUN_COLS}))
+        if not frames:
+            return pd.DataFrame(columns=RUN_COLS)
+        return pd.concat(frames,ignore_index=True)
+
+    def machinesFrame(self)->pd.DataFrame:
+        ''' Stored machines results, in the same columns as the 'mach_res' results of each run (tasks are lists) '''
+
+        cols=['algorithm','ds_id','iteration','machine_id','tasks','makespan']
+        frames=[]
+        for f in self.chunks():
+            with numpy.load(f,allow_pickle=False) as c:
+                run=c['m_run']
+                off=c['m_task_offsets']
+                tasks=c['m_tasks'].tolist()
+                frames.append(pd.DataFrame({'algorithm':c['algorithm'][run],'ds_id':c['ds_id'][run],\
+                                            'iteration':c['iteration'][run],'machine_id':c['m_machine_id'],\
+                                            'tasks':[tasks[off[i]:off[i+1]] for i in range(len(run))],\
+                                            'makespan':c['m_makespan']}))
+        if not frames:
+            return pd.DataFrame(columns=cols)
+        return pd.concat(frames,ignore_index=True)
+
+    def exportCsv(self,res_running_time:str,res_machines:str)->None:
+        ''' Write stored results to running time and machines CSV files, as written by the serial runner
+        @param res_running_time: Path to running time results CSV file
+        @type res_running_time: str
+        @param res_machines: Path to machines results CSV file
+        @type res_machines: str
+        '''
+
+        self.runTimeFrame().to_csv(res_running_time,index=False)
+        self.machinesFrame().to_csv(res_machines,index=False)
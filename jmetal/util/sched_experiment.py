@@ -0,0 +1,196 @@
+'''
+Created on Oct 18, 2026
+
+@author: shambakey1
+@contact: shambakey1@gmail.com
+'''
+
+import multiprocessing
+import os
+from typing import Callable, List, Set, Tuple
+
+import pandas as pd
+
+from jmetal.algorithm.multiobjective.bmflis import BMFLIS
+from jmetal.algorithm.multiobjective.bmfmms import BMFMMS
+from jmetal.algorithm.multiobjective.m3fm2s import M3FM2S
+from jmetal.algorithm.multiobjective.maxmin import MAXMIN
+from jmetal.algorithm.multiobjective.minmin import MINMIN
+from jmetal.problem.multiobjective.constrained import Schedule
+from jmetal.util.ds_index import DatasetIndex
+from jmetal.util.result_store import ResultStore
+
+# Scheduling algorithms that can be named in the experiments configuration file, with extra arguments of their run method
+ALGORITHMS={'BMFLIS':(BMFLIS,{'th_per':0.0}),
+            'MINMIN':(MINMIN,{}),
+            'MAXMIN':(MAXMIN,{}),
+            'BMFMMS':(BMFMMS,{}),
+            'M3FM2S':(M3FM2S,{})}
+
+_worker_index=None  # Dataset index of current worker process
+_problem_cache=None # (Dataset index, dataset ID, objectives, scheduling problem) of the last unit of work in current process
+
+
+def _initWorker(ds_idx:DatasetIndex)->None:
+    ''' Pool initializer: keep the dataset index once per worker, instead of sending it with each unit of work '''
+
+    global _worker_index
+    _worker_index=ds_idx
+
+def _problem(ds_idx:DatasetIndex,ds_id:int,objs:List[dict])->Schedule:
+    ''' Scheduling problem of a dataset. Machines and tasks are generated once for consecutive units of work over the \
+    same dataset (each algorithm resets them after each run) '''
+
+    global _problem_cache
+    if _problem_cache is None or _problem_cache[0] is not ds_idx or _problem_cache[1:3]!=(ds_id,objs):
+        _problem_cache=(ds_idx,ds_id,objs,Schedule(objs,ds_idx.getMachines(ds_id),ds_idx.getTasks(ds_id)))
+    return _problem_cache[3]
+
+def runUnit(ds_idx:DatasetIndex,ds_id:int,objs:List[dict],alg_id:str,iterations:List[int])->dict:
+    '''
+    Run some iterations of one algorithm over one dataset (i.e., one unit of work of the experiments grid)
+    @param ds_idx: Dataset index
+    @type ds_idx: DatasetIndex
+    @param ds_id: Dataset ID
+    @type ds_id: int
+    @param objs: Scheduling objectives
+    @type objs: List[dict]
+    @param alg_id: Name of algorithm (key of ALGORITHMS)
+    @type alg_id: str
+    @param iterations: Iteration numbers to be run
+    @type iterations: List[int]
+    @return: Dataset ID and results of each run
+    @rtype: dict
+    '''
+
+    if alg_id not in ALGORITHMS:
+        raise Exception("Unknown algorithm: "+str(alg_id))
+    alg_class,kwargs=ALGORITHMS[alg_id]
+    alg=alg_class(problem=_problem(ds_idx,ds_id,objs))
+    return {'ds_id':ds_id,'runs':[alg.run(ds_id=ds_id,iteration=i,**kwargs) for i in iterations]}
+
+def runDataset(ds_idx:DatasetIndex,ds_id:int,objs:List[dict],algs:List[str],iterations:int,skip:Set[Tuple[str,int]]=None)->dict:
+    '''
+    Run all iterations of the required algorithms over one dataset. Machines and tasks are generated once for the \
+    dataset and shared by all algorithms (each algorithm resets them after each run), exactly as in the serial runner
+    @param ds_idx: Dataset index
+    @type ds_idx: DatasetIndex
+    @param ds_id: Dataset ID
+    @type ds_id: int
+    @param objs: Scheduling objectives
+    @type objs: List[dict]
+    @param algs: Names of algorithms (keys of ALGORITHMS)
+    @type algs: List[str]
+    @param iterations: Number of iterations for each algorithm
+    @type iterations: int
+    @param skip: Optional (algorithm, iteration) keys that should not be run (e.g., already completed)
+    @type skip: Set[Tuple[str,int]]
+    @return: Dataset ID and results of each run
+    @rtype: dict
+    '''
+
+    res={'ds_id':ds_id,'runs':[]}
+    for alg_id in algs:
+        its=[i for i in range(iterations) if not (skip and (alg_id,i) in skip)]
+        res['runs'].extend(runUnit(ds_idx,ds_id,objs,alg_id,its)['runs'])
+    return res
+
+def _runWorkerUnit(args)->dict:
+    return runUnit(_worker_index,*args)
+
+def splitIterations(iterations:List[int],n_chunks:int)->List[List[int]]:
+    ''' Split iteration numbers into at most n_chunks contiguous chunks of (almost) equal size '''
+
+    n_chunks=max(1,min(n_chunks,len(iterations)))
+    size,extra=divmod(len(iterations),n_chunks)
+    chunks=[]
+    start=0
+    for k in range(n_chunks):
+        end=start+size+(1 if k<extra else 0)
+        chunks.append(iterations[start:end])
+        start=end
+    return chunks
+def appendCsv(path:str,rows:List[dict])->None:
+    ''' Append rows to a CSV file (header is written only if the file is new), then flush them to disk, so results \
+    of completed runs survive a crash of the experiment
+    @param path: Path to CSV file
+    @type path: str
+    @param rows: Rows to be appended
+    @type rows: List[dict]
+    '''
+
+    if not rows:
+        return
+    new=not os.path.isfile(path) or os.path.getsize(path)==0
+    with open(path,'a') as f:
+        pd.DataFrame(rows).to_csv(f,header=new,index=False)
+        f.flush()
+        os.fsync(f.fileno())
+
+def runExperiments(ds_prop:dict,res_running_time:str=None,res_machines:str=None,processes:int=None,\
+                   callback:Callable[[dict],None]=None,store:ResultStore=None)->None:
+    '''
+    Run the (dataset x algorithm x iteration) grid of the experiments configuration over a pool of processes. The grid \
+    is split into units of work of one algorithm over one dataset for a chunk of iterations, with enough chunks to \
+    keep all processes busy even with few datasets. Each worker keeps the dataset index, and generates machines and \
+    tasks once for consecutive units over the same dataset. Results of each unit are appended to the results files \
+    (and/or the result store) as soon as the unit completes (i.e., not in dataset order). If a result store is given, \
+    runs already in the store are skipped, so an interrupted sweep can be restarted
+    @param ds_prop: Experiments configuration as returned by load_ds (the 'index' key is used if it exists)
+    @type ds_prop: dict
+    @param res_running_time: Path to running time results CSV file
+    @type res_running_time: str
+    @param res_machines: Path to machines results CSV file
+    @type res_machines: str
+    @param processes: Number of worker processes (default is number of cores). If 1, the grid is run in current process
+    @type processes: int
+    @param callback: Optional function called with the results of each completed unit of work
+    @type callback: Callable[[dict],None]
+    @param store: Optional result store. The store is flushed after each unit of work
+    @type store: ResultStore
+    '''
+
+    ds_idx=ds_prop.get('index')
+    if ds_idx is None:
+        ds_idx=DatasetIndex(ds_prop['machines'],ds_prop['tasks'])
+
+    # Specify required datasets for analysis
+    if 'all' in ds_prop['ds_ids']:
+        ds_ids=list(ds_prop['conf']['id'])
+    else:
+        ds_ids=list(ds_prop['ds_ids'])
+    ds_ids.sort(key=lambda ds_id:len(ds_idx.taskColumns(ds_id)['task_id']),reverse=True)    # Largest datasets first, for better load balancing
+
+    # Remaining iterations of each (dataset, algorithm) pair
+    pairs=[]
+    for ds_id in ds_ids:
+        for alg_id in ds_prop['algorithms']:
+            its=[i for i in range(ds_prop['iterations']) if not (store and store.isCompleted(ds_id,alg_id,i))]
+            if its:
+                pairs.append((ds_id,alg_id,its))
+
+    # Iterations of each pair are split so that there are about 4 units of work per process (if there are enough 
+    # iterations), for load balancing
+    n_proc=processes or os.cpu_count() or 1
+    n_chunks=-(-4*n_proc//max(len(pairs),1)) if n_proc>1 else 1
+    jobs=[(ds_id,ds_prop['objectives'],alg_id,chunk) for ds_id,alg_id,its in pairs for chunk in splitIterations(its,n_chunks)]
+
+    def record(res:dict)->None:
+        if res_running_time:
+            appendCsv(res_running_time,[r['run_time'] for r in res['runs']])
+        if res_machines:
+            appendCsv(res_machines,[m for r in res['runs'] for m in r['mach_res']])
+        if store:
+            for r in res['runs']:
+                store.add(r)
+            store.flush()
+        if callback:
+            callback(res)
+
+    if processes==1:
+        for job in jobs:
+            record(runUnit(ds_idx,*job))
+        return
+    with multiprocessing.Pool(processes,initializer=_initWorker,initargs=(ds_idx,)) as pool:
+        for res in pool.imap_unordered(_runWorkerUnit,jobs):
+            record(res)
@@ -12,29 +12,54 @@ from typing import List
 from jmetal.util import machine, task
 from jmetal.util.machine import Machine, getMachMaxMakespan
 from jmetal.util.task import Task
+from jmetal.util.completion_time import CompletionTimeMatrix, SKIPPED
+from jmetal.util.ds_index import DatasetIndex, cacheKey
 from builtins import int
 
+import os
 import sys
 from asyncio import tasks
 
 
-def load_ds(f_path:str)->dict:
+def load_ds(f_path:str,index:bool=False,cache_dir:str=None)->dict:
     '''
     Load dataset properties file. The input f_path is JSON file
     @param f_path: Path to input JSON file pointing to scheduling experiments configuration files
     @type f_path: String
+    @param index: Group machines and tasks configurations by dataset ID into a DatasetIndex, which is returned under the 'index' key
+    @type index: bool
+    @param cache_dir: Optional directory of on-disk cache for the DatasetIndex. The cache is invalidated if the machines or tasks files are modified
+    @type cache_dir: str
     @return: Scehduling experimental configurations
     @rtype: dict  
     '''
     
     #ds_prop_f=pd.read_json(f_path)
     with open(f_path,'r') as f:
-    	ds_prop_f=yaml.load(f)
+    	ds_prop_f=yaml.load(f,Loader=yaml.SafeLoader)
+    
+    ds_conf=pd.read_csv(ds_prop_f['ds_conf']['path'],sep=ds_prop_f['ds_conf']['sep'])
+    ds_cons=pd.read_csv(ds_prop_f['ds_cons']['path'],sep=ds_prop_f['ds_cons']['sep'])
+    
+    # Machines and tasks are read from the cache, if valid, instead of the (large) CSV files
+    ds_idx=None
+    if index and cache_dir:
+        key=cacheKey(ds_prop_f['machines'],ds_prop_f['tasks'])
+        cache_path=os.path.join(cache_dir,'ds_index_'+key+'.npz')
+        if os.path.isfile(cache_path):
+            ds_idx=DatasetIndex.load(cache_path,key)
+    if ds_idx is not None:
+        machines=ds_idx.machinesFrame()
+        tasks=ds_idx.tasksFrame()
+    else:
+        machines=pd.read_csv(ds_prop_f['machines']['path'],sep=ds_prop_f['machines']['sep'])
+        tasks=pd.read_csv(ds_prop_f['tasks']['path'],sep=ds_prop_f['tasks']['sep'])
+        if index:
+            ds_idx=DatasetIndex(machines,tasks)
+            if cache_dir:
+                os.makedirs(cache_dir,exist_ok=True)
+                ds_idx.save(cache_path,key)
     
-    ds_conf=pd.read_csv(ds_prop_f['ds_conf']['path'],ds_prop_f['ds_conf']['sep'])
-    ds_cons=pd.read_csv(ds_prop_f['ds_cons']['path'],ds_prop_f['ds_cons']['sep'])
-    machines=pd.read_csv(ds_prop_f['machines']['path'],ds_prop_f['machines']['sep'])
-    tasks=pd.read_csv(ds_prop_f['tasks']['path'],ds_prop_f['tasks']['sep'])
     objs=ds_prop_f['objectives']
     algs=ds_prop_f['algorithms']
     res_path=ds_prop_f['results_path']
@@ -42,6 +67,8 @@ def load_ds(f_path:str)->dict:
     iterations=ds_prop_f['iter']
     ds_prop={'conf':ds_conf,'cons':ds_cons,'machines':machines,'tasks':tasks,'objectives':objs,\
              'algorithms':algs,'results_path':res_path,'ds_ids':ds_ids,'iterations':iterations}
+    if index:
+        ds_prop['index']=ds_idx
     return ds_prop
 
 def th_makespan(mach: List[Machine], tasks: List[Task])->float:
@@ -188,61 +215,35 @@ def maxmin_core(mach: List[Machine],tasks:List[Task],ct=None)->None:
     @type mach: List[Machine]
     @param tasks: List of tasks
     @type tasks: List[Task]
+    @param ct: Optional completion time matrix (e.g., returned by @maxmin_makespan_thr_core)
+    @type ct: CompletionTimeMatrix
     '''
     
     # Calculate the initial completion time matrix of all tasks over all machines
-    if not ct:
-        ct=[]
-        for i in range(len(tasks)):
-            ct.append([])
-            if (not tasks[i].m) or (tasks[i].m==-1): # Make sure that task i has not already been allocated
-                for j in range(len(mach)):
-                    ct[i].append(mach[j].makespan+tasks[i].length/mach[j].speed)
+    if not isinstance(ct,CompletionTimeMatrix):
+        ct=CompletionTimeMatrix(mach,tasks,ct)
     
     # Temporary counter to hold number of tasks that has been assigned to machines
     tmp_cnt=len(tasks)
     
     # Repeat until all tasks are assigned
     while tmp_cnt!=0:
-        machine_min=-1      # Machine index with minimum completion time (initialized to -1 which corresponds to no machine)
-        job_min_ls=[]       # List with tasks and the 
-        tmp_max_ct=sys.float_info.max   # Maximum completion time (initialized to maximum float value)
-        tmp_min_ct=0.0                  # Minimum completion time (initialized to 0.0)
+        # Find, for each task, the machine with minimum completion time. Then, find the task with maximum completion time among them
+        job_max_min,machine_max_min,tmp_min_ct,_=ct.maxMin()
+        if job_max_min==-1: # All tasks have been assigned
+            break
         
-        # Traverse all completion time job by job to find the machine for each job with minimum completion time
-        for job_no in range(len(tasks)):
-            if (not tasks[job_no].m) or (tasks[job_no].m==-1):
-                for machine_no in range(len(mach)):
-                    if ct[job_no][machine_no]<=tmp_max_ct:
-                        machine_min=machine_no
-                        tmp_max_ct=ct[job_no][machine_no]  # Current increase in machine makespan (i.e., availability time)
-                # Add current job with machine that gives minimum completion time to the list job_min_ls
-                job_min_ls.append([job_no,machine_min])
-            # Reset tmp_max_ct to be used in the comparison of the next job, as well as machine_min
-            tmp_max_ct=sys.float_info.max
-            machine_min=-1
-                        
-        # Find the task in job_min_ls with maximum completion time
-        for i in job_min_ls:
-            if ct[i[0]][i[1]]>=tmp_min_ct:
-                job_max_min=i[0]
-                machine_max_min=i[1]
-                tmp_min_ct=ct[i[0]][i[1]]
-                
         # Assign found task to the corresponding machine that gives the max-min completion time
-        if job_min_ls:  # Check job_min_ls is not empty
-            mach[machine_max_min].addTask(tasks[job_max_min])
+        ct.assign(job_max_min,machine_max_min)
         
         # Decrement number of assigned tasks by one
         tmp_cnt-=1
         
-        # Modify completion time for other tasks on found machine
-        if tmp_cnt>=0:
-            for i in range(len(tasks)):
-                if (not tasks[i].m) or (tasks[job_no].m==-1):
-                    ct[i][machine_max_min]+=tmp_min_ct
+        # Modify completion time for other tasks on found machine. Tasks skipped by a previous phase (i.e., t.m==-1) 
+        # are modified only as long as the last task is still skipped
+        ct.addToColumn(machine_max_min,tmp_min_ct,ct.state[-1]==SKIPPED)
         
-def maxmin_makespan_thr_core(mach: List[Machine],tasks:List[Task],makespan_in)->None:
+def maxmin_makespan_thr_core(mach: List[Machine],tasks:List[Task],makespan_in)->CompletionTimeMatrix:
     ''' This function acts as @maxmin_core function except that the tasks are allocated to machines as the initial 
     makespan of each machine does not exceed a given threshold in the first phase. In the second phase, the 
     remaining tasks from the first phase are allocated normally as maxmin
@@ -252,57 +253,31 @@ def maxmin_makespan_thr_core(mach: List[Machine],tasks:List[Task],makespan_in)->
     @type tasks: List[Task]
     @param makespan_thr: Makespan threshold for first phase of assignment
     @type makespan_thr: Double
+    @return: Completion time matrix to be used by the second phase, if any
+    @rtype: CompletionTimeMatrix
     '''
     
     # Keep a copy of the makespan input threshold
     makespan_thr=makespan_in
     
     # Calculate the initial completion time matrix of all tasks over all machines
-    ct=[]
-    for i in range(len(tasks)):
-        ct.append([])
-        if (not tasks[i].m) or (tasks[i].m==-1): # Make sure that task i has not already been allocated
-            for j in range(len(mach)):
-                ct[i].append(mach[j].makespan+tasks[i].length/mach[j].speed)
+    ct=CompletionTimeMatrix(mach,tasks)
         
     # Temporary counter to hold number of tasks that has been assigned to machines
-    tmp_cnt=len(ct)
+    tmp_cnt=len(tasks)
     
     # Tasks are allocated in MAXMIN way as long as completion time does not exceed makespan threshold.
     # Remaining tasks (i.e., tasks whose allocated machines are -1) are allocated some other way (e.g., original MAXMIN without makespan threshold)
     while tmp_cnt!=0:
-        machine_min=-1      # Machine index with minimum completion time (initialized to -1 which corresponds to no machine)
-        job_min_ls=[]       # List with tasks and the 
-        tmp_max_ct=makespan_thr   # Maximum completion time (initialized to makespan threshold)
-        tmp_min_ct=0.0      # Minimum completion time (initialized to 0.0)
-        machine_max_min=-1  # Machine with maximum completion time for job among list of jobs with minimum completion times 
-        job_max_min=-1      # Task with maximum completion time among list of jobs with minimum completion times
+        # Find the task with maximum completion time among tasks with minimum completion times that do not exceed the makespan threshold
+        job_max_min,machine_max_min,tmp_min_ct,no_mach=ct.maxMin(False,makespan_thr)
         
-        # Traverse all completion time job by job to find the machine for each job with minimum completion time
-        for job_no in range(len(tasks)):
-            if (not tasks[job_no].m):    # Make sure the job hasn't been already allocated, nor already been investigated (i.e., machine=-1)
-                for machine_no in range(len(mach)):
-                    if ct[job_no][machine_no]<=tmp_max_ct:
-                        machine_min=machine_no
-                        tmp_max_ct=ct[job_no][machine_no]  # Current increase in machine makespan (i.e., availability time)
-                # Add current job with machine that gives minimum completion time to the list job_min_ls
-                job_min_ls.append([job_no,machine_min])
-                if machine_min==-1:
-                    tasks[job_no].m=-1
-            # Reset tmp_max_ct to be used in the comparison of the next job, as well as machine_min
-            tmp_max_ct=makespan_thr
-            machine_min=-1
-                        
-        # Find the task in job_min_ls with maximum completion time that does not exceed the makespan threshold (i.e., machine_min!=-1) 
-        for i in job_min_ls:
-            if ct[i[0]][i[1]]>=tmp_min_ct and i[1]!=-1:
-                job_max_min=i[0]
-                machine_max_min=i[1]
-                tmp_min_ct=ct[i[0]][i[1]]
+        # Tasks without any machine within the makespan threshold are marked as investigated (i.e., machine=-1)
+        ct.skip(no_mach)
                 
         # Assign found task, if any, to the corresponding machine that gives the max-min completion time
         if job_max_min!=-1:
-            mach[machine_max_min].addTask(tasks[job_max_min])
+            ct.assign(job_max_min,machine_max_min)
         else:   # No task with completion time that is less than makespan threshold. So, go to the second phase
             break
         
@@ -310,10 +285,7 @@ def maxmin_makespan_thr_core(mach: List[Machine],tasks:List[Task],makespan_in)->
         tmp_cnt-=1
         
         # Modify completion time for other tasks on found machine
-        if tmp_cnt>=0 and job_max_min!=-1:
-            for i in range(len(ct)):
-                if not tasks[i].m:
-                    ct[i][machine_max_min]+=tmp_min_ct
+        ct.addToColumn(machine_max_min,tmp_min_ct)
                 
         # Return ct to be used by another scheduling algorithm
         return ct
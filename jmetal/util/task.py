@@ -70,6 +70,5 @@ def genTasks(ds_id:int, task_conf:DataFrame)->List[Task]:
     @rtype: List[Task]    
     '''
     
-    import copy
-    
-    return copy.deepcopy([Task(ds_id,i.task_id,i.length) for i in task_conf.itertuples() if i.dataset_conf_id==ds_id])
\ No newline at end of file
+    sel=task_conf[task_conf['dataset_conf_id']==ds_id]   # Filter rows of the dataset once, instead of a Python-level scan
+    return [Task(ds_id,i,l) for i,l in zip(sel['task_id'].tolist(),sel['length'].tolist())]
\ No newline at end of file
@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from jmetal.util.checkpoint import Checkpoint, load_checkpoint
+
+
+class CheckpointTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'run.ckpt')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_should_save_and_load_keep_shared_references(self):
+        solution = [1.0, 2.0]
+        Checkpoint(self.path).save({'population': [solution], 'ranking': [[solution]]})
+
+        state = load_checkpoint(self.path)
+
+        self.assertEqual([[1.0, 2.0]], state['population'])
+        self.assertIs(state['population'][0], state['ranking'][0][0])
+
+    def test_should_is_due_count_the_interval(self):
+        checkpoint = Checkpoint(self.path, interval=3)
+
+        self.assertEqual([False, False, True, False, False, True], [checkpoint.is_due() for _ in range(6)])
+
+    def test_should_is_due_wait_for_the_minimum_time(self):
+        checkpoint = Checkpoint(self.path, min_seconds=3600.0)
+
+        self.assertFalse(checkpoint.is_due())
+
+    def test_should_a_failed_save_keep_the_previous_checkpoint(self):
+        checkpoint = Checkpoint(self.path)
+        checkpoint.save({'evaluations': 1})
+
+        with mock.patch('pickle.dump', side_effect=IOError("Disk full")):
+            with self.assertRaises(IOError):
+                checkpoint.save({'evaluations': 2})
+
+        self.assertEqual({'evaluations': 1}, load_checkpoint(self.path))
+        self.assertEqual(['run.ckpt'], os.listdir(self.dir))
+
+    def test_should_an_invalid_interval_raise_an_exception(self):
+        with self.assertRaises(Exception):
+            Checkpoint(self.path, interval=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+import numpy
+
+from jmetal.util.completion_time import CompletionTimeMatrix, UNASSIGNED, SKIPPED, ASSIGNED
+from jmetal.util.machine import Machine
+from jmetal.util.task import Task
+from jmetal.util.sched_utils import maxmin_core
+
+
+class CompletionTimeMatrixTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.machines = [Machine(1, 0, 1.0), Machine(1, 1, 2.0)]
+        self.tasks = [Task(1, 0, 4.0), Task(1, 1, 2.0), Task(1, 2, 6.0)]
+
+    def test_should_constructor_compute_the_initial_completion_times(self):
+        ct = CompletionTimeMatrix(self.machines, self.tasks)
+
+        numpy.testing.assert_array_equal(numpy.array([[4.0, 2.0], [2.0, 1.0], [6.0, 3.0]]), ct.ct)
+        self.assertEqual(3, ct.numUnassigned())
+
+    def test_should_constructor_accept_a_list_with_empty_rows_for_assigned_tasks(self):
+        self.machines[0].addTask(self.tasks[1])
+        ct = CompletionTimeMatrix(self.machines, self.tasks, [[4.0, 2.0], [], [6.0, 3.0]])
+
+        self.assertEqual([UNASSIGNED, ASSIGNED, UNASSIGNED], list(ct.state))
+        self.assertTrue(numpy.all(numpy.isinf(ct.ct[1])))
+
+    def test_should_min_min_return_the_minimum_completion_time(self):
+        ct = CompletionTimeMatrix(self.machines, self.tasks)
+
+        self.assertEqual((1, 1, 1.0), ct.minMin())
+
+    def test_should_min_min_break_ties_by_lowest_task_then_lowest_machine(self):
+        machines = [Machine(1, 0, 1.0), Machine(1, 1, 1.0)]
+        tasks = [Task(1, 0, 3.0), Task(1, 1, 3.0)]
+        ct = CompletionTimeMatrix(machines, tasks)
+
+        self.assertEqual((0, 0, 3.0), ct.minMin())
+
+    def test_should_max_min_break_ties_by_highest_task_then_highest_machine(self):
+        machines = [Machine(1, 0, 1.0), Machine(1, 1, 1.0)]
+        tasks = [Task(1, 0, 3.0), Task(1, 1, 3.0)]
+        ct = CompletionTimeMatrix(machines, tasks)
+
+        job_no, machine_no, value, no_machine = ct.maxMin()
+
+        self.assertEqual((1, 1, 3.0), (job_no, machine_no, value))
+        self.assertEqual(0, len(no_machine))
+
+    def test_should_max_min_report_tasks_without_machine_within_the_threshold(self):
+        ct = CompletionTimeMatrix(self.machines, self.tasks)
+
+        job_no, machine_no, value, no_machine = ct.maxMin(False, 2.5)
+
+        self.assertEqual((0, 1, 2.0), (job_no, machine_no, value))
+        self.assertEqual([2], list(no_machine))
+
+    def test_should_assign_exclude_the_task_from_later_selections(self):
+        ct = CompletionTimeMatrix(self.machines, self.tasks)
+        ct.assign(1, 1)
+
+        self.assertEqual(self.machines[1], self.tasks[1].m)
+        self.assertEqual(1.0, self.machines[1].makespan)
+        self.assertEqual(2, ct.numUnassigned())
+        self.assertEqual((0, 1, 2.0), ct.minMin())
+
+    def test_should_add_to_column_skip_assigned_and_skipped_tasks_by_default(self):
+        ct = CompletionTimeMatrix(self.machines, self.tasks)
+        ct.assign(1, 1)
+        ct.skip(numpy.array([2]))
+        ct.addToColumn(1, 1.0)
+
+        self.assertEqual(-1, self.tasks[2].m)
+        self.assertEqual(SKIPPED, ct.state[2])
+        self.assertEqual(3.0, ct.ct[0, 1])
+        self.assertEqual(3.0, ct.ct[2, 1])
+
+        ct.addToColumn(1, 1.0, True)
+        self.assertEqual(4.0, ct.ct[2, 1])
+
+
+class MaxMinCoreTestCases(unittest.TestCase):
+
+    def test_should_maxmin_core_assign_all_tasks(self):
+        machines = [Machine(1, 0, 1.0), Machine(1, 1, 2.0)]
+        tasks = [Task(1, 0, 4.0), Task(1, 1, 2.0), Task(1, 2, 6.0)]
+
+        maxmin_core(machines, tasks)
+
+        self.assertTrue(all(task.m in machines for task in tasks))
+        self.assertEqual([2], [task.id for task in machines[1].tasks[:1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
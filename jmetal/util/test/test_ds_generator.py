@@ -0,0 +1,105 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+import pandas as pd
+
+from jmetal.util.ds_generator import genDataset, sampleDistribution
+from jmetal.util.machine import genMachines
+from jmetal.util.sched_experiment import runExperiments
+from jmetal.util.sched_utils import load_ds
+from jmetal.util.task import genTasks
+
+
+class GenDatasetTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def generate(self, name, **kwargs):
+        return genDataset(os.path.join(self.dir, name), **kwargs)
+
+    def test_should_load_ds_read_the_generated_datasets(self):
+        conf = self.generate('ds', datasets=[(50, 3), (20, 4)], seed=1)
+
+        ds_prop = load_ds(conf, index=True)
+
+        self.assertEqual([1, 2], list(ds_prop['conf']['id']))
+        self.assertEqual(['all'], ds_prop['ds_ids'])
+        self.assertEqual(4, len(genMachines(2, ds_prop['machines'])))
+        tasks = genTasks(1, ds_prop['tasks'])
+        self.assertEqual(list(range(50)), [t.id for t in tasks])
+        self.assertTrue(all(1.0 <= t.length <= 100.0 for t in tasks))
+        self.assertEqual(20, len(ds_prop['index'].getTasks(2)))
+
+    def test_should_the_same_seed_give_the_same_files_whatever_the_chunk_size(self):
+        conf_1 = self.generate('a', datasets=[(1000, 5), (10, 2)], seed=3,
+                               task_length={'name': 'lognormal', 'mean': 2.0, 'sigma': 1.0})
+        conf_2 = self.generate('b', datasets=[(1000, 5), (10, 2)], seed=3, chunk_size=7,
+                               task_length={'name': 'lognormal', 'mean': 2.0, 'sigma': 1.0})
+
+        for name in ['machines', 'tasks']:
+            with open(os.path.join(os.path.dirname(conf_1), name + '.csv')) as f_1, \
+                    open(os.path.join(os.path.dirname(conf_2), name + '.csv')) as f_2:
+                self.assertEqual(f_1.read(), f_2.read())
+
+    def test_should_machine_types_and_cost_relation_be_applied(self):
+        conf = self.generate('ds', datasets=[(10, 50)], seed=1, machine_types=2,
+                             machine_cost={'name': 'speed', 'factor': 0.5, 'exponent': 2.0},
+                             machine_energy={'name': 'constant', 'value': 3.0})
+
+        machines = load_ds(conf)['machines']
+
+        self.assertLessEqual(len(set(machines['speed'])), 2)
+        numpy.testing.assert_allclose(0.5 * machines['speed'] ** 2, machines['cost'])
+        self.assertEqual({3.0}, set(machines['energy']))
+
+    def test_should_generated_datasets_run_the_experiments(self):
+        conf = self.generate('ds', datasets=[(30, 3), (5, 2)], seed=1, algorithms=['MINMIN', 'MAXMIN'])
+        ds_prop = load_ds(conf, index=True)
+        running_time = os.path.join(ds_prop['results_path'], 'running_time.csv')
+
+        runExperiments(ds_prop, running_time, processes=1)
+
+        self.assertEqual(4, len(pd.read_csv(running_time)))
+
+    def test_should_datasets_without_tasks_or_machines_raise_an_exception(self):
+        with self.assertRaises(Exception):
+            self.generate('tasks', datasets=[(30, 3), (0, 2)], seed=1)
+        with self.assertRaises(Exception):
+            self.generate('machines', datasets=[(30, 0)], seed=1)
+
+    def test_should_the_smallest_datasets_run_the_experiments(self):
+        conf = self.generate('ds', datasets=[(1, 1), (1, 3), (4, 1)], seed=1,
+                             algorithms=['BMFLIS', 'MINMIN', 'MAXMIN', 'BMFMMS', 'M3FM2S'])
+        ds_prop = load_ds(conf, index=True)
+        running_time = os.path.join(ds_prop['results_path'], 'running_time.csv')
+
+        runExperiments(ds_prop, running_time, processes=1)
+
+        self.assertEqual(3 * 5, len(pd.read_csv(running_time)))
+
+    def test_should_non_positive_lengths_raise_an_exception(self):
+        with self.assertRaises(Exception):
+            self.generate('ds', datasets=[(100, 2)], task_length={'name': 'normal', 'mean': 0.0, 'std': 1.0})
+
+    def test_should_unknown_distributions_raise_an_exception(self):
+        with self.assertRaises(Exception):
+            self.generate('ds', datasets=[(10, 2)], machine_speed={'name': 'weibull', 'a': 1.0})
+        with self.assertRaises(Exception):
+            sampleDistribution(numpy.random.default_rng(1), {'name': 'uniform', 'low': 1.0}, 10)
+
+    def test_should_min_clip_the_sampled_values(self):
+        values = sampleDistribution(numpy.random.default_rng(1),
+                                    {'name': 'normal', 'mean': 0.0, 'std': 1.0, 'min': 0.5}, 1000)
+
+        self.assertEqual(0.5, values.min())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+import pandas as pd
+
+from jmetal.util.ds_index import DatasetIndex
+from jmetal.util.machine import genMachines
+from jmetal.util.sched_utils import load_ds
+from jmetal.util.task import genTasks
+
+
+class DatasetIndexTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.machines = pd.DataFrame({'dataset_conf_id': [2, 1, 2, 1], 'machine_id': [0, 0, 1, 1],
+                                      'speed': [1.0, 2.0, 3.0, 4.0]})
+        self.tasks = pd.DataFrame({'dataset_conf_id': [1, 2, 2, 1, 2], 'task_id': [0, 0, 1, 1, 2],
+                                   'length': [5.0, 6.0, 7.0, 8.0, 9.0]})
+        self.index = DatasetIndex(self.machines, self.tasks)
+
+    def test_should_get_machines_and_tasks_work_as_gen_machines_and_gen_tasks(self):
+        for ds_id in [1, 2]:
+            self.assertEqual([(m.id, m.speed) for m in genMachines(ds_id, self.machines)],
+                             [(m.id, m.speed) for m in self.index.getMachines(ds_id)])
+            self.assertEqual([(t.id, t.length) for t in genTasks(ds_id, self.tasks)],
+                             [(t.id, t.length) for t in self.index.getTasks(ds_id)])
+
+    def test_should_ids_be_python_scalars(self):
+        self.assertIs(int, type(self.index.getTasks(1)[0].id))
+        self.assertIs(int, type(genTasks(1, self.tasks)[0].id))
+        self.assertIs(int, type(self.index.getMachines(1)[0].id))
+
+    def test_should_unknown_dataset_give_empty_lists(self):
+        self.assertEqual([], self.index.getMachines(3))
+        self.assertEqual([], self.index.getTasks(0))
+
+    def test_should_get_fleet_return_the_dataset_arrays(self):
+        fleet = self.index.getFleet(2)
+
+        self.assertEqual([1.0, 3.0], list(fleet.speed))
+        self.assertEqual([0, 1, 2], list(fleet.task_id))
+        self.assertEqual([6.0, 7.0, 9.0], list(fleet.length))
+        self.assertEqual([1, 2], self.index.datasetIds())
+
+    def test_should_save_and_load_keep_the_index(self):
+        path = os.path.join(tempfile.mkdtemp(), 'index.npz')
+        try:
+            self.index.save(path, 'abc')
+
+            self.assertIsNone(DatasetIndex.load(path, 'other'))
+            loaded = DatasetIndex.load(path, 'abc')
+            for c in self.index.task_cols:
+                numpy.testing.assert_array_equal(self.index.task_cols[c], loaded.task_cols[c])
+            self.assertEqual([(t.id, t.length) for t in self.index.getTasks(1)],
+                             [(t.id, t.length) for t in loaded.getTasks(1)])
+        finally:
+            shutil.rmtree(os.path.dirname(path))
+
+
+class LoadDsIndexTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        files = {'ds_conf': pd.DataFrame({'id': [1, 2]}),
+                 'ds_cons': pd.DataFrame({'name': ['a'], 'value': [1]}),
+                 'machines': pd.DataFrame({'dataset_conf_id': [2, 1], 'machine_id': [0, 0], 'speed': [1.0, 2.0]}),
+                 'tasks': pd.DataFrame({'dataset_conf_id': [1, 2], 'task_id': [0, 0], 'length': [5.0, 6.0]})}
+        conf = ''
+        for name, df in files.items():
+            path = os.path.join(self.dir, name + '.csv')
+            df.to_csv(path, sep=';', index=False)
+            conf += name + ':\n path: "' + path + '"\n sep: ";"\n'
+        conf += 'objectives:\n- name: makespan\n  weight: 1.0\nalgorithms:\n- MINMIN\nresults_path: "' + self.dir + \
+                '"\nds_id:\n- all\niter: 1\n'
+        self.conf = os.path.join(self.dir, 'conf.yml')
+        with open(self.conf, 'w') as f:
+            f.write(conf)
+        self.cache = os.path.join(self.dir, 'cache')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_should_load_ds_build_the_index(self):
+        ds_prop = load_ds(self.conf, index=True)
+
+        self.assertEqual([2.0], [m.speed for m in ds_prop['index'].getMachines(1)])
+        self.assertNotIn('index', load_ds(self.conf))
+
+    def test_should_load_ds_reuse_the_cache_until_files_are_modified(self):
+        load_ds(self.conf, index=True, cache_dir=self.cache)
+        self.assertEqual(1, len(os.listdir(self.cache)))
+
+        ds_prop = load_ds(self.conf, index=True, cache_dir=self.cache)
+        self.assertEqual([6.0], [t.length for t in ds_prop['index'].getTasks(2)])
+        self.assertEqual(1, len(os.listdir(self.cache)))
+
+        tasks_path = os.path.join(self.dir, 'tasks.csv')
+        pd.DataFrame({'dataset_conf_id': [2], 'task_id': [0], 'length': [7.5]}).to_csv(tasks_path, sep=';', index=False)
+        os.utime(tasks_path, ns=(0, 10 ** 9))
+        ds_prop = load_ds(self.conf, index=True, cache_dir=self.cache)
+
+        self.assertEqual([7.5], [t.length for t in ds_prop['index'].getTasks(2)])
+        self.assertEqual(2, len(os.listdir(self.cache)))
+
+
+if __name__ == '__main__':
+    unittest.main()
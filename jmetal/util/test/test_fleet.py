@@ -0,0 +1,136 @@
+import random
+import unittest
+from unittest import mock
+
+import numpy
+import pandas as pd
+
+from jmetal.algorithm.multiobjective.bmflis import BMFLIS
+from jmetal.algorithm.multiobjective.bmfmms import BMFMMS
+from jmetal.algorithm.multiobjective.m3fm2s import M3FM2S
+from jmetal.algorithm.multiobjective.maxmin import MAXMIN
+from jmetal.algorithm.multiobjective.minmin import MINMIN
+from jmetal.problem.multiobjective.constrained import Schedule
+from jmetal.util.fleet import Fleet, fleetFromObjects, genFleet, NO_MACHINE
+from jmetal.util.machine import Machine, getMachMaxMakespan
+from jmetal.util.sched_utils import redTasks
+from jmetal.util.task import Task
+
+
+class FleetTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.fleet = Fleet(1, [0, 1], [1.0, 2.0], [10, 11, 12], [4.0, 2.0, 6.0])
+
+    def test_should_add_task_update_makespan_and_assignment(self):
+        self.fleet.addTask(0, 1)
+        self.fleet.addTask(2, 1)
+
+        self.assertEqual([0.0, 5.0], list(self.fleet.makespan))
+        self.assertEqual([1, NO_MACHINE, 1], list(self.fleet.assignment))
+        self.assertEqual([0, 2], self.fleet.machineTasks(1))
+
+    def test_should_rem_task_keep_the_order_of_the_remaining_tasks(self):
+        for i in range(3):
+            self.fleet.addTask(i, 0)
+        self.fleet.remTask(1)
+
+        self.assertEqual([0, 2], self.fleet.machineTasks(0))
+        self.assertEqual(10.0, self.fleet.makespan[0])
+        self.assertEqual(NO_MACHINE, self.fleet.assignment[1])
+
+    def test_should_add_task_raise_an_exception_if_the_task_is_assigned(self):
+        self.fleet.addTask(0, 0)
+
+        with self.assertRaises(Exception):
+            self.fleet.addTask(0, 1)
+
+    def test_should_max_makespan_machine_work_as_get_mach_max_makespan(self):
+        self.assertEqual(-1, self.fleet.maxMakespanMachine())
+        self.fleet.addTask(2, 1)
+
+        self.assertEqual(1, self.fleet.maxMakespanMachine())
+        self.assertIs(self.fleet.machines()[1], getMachMaxMakespan(self.fleet.machines()))
+
+    def test_should_views_behave_like_machines_and_tasks(self):
+        machines, tasks = self.fleet.machines(), self.fleet.tasks()
+        machines[0].addTask(tasks[1])
+
+        self.assertIs(machines[0], tasks[1].m)
+        self.assertEqual([tasks[1]], machines[0].tasks)
+        self.assertEqual(2.0, machines[0].makespan)
+
+        tasks[0].m = -1
+        self.assertEqual(-1, tasks[0].m)
+
+        machines[0].resetMachine()
+        self.assertIsNone(tasks[1].m)
+        self.assertEqual(0.0, machines[0].makespan)
+
+    def test_should_views_not_copy_the_view_lists(self):
+        machines, tasks = self.fleet.machines(), self.fleet.tasks()
+        machines[1].addTask(tasks[2])
+        machines.clear()
+
+        self.assertEqual(2, len(self.fleet.machines()))
+        with mock.patch.object(Fleet, 'machines', side_effect=AssertionError), \
+                mock.patch.object(Fleet, 'tasks', side_effect=AssertionError):
+            self.assertIs(self.fleet._machineViews()[1], tasks[2].m)
+            self.assertEqual([tasks[2]], self.fleet._machineViews()[1].tasks)
+
+    def test_should_fleet_from_objects_preserve_assignments(self):
+        machines = [Machine(1, 0, 1.0), Machine(1, 1, 2.0)]
+        tasks = [Task(1, 0, 4.0), Task(1, 1, 2.0), Task(1, 2, 6.0)]
+        machines[1].addTask(tasks[2])
+        machines[1].addTask(tasks[0])
+
+        fleet = fleetFromObjects(machines, tasks)
+
+        self.assertEqual([2, 0], fleet.machineTasks(1))
+        self.assertEqual([machines[0].makespan, machines[1].makespan], list(fleet.makespan))
+
+    def test_should_gen_fleet_select_the_dataset(self):
+        mach_conf = pd.DataFrame({'dataset_conf_id': [1, 2, 2], 'machine_id': [0, 0, 1], 'speed': [1.0, 2.0, 3.0]})
+        task_conf = pd.DataFrame({'dataset_conf_id': [2, 1, 2], 'task_id': [0, 0, 1], 'length': [5.0, 6.0, 7.0]})
+
+        fleet = genFleet(2, mach_conf, task_conf)
+
+        self.assertEqual([0, 1], list(fleet.machine_id))
+        self.assertEqual([2.0, 3.0], list(fleet.speed))
+        self.assertEqual([5.0, 7.0], list(fleet.length))
+
+    def test_should_heuristics_give_the_same_results_on_fleet_views(self):
+        objectives = [{'name': 'makespan', 'weight': 1.0}]
+        for seed in range(20):
+            rand = random.Random(seed)
+            speeds = [rand.randint(1, 4) for _ in range(rand.randint(1, 5))]
+            lengths = [rand.randint(1, 20) for _ in range(rand.randint(1, 30))]
+            fleet = Fleet(1, range(len(speeds)), speeds, range(len(lengths)), lengths)
+
+            for alg in [MINMIN, MAXMIN, BMFLIS, BMFMMS, M3FM2S]:
+                machines = [Machine(1, i, s) for i, s in enumerate(speeds)]
+                tasks = [Task(1, i, l) for i, l in enumerate(lengths)]
+                expected = alg(Schedule(objectives, machines, tasks)).run()
+                result = alg(Schedule(objectives, fleet.machines(), fleet.tasks())).run()
+
+                self.assertEqual(expected['mach_res'], result['mach_res'])
+                self.assertEqual(expected['run_time']['max_makespan'], result['run_time']['max_makespan'])
+                self.assertTrue(numpy.all(fleet.assignment == NO_MACHINE))
+
+    def test_should_red_tasks_run_on_fleet_views(self):
+        machines = [Machine(1, 0, 1.0), Machine(1, 1, 1.0)]
+        tasks = [Task(1, i, l) for i, l in enumerate([5.0, 1.0, 1.0])]
+        for t in tasks:
+            machines[0].addTask(t)
+        fleet = fleetFromObjects(machines, tasks)
+
+        redTasks(machines, tasks)
+        redTasks(fleet.machines(), fleet.tasks())
+
+        self.assertEqual([[t.id for t in m.tasks] for m in machines],
+                         [[t.id for t in m.tasks] for m in fleet.machines()])
+        self.assertEqual([m.makespan for m in machines], list(fleet.makespan))
+
+
+if __name__ == '__main__':
+    unittest.main()
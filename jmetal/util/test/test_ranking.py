@@ -0,0 +1,304 @@
+import random
+import unittest
+
+import numpy
+
+from jmetal.core.population import Population
+from jmetal.core.solution import Solution
+from jmetal.util.comparator import DominanceComparator
+from jmetal.util.ranking import FastNonDominatedRanking, EfficientNonDominatedRanking, non_dominated_sort, \
+    objective_matrix, IncrementalNonDominatedRanking
+
+__author__ = "Antonio J. Nebro"
+
+
+def pairwise_ranking(solution_list):
+    """ Reference pairwise implementation of the non-dominated ranking of NSGA-II. Returns the fronts as lists of
+    indices """
+    dominate_me = [0] * len(solution_list)
+    i_dominate = [[] for _ in range(len(solution_list))]
+    for p in range(len(solution_list) - 1):
+        for q in range(p + 1, len(solution_list)):
+            result = DominanceComparator().compare(solution_list[p], solution_list[q])
+            if result == -1:
+                i_dominate[p].append(q)
+                dominate_me[q] += 1
+            elif result == 1:
+                i_dominate[q].append(p)
+                dominate_me[p] += 1
+
+    fronts = [[i for i in range(len(solution_list)) if dominate_me[i] == 0]]
+    while fronts[-1]:
+        front = []
+        for p in fronts[-1]:
+            for q in i_dominate[p]:
+                dominate_me[q] -= 1
+                if dominate_me[q] == 0:
+                    front.append(q)
+        fronts.append(front)
+
+    return fronts[:-1]
+
+
+def random_solutions(size, number_of_objectives, levels=None, constraints=False):
+    solution_list = []
+    for _ in range(size):
+        solution = Solution(1, number_of_objectives)
+        solution.variables = [0.0]
+        if levels:
+            solution.objectives = [float(random.randint(0, levels)) for _ in range(number_of_objectives)]
+        else:
+            solution.objectives = [random.random() for _ in range(number_of_objectives)]
+        if constraints and random.random() < 0.7:
+            solution.attributes["overall_constraint_violation"] = -float(random.randint(0, 3))
+        solution_list.append(solution)
+
+    return solution_list
+
+
+class FastNonDominatedRankingTestCases(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1)
+
+    def assert_same_ranking(self, solution_list, ranking):
+        expected = pairwise_ranking(solution_list)
+        subfronts = ranking.compute_ranking(solution_list)
+
+        self.assertEqual(len(expected), ranking.get_number_of_subfronts())
+        for rank, front in enumerate(expected):
+            self.assertEqual([solution_list[i] for i in front], subfronts[rank])
+            for i in front:
+                self.assertEqual(rank, solution_list[i].attributes["dominance_ranking"])
+
+    def test_should_compute_ranking_of_an_empty_list_return_no_subfronts(self):
+        ranking = FastNonDominatedRanking()
+
+        self.assertEqual([], ranking.compute_ranking([]))
+        self.assertEqual(0, ranking.get_number_of_subfronts())
+
+    def test_should_compute_ranking_of_two_non_dominated_solutions_return_one_subfront(self):
+        solution1 = Solution(1, 2)
+        solution1.objectives = [1.0, 2.0]
+        solution2 = Solution(1, 2)
+        solution2.objectives = [2.0, 1.0]
+
+        ranking = FastNonDominatedRanking()
+        subfronts = ranking.compute_ranking([solution1, solution2])
+
+        self.assertEqual([[solution1, solution2]], subfronts)
+
+    def test_should_compute_ranking_rank_a_feasible_solution_before_a_dominating_infeasible_one(self):
+        solution1 = Solution(1, 2)
+        solution1.objectives = [1.0, 1.0]
+        solution1.attributes["overall_constraint_violation"] = -1.0
+        solution2 = Solution(1, 2)
+        solution2.objectives = [2.0, 2.0]
+        solution2.attributes["overall_constraint_violation"] = 0.0
+
+        ranking = FastNonDominatedRanking()
+        subfronts = ranking.compute_ranking([solution1, solution2])
+
+        self.assertEqual([[solution2], [solution1]], subfronts)
+
+    def test_should_compute_ranking_be_equal_to_the_pairwise_ranking(self):
+        for number_of_objectives in [2, 3, 5]:
+            self.assert_same_ranking(random_solutions(150, number_of_objectives), FastNonDominatedRanking())
+
+    def test_should_compute_ranking_be_equal_to_the_pairwise_ranking_with_ties_and_constraints(self):
+        self.assert_same_ranking(random_solutions(200, 2, levels=6, constraints=True), FastNonDominatedRanking())
+        self.assert_same_ranking(random_solutions(200, 3, levels=3, constraints=True), FastNonDominatedRanking())
+
+    def test_should_compute_ranking_be_equal_to_the_pairwise_ranking_with_nan_objectives(self):
+        solution_list = random_solutions(60, 2, levels=4)
+        for solution in solution_list[::7]:
+            solution.objectives[random.randint(0, 1)] = float("nan")
+
+        self.assert_same_ranking(solution_list, FastNonDominatedRanking())
+
+    def test_should_compute_ranking_rank_a_solution_with_a_nan_objective(self):
+        solution_list = []
+        for objectives in [[float("nan"), 1.0], [0.2, 0.3], [0.4, 0.1]]:
+            solution = Solution(1, 2)
+            solution.objectives = objectives
+            solution_list.append(solution)
+
+        self.assert_same_ranking(solution_list, FastNonDominatedRanking())
+        self.assertEqual(3, sum(len(front) for front in FastNonDominatedRanking().compute_ranking(solution_list)))
+        self.assertIsNotNone(solution_list[0].attributes.get("dominance_ranking"))
+
+    def test_should_tiled_ranking_be_equal_to_the_pairwise_ranking(self):
+        solution_list = random_solutions(180, 2, levels=8, constraints=True)
+
+        self.assert_same_ranking(solution_list, FastNonDominatedRanking(max_block_elements=100))
+        self.assert_same_ranking(solution_list, FastNonDominatedRanking(max_block_elements=1))
+
+    def test_should_non_dominated_sort_be_independent_of_the_block_size(self):
+        objectives, violation = objective_matrix(random_solutions(300, 3, levels=5, constraints=True))
+
+        expected = non_dominated_sort(objectives, violation)
+        for max_block_elements in [1, 500, 10000]:
+            fronts = non_dominated_sort(objectives, violation, max_block_elements)
+            self.assertEqual([front.tolist() for front in expected], [front.tolist() for front in fronts])
+
+    def test_should_compute_ranking_of_a_population_set_the_ranking_attribute(self):
+        solution_list = random_solutions(50, 2, levels=5)
+        population = Population(1, 2, 0, [0.0], [1.0])
+        population.extend(solution_list)
+        expected = pairwise_ranking(solution_list)
+
+        subfronts = FastNonDominatedRanking().compute_ranking(population)
+
+        self.assertEqual(expected, [[solution.index for solution in front] for front in subfronts])
+        ranks = population.attribute("dominance_ranking")
+        for rank, front in enumerate(expected):
+            self.assertTrue(numpy.all(ranks[front] == rank))
+
+    def test_should_truncated_ranking_of_a_population_not_rank_the_remaining_solutions(self):
+        solution_list = random_solutions(50, 2, levels=5)
+        population = Population(1, 2, 0, [0.0], [1.0])
+        population.extend(solution_list)
+        expected = pairwise_ranking(solution_list)
+
+        FastNonDominatedRanking().compute_ranking(population, max_solutions=1)
+
+        self.assertEqual(expected[0], numpy.flatnonzero(population.has_attribute("dominance_ranking")).tolist())
+
+    def test_should_truncated_ranking_stop_once_max_solutions_are_ranked(self):
+        solution_list = random_solutions(200, 2, levels=8)
+        expected = pairwise_ranking(solution_list)
+
+        ranking = FastNonDominatedRanking()
+        subfronts = ranking.compute_ranking(solution_list, max_solutions=len(expected[0]) + 1)
+
+        self.assertEqual(2, len(subfronts))
+        self.assertEqual([[solution_list[i] for i in front] for front in expected[:2]], subfronts)
+        for i in expected[2]:
+            self.assertNotIn("dominance_ranking", solution_list[i].attributes)
+
+    def test_should_truncated_non_dominated_sort_return_a_prefix_of_the_fronts(self):
+        objectives, violation = objective_matrix(random_solutions(300, 3, levels=5))
+        expected = [front.tolist() for front in non_dominated_sort(objectives, violation)]
+
+        for max_solutions in [1, len(expected[0]), len(expected[0]) + 1, 300, 1000]:
+            for max_block_elements in [500, 10000]:
+                fronts = non_dominated_sort(objectives, violation, max_block_elements, max_solutions)
+                self.assertGreaterEqual(sum(len(front) for front in fronts), min(max_solutions, 300))
+                self.assertLess(sum(len(front) for front in fronts[:-1]), max_solutions)
+                self.assertEqual(expected[:len(fronts)], [front.tolist() for front in fronts])
+
+    def test_should_compute_ranking_count_the_pairwise_comparisons(self):
+        ranking = FastNonDominatedRanking()
+        ranking.compute_ranking(random_solutions(10, 2))
+
+        self.assertEqual(45, ranking.number_of_comparions)
+
+
+class EfficientNonDominatedRankingTestCases(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1)
+
+    def assert_same_fronts(self, solution_list, ranking):
+        expected = pairwise_ranking(solution_list)
+        subfronts = ranking.compute_ranking(solution_list)
+
+        self.assertEqual([sorted(front) for front in expected],
+                         [[solution_list.index(solution) for solution in front] for front in subfronts])
+        for rank, front in enumerate(expected):
+            for i in front:
+                self.assertEqual(rank, solution_list[i].attributes["dominance_ranking"])
+
+    def test_should_compute_ranking_of_an_empty_list_return_no_subfronts(self):
+        self.assertEqual([], EfficientNonDominatedRanking().compute_ranking([]))
+
+    def test_should_compute_ranking_be_equal_to_the_pairwise_ranking(self):
+        for binary_search in [True, False]:
+            for number_of_objectives in [1, 2, 3, 5]:
+                self.assert_same_fronts(random_solutions(150, number_of_objectives),
+                                        EfficientNonDominatedRanking(binary_search))
+
+    def test_should_compute_ranking_be_equal_to_the_pairwise_ranking_with_ties_and_duplicates(self):
+        for binary_search in [True, False]:
+            self.assert_same_fronts(random_solutions(200, 2, levels=5), EfficientNonDominatedRanking(binary_search))
+            self.assert_same_fronts(random_solutions(200, 3, levels=3), EfficientNonDominatedRanking(binary_search))
+
+    def test_should_compute_ranking_be_equal_to_the_pairwise_ranking_with_constraints(self):
+        for binary_search in [True, False]:
+            solution_list = random_solutions(200, 2, levels=6)
+            for solution in solution_list:
+                solution.attributes["overall_constraint_violation"] = -float(random.randint(0, 3))
+            self.assert_same_fronts(solution_list, EfficientNonDominatedRanking(binary_search))
+
+    def test_should_compute_ranking_be_equal_to_the_pairwise_ranking_with_nan_objectives(self):
+        solution_list = random_solutions(60, 2, levels=4)
+        for solution in solution_list[::7]:
+            solution.objectives[random.randint(0, 1)] = float("nan")
+
+        self.assert_same_fronts(solution_list, EfficientNonDominatedRanking())
+
+    def test_should_truncated_ranking_keep_only_the_fronts_needed(self):
+        solution_list = random_solutions(200, 3, levels=4)
+        expected = pairwise_ranking(solution_list)
+
+        subfronts = EfficientNonDominatedRanking().compute_ranking(solution_list, max_solutions=len(expected[0]))
+
+        self.assertEqual([[solution_list[i] for i in sorted(expected[0])]], subfronts)
+        for i in expected[1]:
+            self.assertNotIn("dominance_ranking", solution_list[i].attributes)
+
+    def test_should_compute_ranking_fall_back_if_some_solutions_have_no_constraint_violation(self):
+        self.assert_same_fronts(random_solutions(100, 2, levels=6, constraints=True), EfficientNonDominatedRanking())
+
+
+class IncrementalNonDominatedRankingTestCases(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1)
+
+    def assert_same_fronts(self, solution_list, ranking):
+        expected = pairwise_ranking(solution_list)
+
+        self.assertEqual([sorted(id(solution_list[i]) for i in front) for front in expected],
+                         [sorted(id(solution) for solution in front) for front in ranking.ranked_sublists])
+        for rank, front in enumerate(expected):
+            for i in front:
+                self.assertEqual(rank, solution_list[i].attributes["dominance_ranking"])
+
+    def test_should_add_return_the_changed_subfronts(self):
+        solution1 = Solution(1, 2)
+        solution1.objectives = [2.0, 2.0]
+        solution2 = Solution(1, 2)
+        solution2.objectives = [3.0, 3.0]
+        solution3 = Solution(1, 2)
+        solution3.objectives = [1.0, 1.0]
+
+        ranking = IncrementalNonDominatedRanking()
+        ranking.compute_ranking([solution1, solution2])
+
+        self.assertEqual([0, 1, 2], ranking.add(solution3))
+        self.assertEqual([[solution3], [solution1], [solution2]], ranking.ranked_sublists)
+
+    def test_should_add_and_remove_be_equal_to_the_pairwise_ranking(self):
+        for levels, constraints in [(None, False), (4, False), (3, True)]:
+            solution_list = random_solutions(120, 2, levels=levels)
+            if constraints:
+                for solution in solution_list:
+                    solution.attributes["overall_constraint_violation"] = -float(random.randint(0, 2))
+
+            ranking = IncrementalNonDominatedRanking()
+            ranking.compute_ranking(solution_list[:60])
+            current = solution_list[:60]
+            for solution in solution_list[60:]:
+                ranking.add(solution)
+                current.append(solution)
+                self.assert_same_fronts(current, ranking)
+
+                removed = random.choice(current if random.random() < 0.3 else ranking.ranked_sublists[-1])
+                ranking.remove(removed)
+                current = [member for member in current if member is not removed]
+                self.assert_same_fronts(current, ranking)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from jmetal.algorithm.multiobjective.minmin import MINMIN
+from jmetal.problem.multiobjective.constrained import Schedule
+from jmetal.util.machine import Machine
+from jmetal.util.result_store import ResultStore, NONE_ID
+from jmetal.util.sched_experiment import runExperiments
+from jmetal.util.task import Task
+
+
+class ResultStoreTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'store')
+        self.problem = Schedule([{'name': 'makespan', 'weight': 1.0}], [Machine(1, 0, 1.0), Machine(1, 1, 2.0)],
+                                [Task(1, 0, 4.0), Task(1, 1, 2.0), Task(1, 2, 6.0)])
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_should_results_be_written_only_when_flushed(self):
+        store = ResultStore(self.path)
+        store.add(MINMIN(self.problem).run(ds_id=1, iteration=0))
+
+        self.assertEqual([], store.chunks())
+        self.assertFalse(store.isCompleted(1, 'MINMIN', 0))
+
+        store.flush()
+
+        self.assertEqual(1, len(store.chunks()))
+        self.assertTrue(store.isCompleted(1, 'MINMIN', 0))
+
+    def test_should_chunks_hold_at_most_chunk_size_runs(self):
+        with ResultStore(self.path, chunk_size=2) as store:
+            for i in range(5):
+                store.add(MINMIN(self.problem).run(ds_id=1, iteration=i))
+
+        self.assertEqual(3, len(store.chunks()))
+        self.assertEqual(5, len(store.runTimeFrame()))
+
+    def test_should_reopened_store_know_completed_runs(self):
+        with ResultStore(self.path) as store:
+            store.add(MINMIN(self.problem).run(ds_id=1, iteration=0))
+            store.add(MINMIN(self.problem).run())
+
+        store = ResultStore(self.path)
+        store.add(MINMIN(self.problem).run(ds_id=1, iteration=1))
+        store.close()
+
+        self.assertEqual({(1, 'MINMIN', 0), (NONE_ID, 'MINMIN', NONE_ID), (1, 'MINMIN', 1)}, store.completed())
+        self.assertEqual(2, len(store.chunks()))
+
+    def test_should_opened_store_remove_interrupted_chunks(self):
+        with ResultStore(self.path) as store:
+            store.add(MINMIN(self.problem).run(ds_id=1, iteration=0))
+        with open(os.path.join(self.path, 'tmpabc.tmp'), 'wb') as f:
+            f.write(b'partial chunk')
+
+        store = ResultStore(self.path)
+
+        self.assertEqual(['chunk_000000.npz'], sorted(os.listdir(self.path)))
+        self.assertEqual({(1, 'MINMIN', 0)}, store.completed())
+
+    def test_should_machines_frame_give_back_the_run_results(self):
+        res = MINMIN(self.problem).run(ds_id=1, iteration=0)
+        with ResultStore(self.path) as store:
+            store.add(res)
+
+        machines = store.machinesFrame()
+        run_time = store.runTimeFrame()
+
+        self.assertEqual([m['tasks'] for m in res['mach_res']], list(machines['tasks']))
+        self.assertEqual([m['makespan'] for m in res['mach_res']], list(machines['makespan']))
+        self.assertEqual(res['run_time']['max_makespan'], run_time['max_makespan'][0])
+
+    def test_should_restarted_sweep_skip_completed_runs(self):
+        ds_prop = {'conf': pd.DataFrame({'id': [1, 2]}),
+                   'machines': pd.DataFrame({'dataset_conf_id': [1, 1, 2], 'machine_id': [0, 1, 0], 'speed': [1.0, 2.0, 3.0]}),
+                   'tasks': pd.DataFrame({'dataset_conf_id': [1, 2, 2], 'task_id': [0, 0, 1], 'length': [5.0, 6.0, 7.0]}),
+                   'objectives': [{'name': 'makespan', 'weight': 1.0}], 'algorithms': ['MINMIN', 'MAXMIN'],
+                   'ds_ids': ['all'], 'iterations': 2}
+        with ResultStore(self.path) as store:
+            store.add(MINMIN(self.problem).run(ds_id=1, iteration=0))
+            store.add(MINMIN(self.problem).run(ds_id=1, iteration=1))
+            store.add(MINMIN(self.problem).run(ds_id=2, iteration=1))
+
+        runs = []
+        with ResultStore(self.path) as store:
+            runExperiments(ds_prop, processes=1, store=store,
+                           callback=lambda res: runs.extend((res['ds_id'], r['run_time']['algorithm'],
+                                                             r['run_time']['iteration']) for r in res['runs']))
+
+        self.assertEqual({(1, 'MAXMIN', 0), (1, 'MAXMIN', 1), (2, 'MINMIN', 0), (2, 'MAXMIN', 0), (2, 'MAXMIN', 1)},
+                         set(runs))
+        self.assertEqual(8, len(store.completed()))
+
+        runs = []
+        with ResultStore(self.path) as store:
+            runExperiments(ds_prop, processes=1, store=store, callback=lambda res: runs.append(res))
+        self.assertEqual([], runs)
+
+
+if __name__ == '__main__':
+    unittest.main()
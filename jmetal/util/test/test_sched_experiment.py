@@ -0,0 +1,92 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from jmetal.algorithm.multiobjective.minmin import MINMIN
+from jmetal.problem.multiobjective.constrained import Schedule
+from jmetal.util.machine import genMachines
+from jmetal.util.sched_experiment import runExperiments, splitIterations
+from jmetal.util.task import genTasks
+
+
+class RunExperimentsTestCases(unittest.TestCase):
+
+    def setUp(self):
+        rand = random.Random(1)
+        machines, tasks = [], []
+        for ds_id in range(1, 5):
+            machines.extend({'dataset_conf_id': ds_id, 'machine_id': i, 'speed': rand.randint(1, 4)} for i in range(3))
+            tasks.extend({'dataset_conf_id': ds_id, 'task_id': i, 'length': rand.randint(1, 20)} for i in range(10))
+        self.ds_prop = {'conf': pd.DataFrame({'id': [1, 2, 3, 4]}), 'machines': pd.DataFrame(machines),
+                        'tasks': pd.DataFrame(tasks), 'objectives': [{'name': 'makespan', 'weight': 1.0}],
+                        'algorithms': ['BMFLIS', 'MINMIN', 'MAXMIN', 'BMFMMS', 'M3FM2S'], 'ds_ids': ['all'],
+                        'iterations': 2}
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def run_experiments(self, processes, name):
+        running_time = os.path.join(self.dir, name + '_running_time.csv')
+        machines = os.path.join(self.dir, name + '_machines.csv')
+        runExperiments(self.ds_prop, running_time, machines, processes=processes)
+        return pd.read_csv(running_time), pd.read_csv(machines)
+
+    @staticmethod
+    def sort(df, cols):
+        return df[cols].sort_values(cols).reset_index(drop=True)
+
+    def test_should_serial_and_parallel_runs_give_the_same_results(self):
+        run_time_1, machines_1 = self.run_experiments(1, 'serial')
+        run_time_2, machines_2 = self.run_experiments(2, 'parallel')
+
+        self.assertEqual(4 * 5 * 2, len(run_time_1))
+        self.assertEqual(4 * 5 * 2 * 3, len(machines_1))
+        cols = ['algorithm', 'ds_id', 'iteration', 'max_makespan']
+        pd.testing.assert_frame_equal(self.sort(run_time_1, cols), self.sort(run_time_2, cols))
+        cols = ['algorithm', 'ds_id', 'iteration', 'machine_id', 'tasks', 'makespan']
+        pd.testing.assert_frame_equal(self.sort(machines_1, cols), self.sort(machines_2, cols))
+
+    def test_should_results_match_a_direct_run(self):
+        self.ds_prop['algorithms'] = ['MINMIN']
+        self.ds_prop['ds_ids'] = [3]
+        _, machines = self.run_experiments(2, 'direct')
+
+        problem = Schedule(self.ds_prop['objectives'], genMachines(3, self.ds_prop['machines']),
+                           genTasks(3, self.ds_prop['tasks']))
+        expected = MINMIN(problem).run(ds_id=3, iteration=0)['mach_res']
+
+        self.assertEqual([str([int(i) for i in m['tasks']]) for m in expected],
+                         list(machines[machines['iteration'] == 0]['tasks']))
+
+    def test_should_a_single_dataset_be_split_into_several_units_of_work(self):
+        self.ds_prop['algorithms'] = ['MINMIN']
+        self.ds_prop['ds_ids'] = [2]
+        self.ds_prop['iterations'] = 8
+        units = []
+
+        runExperiments(self.ds_prop, processes=2, callback=lambda res: units.append(res))
+
+        self.assertEqual(8, len(units))
+        self.assertEqual(list(range(8)), sorted(run['run_time']['iteration'] for res in units for run in res['runs']))
+        self.assertTrue(all(res['ds_id'] == 2 for res in units))
+
+    def test_should_split_iterations_into_contiguous_chunks(self):
+        self.assertEqual([[0, 1, 2], [3, 4], [5, 6]], splitIterations(list(range(7)), 3))
+        self.assertEqual([[0], [1]], splitIterations([0, 1], 5))
+        self.assertEqual([[0, 1, 2]], splitIterations([0, 1, 2], 1))
+
+    def test_should_results_be_appended_to_existing_files(self):
+        self.ds_prop['ds_ids'] = [1]
+        self.run_experiments(1, 'append')
+        run_time, _ = self.run_experiments(1, 'append')
+
+        self.assertEqual(2 * 5 * 2, len(run_time))
+
+
+if __name__ == '__main__':
+    unittest.main()
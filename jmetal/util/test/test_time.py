@@ -0,0 +1,161 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from typing import List
+
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII, AsynchronousNSGAII
+from jmetal.algorithm.multiobjective.smpso import SMPSO
+from jmetal.component.archive import CrowdingDistanceArchive
+from jmetal.component.density_estimator import CrowdingDistance
+from jmetal.core.solution import FloatSolution
+from jmetal.operator.crossover import SBX
+from jmetal.operator.mutation import Polynomial
+from jmetal.operator.selection import BinaryTournamentSelection
+from jmetal.problem.multiobjective.zdt import ZDT1
+from jmetal.util.ranking import FastNonDominatedRanking
+from jmetal.util.time import PhaseProfiler
+
+
+class PhaseProfilerTestCases(unittest.TestCase):
+
+    def create_nsgaii(self) -> NSGAII:
+        problem = ZDT1(10)
+        return NSGAII[FloatSolution, List[FloatSolution]](
+            problem=problem, population_size=20, max_evaluations=200,
+            mutation=Polynomial(1.0 / problem.number_of_variables, distribution_index=20),
+            crossover=SBX(1.0, distribution_index=20), selection=BinaryTournamentSelection())
+
+    def test_should_table_have_one_row_per_generation(self):
+        random.seed(1)
+        algorithm = self.create_nsgaii()
+
+        with PhaseProfiler(algorithm) as profiler:
+            algorithm.run()
+        table = profiler.table()
+
+        self.assertEqual(10, len(table))
+        self.assertEqual([20 * (i + 1) for i in range(10)], [row['evaluations'] for row in table])
+        self.assertEqual([20] * 10, [row['evaluated'] for row in table])
+        self.assertEqual(1, table[0]['create_initial_population_calls'])
+        self.assertEqual(0, table[0]['selection_calls'])
+        for row in table[1:]:
+            self.assertEqual(1, row['selection_calls'])
+            self.assertEqual(1, row['reproduction_calls'])
+            self.assertEqual(1, row['replacement_calls'])
+            self.assertGreater(row['replacement_time'], 0.0)
+
+    def test_should_detach_restore_the_methods(self):
+        algorithm = self.create_nsgaii()
+        compute_ranking = vars(FastNonDominatedRanking)['compute_ranking']
+
+        with PhaseProfiler(algorithm, components={'ranking': (FastNonDominatedRanking, 'compute_ranking')}):
+            self.assertIn('selection', vars(algorithm))
+            self.assertIsNot(compute_ranking, vars(FastNonDominatedRanking)['compute_ranking'])
+
+        self.assertNotIn('selection', vars(algorithm))
+        self.assertIs(compute_ranking, vars(FastNonDominatedRanking)['compute_ranking'])
+
+    def test_should_components_be_timed_inside_the_phases(self):
+        random.seed(1)
+        algorithm = self.create_nsgaii()
+        components = {'ranking': (FastNonDominatedRanking, 'compute_ranking'),
+                      'crowding': (CrowdingDistance, 'compute_density_estimator')}
+
+        with PhaseProfiler(algorithm, components=components) as profiler:
+            algorithm.run()
+        summary = {row['phase']: row for row in profiler.summary()}
+
+        self.assertEqual(9, summary['ranking']['calls'])
+        self.assertGreaterEqual(summary['crowding']['calls'], 9)
+        self.assertLessEqual(summary['ranking']['time'], summary['replacement']['time'])
+        self.assertEqual(sorted([row['time'] for row in profiler.summary()], reverse=True),
+                         [row['time'] for row in profiler.summary()])
+
+    def test_should_profile_the_phases_of_a_particle_swarm(self):
+        random.seed(1)
+        problem = ZDT1(5)
+        algorithm = SMPSO(problem=problem, swarm_size=10, max_evaluations=100,
+                          mutation=Polynomial(probability=1.0 / problem.number_of_variables),
+                          leaders=CrowdingDistanceArchive[FloatSolution](10))
+
+        with PhaseProfiler(algorithm) as profiler:
+            algorithm.run()
+        table = profiler.table()
+
+        self.assertEqual(10, len(table))
+        self.assertEqual(1, table[0]['initialize_velocity_calls'])
+        for row in table[1:]:
+            self.assertEqual(1, row['update_velocity_calls'])
+            self.assertEqual(1, row['update_position_calls'])
+            self.assertEqual(1, row['perturbation_calls'])
+            self.assertEqual(10, row['evaluated'])
+
+    def create_asynchronous_nsgaii(self) -> AsynchronousNSGAII:
+        problem = ZDT1(10)
+        return AsynchronousNSGAII[FloatSolution, List[FloatSolution]](
+            problem=problem, population_size=20, max_evaluations=400,
+            mutation=Polynomial(1.0 / problem.number_of_variables, distribution_index=20),
+            crossover=SBX(1.0, distribution_index=20), selection=BinaryTournamentSelection(), max_in_flight=2)
+
+    def test_should_steady_state_rows_hold_population_size_evaluations(self):
+        random.seed(1)
+        algorithm = self.create_asynchronous_nsgaii()
+
+        with PhaseProfiler(algorithm) as profiler:
+            algorithm.run()
+        table = profiler.table()
+
+        self.assertEqual(20, len(table))
+        self.assertEqual([20 * (i + 1) for i in range(20)], [row['evaluations'] for row in table])
+        self.assertEqual([20] * 20, [row['evaluated'] for row in table])
+        self.assertEqual([0] + [20] * 19, [row['submit_calls'] for row in table])
+        self.assertEqual([0] + [20] * 19, [row['replacement_calls'] for row in table])
+        self.assertNotIn('submit', vars(algorithm.evaluator))
+
+    def test_should_steady_state_be_read_from_the_algorithm(self):
+        algorithm = self.create_nsgaii()
+        profiler = PhaseProfiler(algorithm)
+        self.assertEqual(1, profiler.generation_size)
+        self.assertNotIn('submit', profiler.components)
+
+        algorithm.steady_state = True
+        profiler = PhaseProfiler(algorithm)
+        self.assertEqual(algorithm.population_size, profiler.generation_size)
+        self.assertEqual((algorithm.evaluator, 'submit'), profiler.components['submit'])
+
+    def test_should_detach_close_the_last_incomplete_row(self):
+        random.seed(1)
+        algorithm = self.create_asynchronous_nsgaii()
+
+        with PhaseProfiler(algorithm, generation_size=30) as profiler:
+            algorithm.run()
+        table = profiler.table()
+
+        self.assertEqual(1 + 13, len(table))
+        self.assertEqual([30] * 12 + [20], [row['evaluated'] for row in table[1:]])
+        self.assertEqual(400, table[-1]['evaluations'])
+
+    def test_should_to_csv_write_the_table(self):
+        random.seed(1)
+        algorithm = self.create_nsgaii()
+        directory = tempfile.mkdtemp()
+        try:
+            with PhaseProfiler(algorithm, phases=['selection', 'update_progress']) as profiler:
+                algorithm.run()
+            path = os.path.join(directory, 'phases.csv')
+            profiler.to_csv(path)
+
+            with open(path) as f:
+                lines = f.read().splitlines()
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertEqual('generation,evaluations,evaluated,selection_calls,selection_time,update_progress_calls,'
+                         'update_progress_time', lines[0])
+        self.assertEqual(9, len(lines) - 1)  # init_progress is not profiled, so there is no initialization row
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import logging
 import time
+from typing import List, Dict, Tuple
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -16,3 +17,159 @@ def get_time_of_execution(fn):
         return res
 
     return wrapped
+
+
+class PhaseProfiler:
+    """ Records the wall time and the number of calls of each phase (template method) of an algorithm, per
+    generation. Phases are timed by wrapping the methods of the algorithm instance while the profiler is attached, so
+    the main loops are not changed and profiling costs nothing when it is not used::
+
+        with PhaseProfiler(algorithm, components={'ranking': (FastNonDominatedRanking, 'compute_ranking')}):
+            algorithm.run()
+
+    `components` are other methods to time, given as (object or class, method name). A class method is wrapped for
+    all its instances until the profiler is detached. Times are inclusive: the time of a component (e.g. the ranking)
+    is also part of the time of the phase calling it (e.g. replacement). A row of the table is closed after the call
+    to `init_progress` (row 0, the initialization) and then every `generation_size` calls to `update_progress`, which
+    is one generation for generational algorithms. Steady-state algorithms (those with a true `steady_state`
+    attribute, e.g. :class:`AsynchronousNSGAII`) call `update_progress` once per evaluation, so their rows are closed
+    every `population_size` evaluations by default; their offspring are evaluated through `evaluator.submit`, which is
+    timed as the 'submit' phase and counted in the evaluated solutions. The last row is closed on detach if it is not
+    complete.
+    """
+
+    EVOLUTIONARY_PHASES = ['create_initial_population', 'evaluate_population', 'init_progress', 'selection',
+                           'reproduction', 'create_offspring', 'replacement', 'update_progress']
+    PSO_PHASES = ['create_initial_swarm', 'evaluate_swarm', 'initialize_velocity', 'initialize_particle_best',
+                  'initialize_global_best', 'init_progress', 'update_velocity', 'update_position', 'perturbation',
+                  'update_global_best', 'update_particle_best', 'update_progress']
+
+    def __init__(self, algorithm, phases: List[str] = None, components: Dict[str, Tuple[object, str]] = None,
+                 generation_size: int = None):
+        self.algorithm = algorithm
+        if phases is None:
+            phases = [phase for phase in self.EVOLUTIONARY_PHASES + self.PSO_PHASES if hasattr(algorithm, phase)]
+        self.phases = list(dict.fromkeys(phases))
+        self.components = dict(components or {})
+
+        steady_state = getattr(algorithm, 'steady_state', False)
+        if steady_state:
+            self.components.setdefault('submit', (algorithm.evaluator, 'submit'))
+        if generation_size is None:
+            generation_size = algorithm.population_size if steady_state else 1
+        if generation_size < 1:
+            raise Exception("The generation size is lower than one: " + str(generation_size))
+        self.generation_size = generation_size
+
+        self.rows = []
+        self._row = self._new_row()
+        self._progress_calls = 0
+        self._patches = []
+
+    def attach(self) -> None:
+        if self._patches:
+            return
+        for phase in self.phases:
+            self._patch(self.algorithm, phase, phase)
+        for name, (owner, method) in self.components.items():
+            self._patch(owner, method, name)
+
+    def detach(self) -> None:
+        if self._patches and self._row['phases']:
+            self._close_row()
+        for owner, method, original in reversed(self._patches):
+            if original is None:
+                delattr(owner, method)
+            else:
+                setattr(owner, method, original)
+        self._patches = []
+
+    def __enter__(self) -> 'PhaseProfiler':
+        self.attach()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.detach()
+
+    def table(self) -> List[dict]:
+        """ One row per generation with the evaluations so far, the number of solutions given to the evaluation
+        phases, and the calls and seconds of each phase and component """
+        names = self.phases + list(self.components)
+        rows = []
+        for generation, row in enumerate(self.rows):
+            values = {'generation': generation, 'evaluations': row['evaluations'], 'evaluated': row['evaluated']}
+            for name in names:
+                calls, seconds = row['phases'].get(name, (0, 0.0))
+                values[name + '_calls'] = calls
+                values[name + '_time'] = seconds
+            rows.append(values)
+
+        return rows
+
+    def to_frame(self):
+        """ Per-generation table as a pandas DataFrame """
+        import pandas as pd
+
+        return pd.DataFrame(self.table())
+
+    def to_csv(self, path: str) -> None:
+        self.to_frame().to_csv(path, index=False)
+
+    def summary(self) -> List[dict]:
+        """ Total calls and seconds of each phase and component over all the generations, slowest first """
+        totals = {}
+        for row in self.rows:
+            for name, (calls, seconds) in row['phases'].items():
+                total = totals.setdefault(name, [0, 0.0])
+                total[0] += calls
+                total[1] += seconds
+
+        return [{'phase': name, 'calls': calls, 'time': seconds}
+                for name, (calls, seconds) in sorted(totals.items(), key=lambda item: -item[1][1])]
+
+    def _new_row(self) -> dict:
+        return {'evaluations': 0, 'evaluated': 0, 'phases': {}}
+
+    def _patch(self, owner, method: str, name: str) -> None:
+        # The previous value of the attribute in the object (or class) dictionary, restored on detach. It is None for
+        # methods of an instance, which are found in its class and only shadowed by the wrapper
+        original = vars(owner).get(method)
+        if isinstance(owner, type):
+            if original is None:
+                raise Exception("The class " + owner.__name__ + " does not define the method " + method)
+            function = original
+        else:
+            function = getattr(owner, method)
+        counts_evaluations = method.startswith('evaluate_')
+        counts_submission = method == 'submit'
+        closes_row = owner is self.algorithm and method == 'init_progress'
+        counts_progress = owner is self.algorithm and method == 'update_progress'
+
+        def wrapped(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._record(name, time.perf_counter() - start)
+                if counts_evaluations and args:
+                    self._row['evaluated'] += len(args[0])
+                if counts_submission:
+                    self._row['evaluated'] += 1
+                if closes_row:
+                    self._close_row()
+                if counts_progress:
+                    self._progress_calls += 1
+                    if self._progress_calls % self.generation_size == 0:
+                        self._close_row()
+
+        setattr(owner, method, wrapped)
+        self._patches.append((owner, method, original))
+
+    def _record(self, name: str, seconds: float) -> None:
+        calls, total = self._row['phases'].get(name, (0, 0.0))
+        self._row['phases'][name] = (calls + 1, total + seconds)
+
+    def _close_row(self) -> None:
+        self._row['evaluations'] = self.algorithm.evaluations
+        self.rows.append(self._row)
+        self._row = self._new_row()
@@ -20,5 +20,5 @@ setup(name='jmetalpy',
 
           'Programming Language :: Python :: 3.6'],
 
-      packages=find_packages(exclude=['test_']),
+      packages=find_packages(exclude=['test_', 'benchmarks', 'benchmarks.*']),
       )